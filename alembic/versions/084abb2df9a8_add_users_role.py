@@ -0,0 +1,34 @@
+"""add users.role
+
+Revision ID: 084abb2df9a8
+Revises: 9277734dbc7e
+Create Date: 2026-10-19 15:20:13.094417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '084abb2df9a8'
+down_revision = '9277734dbc7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('role', sa.String(), server_default='user', nullable=False))
+
+    # authorizations JSONB 의 role 을 컬럼으로 옮긴다
+    op.execute(
+        """
+        UPDATE users
+        SET role = authorizations->>'role'
+        WHERE authorizations ? 'role' AND authorizations->>'role' IS NOT NULL
+        """
+    )
+    op.create_index('ix_users_role_created_at', 'users', ['role', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_created_at', table_name='users')
+    op.drop_column('users', 'role')
@@ -0,0 +1,32 @@
+"""add attendance_archives
+
+Revision ID: 1b799cf24e9c
+Revises: cb1cb7710325
+Create Date: 2026-10-19 17:02:41.775203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '1b799cf24e9c'
+down_revision = 'cb1cb7710325'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 세션당 한 행 - 출석 행들은 rows JSONB 배열로 TOAST 압축되어 저장된다
+    op.create_table(
+        'attendance_archives',
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('sessions.id'), nullable=False),
+        sa.Column('rows', postgresql.JSONB(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('session_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('attendance_archives')
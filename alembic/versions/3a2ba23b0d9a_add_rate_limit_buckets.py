@@ -0,0 +1,31 @@
+"""add rate_limit_buckets
+
+Revision ID: 3a2ba23b0d9a
+Revises: a9aa189ed82e
+Create Date: 2026-10-19 14:02:47.518233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3a2ba23b0d9a'
+down_revision = 'a9aa189ed82e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 토큰 버킷은 유실돼도 되는 상태라 WAL 을 쓰지 않는 UNLOGGED 테이블로 만든다
+    op.create_table(
+        'rate_limit_buckets',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+        prefixes=['UNLOGGED'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rate_limit_buckets')
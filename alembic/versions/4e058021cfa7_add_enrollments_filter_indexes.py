@@ -0,0 +1,32 @@
+"""add enrollments (user_id, created_at) and (session_id, created_at) indexes
+
+Revision ID: 4e058021cfa7
+Revises: d7bfcd87969e
+Create Date: 2026-10-19 20:11:26.742905
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4e058021cfa7'
+down_revision = 'd7bfcd87969e'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'ix_enrollments_user_id_created_at': ['user_id', 'created_at'],
+    'ix_enrollments_session_id_created_at': ['session_id', 'created_at'],
+}
+
+
+def upgrade() -> None:
+    # 수강 검색의 사용자/세션 필터용 - 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY 로 만든다
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(name, 'enrollments', columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(name, table_name='enrollments', postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""add idempotency_keys
+
+Revision ID: a324a36982be
+Revises: 1b799cf24e9c
+Create Date: 2026-10-19 17:41:12.204387
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a324a36982be'
+down_revision = '1b799cf24e9c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 저장된 응답은 expires_at 이후 덮어쓰거나 주기적으로 지운다
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('fingerprint', sa.String(), nullable=False),
+        sa.Column('status_code', sa.Integer()),
+        sa.Column('content_type', sa.String()),
+        sa.Column('body', sa.LargeBinary()),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index('ix_idempotency_keys_expires_at', 'idempotency_keys', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_idempotency_keys_expires_at', table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,45 @@
+"""add attendance_rollups
+
+Revision ID: a9aa189ed82e
+Revises: 
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'a9aa189ed82e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'attendance_rollups',
+        sa.Column('lecture_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('lectures.id'), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('sessions.id'), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('lecture_id', 'status'),
+    )
+    op.create_index('ix_attendance_rollups_session_id', 'attendance_rollups', ['session_id'])
+
+    # 기존 출석 데이터로 초기 집계
+    op.execute(
+        """
+        INSERT INTO attendance_rollups (lecture_id, session_id, status, count)
+        SELECT a.lecture_id, l.session_id, a.status, count(a.id)
+        FROM attendances a
+        JOIN lectures l ON l.id = a.lecture_id
+        GROUP BY a.lecture_id, l.session_id, a.status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendance_rollups_session_id', table_name='attendance_rollups')
+    op.drop_table('attendance_rollups')
@@ -0,0 +1,29 @@
+"""add sessions begin_date/end_date indexes
+
+Revision ID: bf8578be7818
+Revises: a324a36982be
+Create Date: 2026-10-19 18:10:27.551932
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'bf8578be7818'
+down_revision = 'a324a36982be'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ['begin_date', 'end_date']
+
+
+def upgrade() -> None:
+    # course_status 필터용 - 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY 로 만든다
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.create_index(f'ix_sessions_{column}', 'sessions', [column], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.drop_index(f'ix_sessions_{column}', table_name='sessions', postgresql_concurrently=True)
@@ -0,0 +1,36 @@
+"""add partial indexes on active rows
+
+Revision ID: c3d9c86cbeb0
+Revises: 084abb2df9a8
+Create Date: 2026-10-19 15:51:38.662710
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3d9c86cbeb0'
+down_revision = '084abb2df9a8'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'courses', 'sessions', 'enrollments']
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블을 잠그지 않도록 트랜잭션 밖에서 CONCURRENTLY 로 만든다
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f'ix_{table}_active_created_at',
+                table,
+                [sa.text('created_at DESC')],
+                postgresql_where=sa.text('is_active'),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(f'ix_{table}_active_created_at', table_name=table, postgresql_concurrently=True)
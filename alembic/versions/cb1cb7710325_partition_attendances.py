@@ -0,0 +1,92 @@
+"""partition attendances by created_at
+
+Revision ID: cb1cb7710325
+Revises: c3d9c86cbeb0
+Create Date: 2026-10-19 16:24:05.318842
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'cb1cb7710325'
+down_revision = 'c3d9c86cbeb0'
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    'id, lecture_id, user_id, status, detail_type, description, assignment_id, '
+    'created_at, created_by, updated_at, updated_by'
+)
+# 기존 데이터 이후로 미리 만들어 둘 월 파티션 수 (이후는 app.commands.create_attendance_partitions)
+MONTHS_AHEAD = 3
+
+
+def _columns():
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('lecture_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('lectures.id'), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('detail_type', sa.String()),
+        sa.Column('description', sa.Text()),
+        sa.Column('assignment_id', sa.String()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_by', postgresql.UUID(as_uuid=True), nullable=False),
+    ]
+
+
+def _months(first: date, last: date):
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        lower = date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield lower, date(year, month, 1)
+
+
+def upgrade() -> None:
+    # 기존 힙 테이블을 옮겨 두고 같은 이름의 파티션 테이블로 교체한다 (PK 인덱스 이름도 비켜 준다)
+    op.rename_table('attendances', 'attendances_unpartitioned')
+    op.execute('ALTER INDEX attendances_pkey RENAME TO attendances_unpartitioned_pkey')
+
+    op.create_table(
+        'attendances',
+        *_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.create_index('ix_attendances_id', 'attendances', ['id'])
+    op.create_index('ix_attendances_lecture_id_user_id', 'attendances', ['lecture_id', 'user_id'])
+    op.create_index('ix_attendances_user_id', 'attendances', ['user_id'])
+    op.execute('CREATE TABLE attendances_default PARTITION OF attendances DEFAULT')
+
+    first, last = op.get_bind().execute(sa.text(
+        """
+        SELECT (date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC'))::date,
+               (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => :ahead))::date
+        FROM attendances_unpartitioned
+        """
+    ), {'ahead': MONTHS_AHEAD}).one()
+    for lower, upper in _months(first, last):
+        op.execute(
+            f"CREATE TABLE attendances_{lower:%Y_%m} PARTITION OF attendances "
+            f"FOR VALUES FROM ('{lower.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+
+    op.execute(f'INSERT INTO attendances ({COLUMNS}) SELECT {COLUMNS} FROM attendances_unpartitioned')
+    op.drop_table('attendances_unpartitioned')
+
+
+def downgrade() -> None:
+    op.rename_table('attendances', 'attendances_partitioned')
+    op.execute('ALTER INDEX attendances_pkey RENAME TO attendances_partitioned_pkey')
+
+    op.create_table('attendances', *_columns(), sa.PrimaryKeyConstraint('id'))
+    op.execute(f'INSERT INTO attendances ({COLUMNS}) SELECT {COLUMNS} FROM attendances_partitioned')
+    # 파티션(attendances_YYYY_MM, attendances_default)은 부모와 함께 삭제된다
+    op.drop_table('attendances_partitioned')
@@ -0,0 +1,49 @@
+"""add unique (session_id, sequence) constraint to lectures
+
+Revision ID: d7bfcd87969e
+Revises: d8df8ff363c9
+Create Date: 2026-10-19 19:32:41.508217
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd7bfcd87969e'
+down_revision = 'd8df8ff363c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # sequence 가 겹치는 세션은 (sequence, lecture_date, created_at) 순으로 1 부터 다시 매긴다
+    op.execute(
+        """
+        UPDATE lectures SET sequence = ranked.position
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY session_id ORDER BY sequence, lecture_date NULLS LAST, created_at, id
+            ) AS position
+            FROM lectures
+            WHERE session_id IN (SELECT session_id FROM lectures GROUP BY session_id, sequence HAVING count(*) > 1)
+        ) AS ranked
+        WHERE lectures.id = ranked.id AND lectures.sequence <> ranked.position
+        """
+    )
+    # 인덱스는 CONCURRENTLY 로 만들고 제약조건으로 붙인다 (DEFERRABLE - 한 문장 안의 순서 바꾸기 허용)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_lectures_session_id_sequence',
+            'lectures',
+            ['session_id', 'sequence'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        'ALTER TABLE lectures ADD CONSTRAINT uq_lectures_session_id_sequence '
+        'UNIQUE USING INDEX uq_lectures_session_id_sequence DEFERRABLE'
+    )
+
+
+def downgrade() -> None:
+    # 제약조건과 함께 인덱스도 삭제된다
+    op.drop_constraint('uq_lectures_session_id_sequence', 'lectures', type_='unique')
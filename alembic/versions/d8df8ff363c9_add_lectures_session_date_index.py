@@ -0,0 +1,30 @@
+"""add lectures (session_id, lecture_date) index
+
+Revision ID: d8df8ff363c9
+Revises: bf8578be7818
+Create Date: 2026-10-19 18:47:53.120664
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd8df8ff363c9'
+down_revision = 'bf8578be7818'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 캘린더 조회용 - 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY 로 만든다
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_lectures_session_id_lecture_date',
+            'lectures',
+            ['session_id', 'lecture_date'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_lectures_session_id_lecture_date', table_name='lectures', postgresql_concurrently=True)
@@ -0,0 +1,26 @@
+"""add idempotency_keys.locked_until
+
+Revision ID: efac3ab167c2
+Revises: 4e058021cfa7
+Create Date: 2026-10-19 21:03:17.590214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'efac3ab167c2'
+down_revision = '4e058021cfa7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 처리 중인 행의 짧은 임대 - 지나면 재시도가 키를 다시 가져간다
+    op.add_column('idempotency_keys', sa.Column('locked_until', sa.DateTime(timezone=True)))
+    # 이미 처리 중으로 남아 있는 행도 24시간 대신 임대 시간 뒤에 풀리도록 한다
+    op.execute("UPDATE idempotency_keys SET locked_until = now() + interval '30 seconds' WHERE status_code IS NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_keys', 'locked_until')
@@ -1,13 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
+from ..config import settings
 from ..database import get_db
 from ..models.user import User
-from ..schemas.attendance import AttendanceCreate, AttendanceUpdate, AttendanceResponse
+from ..schemas.attendance import (
+    AttendanceCreate, AttendanceUpdate, AttendanceResponse, AttendanceListResponse, CheckInRequest, CheckInCodeResponse
+)
 from ..crud.attendance import AttendanceCRUD
-from ..utils.auth import get_current_user
+from ..crud.lecture import LectureCRUD
+from ..crud.enroll import EnrollCRUD
+from ..utils.auth import TokenUser, get_current_user, get_token_user, require_admin
+from ..utils.checkin import create_checkin_code, verify_checkin_code
+from ..utils.fields import field_selector, render_fields
+from ..utils.rate_limit import enforce_rate_limit
 
 router = APIRouter(prefix="/api/attendances", tags=["attendances"])
 
@@ -20,23 +30,94 @@ async def create_attendance(
 ):
     return AttendanceCRUD.create_attendance(db, lecture_id, attendance, current_user)
 
-@router.get("/lectures/{lecture_id}/attendances", response_model=List[AttendanceResponse])
+@router.get("/lectures/{lecture_id}/check-in-code", response_model=CheckInCodeResponse)
+async def get_check_in_code(
+        lecture_id: UUID,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(require_admin)
+):
+    if not LectureCRUD.get_lecture(db, lecture_id, fields=["id"]):
+        raise HTTPException(status_code=404, detail="Lecture not found")
+    code, expires_at = create_checkin_code(lecture_id)
+    return CheckInCodeResponse(lecture_id=lecture_id, code=code, expires_at=expires_at)
+
+@router.post("/lectures/{lecture_id}/check-in", response_model=AttendanceResponse)
+async def check_in(
+        lecture_id: UUID,
+        check_in_request: CheckInRequest,
+        request: Request,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(get_token_user)
+):
+    # 6자리 코드를 대입해 보지 못하도록 사용자+강의별 시도 횟수를 먼저 제한한다
+    await enforce_rate_limit(
+        request, [f"checkin:{current_user.id}:{lecture_id}"], settings.rate_limit_checkin_per_minute
+    )
+    if not EnrollCRUD.is_enrolled_in_lecture(db, current_user.id, lecture_id):
+        raise HTTPException(status_code=403, detail="Not enrolled in this lecture's session")
+    if not verify_checkin_code(lecture_id, check_in_request.code):
+        raise HTTPException(status_code=400, detail="Invalid or expired check-in code")
+
+    # 같은 순간의 다른 출석 요청들과 한 번의 INSERT/커밋으로 묶여 기록된다
+    attendance = await request.app.state.checkin_batcher.submit({
+        "lecture_id": lecture_id,
+        "user_id": current_user.id,
+        "status": "present",
+        "detail_type": "self",
+        "created_by": current_user.id,
+    })
+    if attendance is None:
+        raise HTTPException(status_code=409, detail="Already checked in")
+    return attendance
+
+@router.get("/lectures/{lecture_id}/attendances", response_model=List[AttendanceListResponse])
 async def get_attendances_by_lecture(
         lecture_id: UUID,
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        created_from: Optional[datetime] = Query(None, description="Only attendances created at or after this time"),
+        created_to: Optional[datetime] = Query(None, description="Only attendances created before this time"),
+        fields: Optional[List[str]] = Depends(field_selector(AttendanceResponse, AttendanceListResponse)),
         db: Session = Depends(get_db)
 ):
-    return AttendanceCRUD.get_attendances_by_lecture(db, lecture_id, skip=skip, limit=limit)
+    attendances = AttendanceCRUD.get_attendances_by_lecture(
+        db, lecture_id, skip=skip, limit=limit, fields=fields, created_from=created_from, created_to=created_to
+    )
+    return render_fields(attendances, fields)
+
+@router.get("/lectures/{lecture_id}/stream")
+async def stream_attendances(
+        lecture_id: UUID,
+        request: Request
+):
+    """출석 변경 행만 보내는 SSE 스트림 (목록 폴링 대체)"""
+    if not settings.live_updates_enabled:
+        raise HTTPException(status_code=503, detail="Live updates unavailable")
+    broadcaster = request.app.state.attendance_broadcaster
+    try:
+        await broadcaster.listen()
+    except Exception:
+        raise HTTPException(status_code=503, detail="Live updates unavailable")
+    return StreamingResponse(
+        broadcaster.stream(lecture_id, settings.live_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-@router.get("/sessions/{session_id}/attendances", response_model=List[AttendanceResponse])
+@router.get("/sessions/{session_id}/attendances", response_model=List[AttendanceListResponse])
 async def get_attendances_by_session(
         session_id: UUID,
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        created_from: Optional[datetime] = Query(None, description="Only attendances created at or after this time"),
+        created_to: Optional[datetime] = Query(None, description="Only attendances created before this time"),
+        fields: Optional[List[str]] = Depends(field_selector(AttendanceResponse, AttendanceListResponse)),
         db: Session = Depends(get_db)
 ):
-    return AttendanceCRUD.get_attendances_by_session(db, session_id, skip=skip, limit=limit)
+    attendances = AttendanceCRUD.get_attendances_by_session(
+        db, session_id, skip=skip, limit=limit, fields=fields, created_from=created_from, created_to=created_to
+    )
+    return render_fields(attendances, fields)
 
 @router.get("/{attendance_id}", response_model=AttendanceResponse)
 async def get_attendance(
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import RedirectResponse
-from fastapi.security import HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 import httpx
 from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
 
 from ..database import get_db
 from ..models.user import User
@@ -11,11 +13,16 @@ from ..schemas.user import (
     UserCreate, UserResponse, KakaoLoginRequest, KakaoLoginResponse,
     GeneralLoginRequest, GeneralLoginResponse, GeneralRegisterRequest,
     GeneralRegisterResponse, KakaoRegisterRequest, KakaoRegisterResponse,
-    UsernameCheckResponse, ManualRegisterRequest, ManualRegisterResponse
+    UsernameCheckResponse, ManualRegisterRequest, ManualRegisterResponse,
+    TokenRefreshRequest, TokenRefreshResponse
 )
 from ..crud.user import UserCRUD
-from ..utils.auth import get_current_user, hash_password, verify_password, get_temp_user, require_admin
-from ..utils.security import create_access_token
+from ..utils.auth import (
+    TokenUser, get_current_user, hash_password, verify_password, get_temp_user, require_admin, create_user_tokens
+)
+from ..utils.rate_limit import rate_limit
+from ..utils.revocation import revoked_tokens, token_expiry
+from ..utils.security import create_access_token, verify_token
 from ..config import settings
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -32,7 +39,7 @@ async def kakao_login():
     return RedirectResponse(url=kakao_auth_url, status_code=302)
 
 
-@router.post("/kakao/login", response_model=KakaoLoginResponse)
+@router.post("/kakao/login", response_model=KakaoLoginResponse, dependencies=[Depends(rate_limit("kakao_login"))])
 async def kakao_login(request: KakaoLoginRequest, db: Session = Depends(get_db)):
     async with httpx.AsyncClient() as client:
         token_response = await client.post(
@@ -71,10 +78,10 @@ async def kakao_login(request: KakaoLoginRequest, db: Session = Depends(get_db))
             existing_user.last_login = datetime.utcnow()
             db.commit()
 
-            jwt_token = create_access_token(data={"sub": str(existing_user.id)})
+            tokens = create_user_tokens(existing_user)
 
             return {
-                "token": jwt_token,
+                **tokens,
                 "user": {
                     "id": str(existing_user.id),
                     "username": existing_user.username,
@@ -106,7 +113,7 @@ async def kakao_login(request: KakaoLoginRequest, db: Session = Depends(get_db))
             }
 
 
-@router.post("/login", response_model=GeneralLoginResponse)
+@router.post("/login", response_model=GeneralLoginResponse, dependencies=[Depends(rate_limit("login"))])
 async def general_login(request: GeneralLoginRequest, db: Session = Depends(get_db)):
     user = UserCRUD.get_user_by_username(db, request.username)
 
@@ -119,10 +126,10 @@ async def general_login(request: GeneralLoginRequest, db: Session = Depends(get_
     user.last_login = datetime.utcnow()
     db.commit()
 
-    jwt_token = create_access_token(data={"sub": str(user.id)})
+    tokens = create_user_tokens(user)
 
     return {
-        "token": jwt_token,
+        **tokens,
         "user": {
             "id": str(user.id),
             "username": user.username,
@@ -132,7 +139,7 @@ async def general_login(request: GeneralLoginRequest, db: Session = Depends(get_
     }
 
 
-@router.post("/register", response_model=GeneralRegisterResponse)
+@router.post("/register", response_model=GeneralRegisterResponse, dependencies=[Depends(rate_limit("register"))])
 async def general_register(request: GeneralRegisterRequest, db: Session = Depends(get_db)):
     # 사용자명 중복 확인
     existing_user = UserCRUD.get_user_by_username(db, request.username)
@@ -153,10 +160,10 @@ async def general_register(request: GeneralRegisterRequest, db: Session = Depend
 
     user = UserCRUD.create_user(db, user_create)
 
-    jwt_token = create_access_token(data={"sub": str(user.id)})
+    tokens = create_user_tokens(user)
 
     return {
-        "token": jwt_token,
+        **tokens,
         "user": {
             "id": str(user.id),
             "username": user.username,
@@ -190,10 +197,10 @@ async def kakao_register(request: KakaoRegisterRequest, kakao_user: dict = Depen
 
     user = UserCRUD.create_user(db, user_create)
 
-    jwt_token = create_access_token(data={"sub": str(user.id)})
+    tokens = create_user_tokens(user)
 
     return {
-        "token": jwt_token,
+        **tokens,
         "user": {
             "id": str(user.id),
             "username": user.username,
@@ -223,7 +230,7 @@ async def check_username(username: str = Query(...), db: Session = Depends(get_d
 async def manual_register(
         request: ManualRegisterRequest,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     # 사용자명 중복 확인
     existing_user = UserCRUD.get_user_by_username(db, request.username)
@@ -252,8 +259,38 @@ async def manual_register(
     }
 
 
+@router.post("/refresh", response_model=TokenRefreshResponse)
+def refresh_token(request: TokenRefreshRequest, db: Session = Depends(get_db)):
+    payload = verify_token(request.refresh_token)
+    # 메모리 목록은 빠른 사전 확인일 뿐이고, 실제 일회용 판정은 아래 claim 이 한다
+    if payload is None or payload.get("type") != "refresh" or not payload.get("jti") \
+            or revoked_tokens.is_revoked(db, payload["jti"]):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    # 역할/활성 상태는 재발급 시점의 DB 값으로 다시 싣는다
+    user = UserCRUD.get_user(db, UUID(payload["sub"]))
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    # refresh 토큰은 한 번만 쓸 수 있도록 교체한다 - jti 를 먼저 차지한 요청만 새 토큰을 받는다
+    # (다른 워커나 동시 요청의 재사용은 INSERT ... ON CONFLICT DO NOTHING 이 막는다)
+    if not revoked_tokens.claim(db, payload["jti"], token_expiry(payload)):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    return create_user_tokens(user)
+
+
 @router.post("/logout")
-async def logout():
+def logout(
+        request: Optional[TokenRefreshRequest] = None,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+        db: Session = Depends(get_db)
+):
+    # 전달된 access/refresh 토큰을 만료 전까지 폐기
+    tokens = [credentials.credentials if credentials else None, request.refresh_token if request else None]
+    for token in tokens:
+        payload = verify_token(token) if token else None
+        if payload and payload.get("jti"):
+            revoked_tokens.revoke(db, payload["jti"], token_expiry(payload))
     return {"message": "Successfully logged out"}
 
 
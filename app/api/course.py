@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
-from ..models.user import User
-from ..schemas.course import CourseCreate, CourseUpdate, CourseResponse, CourseInfoResponse
+from ..schemas.course import CourseCreate, CourseUpdate, CourseResponse, CourseInfoResponse, CourseInfoListResponse
+from ..schemas.batch import BatchIdsRequest, BatchResponse
+from ..schemas.clone import CourseCloneRequest, CloneResponse
 from ..crud.course import CourseCRUD
-from ..utils.auth import get_current_user, require_admin
+from ..crud.clone import CloneCRUD
+from ..utils.auth import TokenUser, get_current_user, require_admin
+from ..utils.calendar import calendar_cache
+from ..utils.fields import field_selector, render_fields
 
 router = APIRouter(prefix="/api/courses", tags=["courses"])
 
@@ -15,36 +19,63 @@ router = APIRouter(prefix="/api/courses", tags=["courses"])
 async def create_course(
         course: CourseCreate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     return CourseCRUD.create_course(db, course, current_user)
 
-@router.get("", response_model=List[CourseInfoResponse])
+@router.get("", response_model=List[CourseInfoListResponse])
 async def get_courses(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
+        fields: Optional[List[str]] = Depends(field_selector(CourseInfoResponse, CourseInfoListResponse)),
         db: Session = Depends(get_db)
 ):
-    return CourseCRUD.get_courses(db, skip=skip, limit=limit)
+    courses = CourseCRUD.get_courses(db, skip=skip, limit=limit, fields=fields, include_inactive=include_inactive)
+    return render_fields(courses, fields)
+
+@router.post("/batch", response_model=BatchResponse[CourseResponse])
+async def get_courses_batch(
+        request: BatchIdsRequest,
+        db: Session = Depends(get_db)
+):
+    courses, missing = CourseCRUD.get_courses_by_ids(db, request.ids)
+    return {"items": courses, "missing": missing}
+
+@router.post("/{course_id}/clone", response_model=CloneResponse)
+async def clone_course(
+        course_id: UUID,
+        request: CourseCloneRequest,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(require_admin)
+):
+    """과정을 세션, 강의와 함께 복사 (shift_days 만큼 날짜 이동, 수강/출석은 복사하지 않음)"""
+    cloned = CloneCRUD.clone_course(db, course_id, request, current_user)
+    if not cloned:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return cloned
 
 @router.get("/{course_id}", response_model=CourseResponse)
 async def get_course(
         course_id: UUID,
+        fields: Optional[List[str]] = Depends(field_selector(CourseResponse)),
         db: Session = Depends(get_db)
 ):
-    course = CourseCRUD.get_course(db, course_id)
+    course = CourseCRUD.get_course(db, course_id, fields=fields)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
-    return course
+    return render_fields(course, fields)
 
 @router.put("/{course_id}", response_model=CourseResponse)
 async def update_course(
         course_id: UUID,
         course_update: CourseUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     course = CourseCRUD.update_course(db, course_id, course_update, current_user)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
+    # 캘린더 이벤트에 과정 제목이 들어 있다
+    calendar_cache.invalidate()
     return course
\ No newline at end of file
@@ -1,13 +1,14 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
-from ..models.user import User
-from ..schemas.enroll import EnrollCreate, EnrollUpdate, EnrollResponse, EnrollDetailResponse
+from ..schemas.enroll import EnrollCreate, EnrollUpdate, EnrollResponse, EnrollDetailResponse, EnrollSearchResponse
 from ..crud.enroll import EnrollCRUD
-from ..utils.auth import get_current_user, require_admin
+from ..utils.auth import TokenUser, get_current_user, require_admin
+from ..utils.calendar import calendar_cache
 
 router = APIRouter(prefix="/api/enrolls", tags=["enrolls"])
 
@@ -15,49 +16,75 @@ router = APIRouter(prefix="/api/enrolls", tags=["enrolls"])
 async def create_enroll(
     enroll: EnrollCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: TokenUser = Depends(require_admin)
 ):
     try:
-        return EnrollCRUD.create_enroll(db, enroll, current_user)
+        db_enroll = EnrollCRUD.create_enroll(db, enroll, current_user)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    calendar_cache.invalidate(db_enroll.user_id)
+    return db_enroll
 
 @router.get("/", response_model=List[EnrollDetailResponse])
 async def get_enrolls(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
     db: Session = Depends(get_db)
 ):
-    return EnrollCRUD.get_enrolls_with_details(db, skip=skip, limit=limit)
+    return EnrollCRUD.get_enrolls_with_details(db, skip=skip, limit=limit, include_inactive=include_inactive)
+
+@router.get("/search", response_model=EnrollSearchResponse)
+async def search_enrolls(
+    user_id: Optional[UUID] = Query(None),
+    session_id: Optional[UUID] = Query(None),
+    course_id: Optional[UUID] = Query(None),
+    enroll_status: Optional[str] = Query(None),
+    created_from: Optional[datetime] = Query(None, description="Only enrollments created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only enrollments created before this time"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
+    db: Session = Depends(get_db)
+):
+    """필터를 자유롭게 조합한 수강 목록과 전체 건수 (같은 쿼리의 count(*) OVER ())"""
+    items, total = EnrollCRUD.search_enrolls(
+        db, user_id=user_id, session_id=session_id, course_id=course_id, enroll_status=enroll_status,
+        created_from=created_from, created_to=created_to, skip=skip, limit=limit, include_inactive=include_inactive
+    )
+    return {"items": items, "total": total}
 
 @router.get("/users/{user_id}/enrolls", response_model=List[EnrollDetailResponse])
 async def get_enrolls_by_user(
     user_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
     db: Session = Depends(get_db)
 ):
-    return EnrollCRUD.get_enrolls_by_user(db, user_id, skip=skip, limit=limit)
+    return EnrollCRUD.get_enrolls_by_user(db, user_id, skip=skip, limit=limit, include_inactive=include_inactive)
 
 @router.get("/sessions/{session_id}/enrolls", response_model=List[EnrollDetailResponse])
 async def get_enrolls_by_session(
     session_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
     db: Session = Depends(get_db)
 ):
-    return EnrollCRUD.get_enrolls_by_session(db, session_id, skip=skip, limit=limit)
+    return EnrollCRUD.get_enrolls_by_session(db, session_id, skip=skip, limit=limit, include_inactive=include_inactive)
 
 @router.put("/{enroll_id}", response_model=EnrollResponse)
 async def update_enroll(
     enroll_id: UUID,
     enroll_update: EnrollUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: TokenUser = Depends(require_admin)
 ):
     enroll = EnrollCRUD.update_enroll(db, enroll_id, enroll_update, current_user)
     if not enroll:
         raise HTTPException(status_code=404, detail="Enrollment not found")
+    calendar_cache.invalidate(enroll.user_id)
     return enroll
 
 @router.get("/users/{user_id}/sessions/{session_id}", response_model=EnrollResponse)
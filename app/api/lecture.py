@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
-from ..models.user import User
-from ..schemas.lecture import LectureCreate, LectureUpdate, LectureResponse
+from ..schemas.lecture import LectureCreate, LectureUpdate, LectureResponse, LectureScheduleCreate, LectureReorderRequest
+from ..schemas.batch import BatchIdsRequest, BatchResponse
 from ..crud.lecture import LectureCRUD
-from ..utils.auth import get_current_user, require_admin
+from ..utils.auth import TokenUser, get_current_user, require_admin
+from ..utils.calendar import calendar_cache
+from ..utils.fields import field_selector, render_fields
 
 router = APIRouter(prefix="/api/lectures", tags=["lectures"])
 
@@ -15,56 +17,110 @@ router = APIRouter(prefix="/api/lectures", tags=["lectures"])
 async def create_lecture(
         lecture: LectureCreate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
-    return LectureCRUD.create_lecture(db, lecture, current_user)
+    try:
+        db_lecture = LectureCRUD.create_lecture(db, lecture, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    calendar_cache.invalidate()
+    return db_lecture
+
+@router.post("/schedule", response_model=List[LectureResponse])
+async def create_lecture_schedule(
+        schedule: LectureScheduleCreate,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(require_admin)
+):
+    """반복 규칙(시작일, 요일, 개수, 제목 템플릿)으로 세션의 강의들을 한 번에 생성"""
+    try:
+        lectures = LectureCRUD.create_schedule(db, schedule, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not lectures:
+        raise HTTPException(status_code=404, detail="Session not found")
+    calendar_cache.invalidate()
+    return lectures
 
 @router.get("", response_model=List[LectureResponse])
 async def get_lectures(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        fields: Optional[List[str]] = Depends(field_selector(LectureResponse)),
         db: Session = Depends(get_db)
 ):
-    return LectureCRUD.get_lectures(db, skip=skip, limit=limit)
+    return render_fields(LectureCRUD.get_lectures(db, skip=skip, limit=limit, fields=fields), fields)
 
 @router.get("/session/{session_id}", response_model=List[LectureResponse])
 async def get_lectures_by_session(
         session_id: UUID,
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        fields: Optional[List[str]] = Depends(field_selector(LectureResponse)),
         db: Session = Depends(get_db)
 ):
-    return LectureCRUD.get_lectures_by_session(db, session_id, skip=skip, limit=limit)
+    return render_fields(LectureCRUD.get_lectures_by_session(db, session_id, skip=skip, limit=limit, fields=fields), fields)
+
+@router.put("/session/{session_id}/order", response_model=List[LectureResponse])
+async def reorder_lectures(
+        session_id: UUID,
+        request: LectureReorderRequest,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(require_admin)
+):
+    """세션의 강의 순서를 한 번에 바꾼다 (lecture_ids 는 세션의 모든 강의를 새 순서대로)"""
+    try:
+        lectures = LectureCRUD.reorder_lectures(db, session_id, request.lecture_ids, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if lectures is None:
+        raise HTTPException(status_code=404, detail="Session has no lectures")
+    calendar_cache.invalidate()
+    return lectures
+
+@router.post("/batch", response_model=BatchResponse[LectureResponse])
+async def get_lectures_batch(
+        request: BatchIdsRequest,
+        db: Session = Depends(get_db)
+):
+    lectures, missing = LectureCRUD.get_lectures_by_ids(db, request.ids)
+    return {"items": lectures, "missing": missing}
 
 @router.get("/{lecture_id}", response_model=LectureResponse)
 async def get_lecture(
         lecture_id: UUID,
+        fields: Optional[List[str]] = Depends(field_selector(LectureResponse)),
         db: Session = Depends(get_db)
 ):
-    lecture = LectureCRUD.get_lecture(db, lecture_id)
+    lecture = LectureCRUD.get_lecture(db, lecture_id, fields=fields)
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
-    return lecture
+    return render_fields(lecture, fields)
 
 @router.put("/{lecture_id}", response_model=LectureResponse)
 async def update_lecture(
         lecture_id: UUID,
         lecture_update: LectureUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
-    lecture = LectureCRUD.update_lecture(db, lecture_id, lecture_update, current_user)
+    try:
+        lecture = LectureCRUD.update_lecture(db, lecture_id, lecture_update, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
+    calendar_cache.invalidate()
     return lecture
 
 @router.delete("/{lecture_id}")
 async def delete_lecture(
         lecture_id: UUID,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     success = LectureCRUD.delete_lecture(db, lecture_id)
     if not success:
         raise HTTPException(status_code=404, detail="Lecture not found")
+    calendar_cache.invalidate()
     return {"message": "Lecture deactivated successfully"}
\ No newline at end of file
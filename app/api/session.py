@@ -1,13 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from ..database import get_db
-from ..models.user import User
-from ..schemas.session import SessionCreate, SessionUpdate, SessionResponse, SessionDetailResponse
+from ..schemas.session import SessionCreate, SessionUpdate, SessionResponse, SessionDetailResponse, SessionDetailListResponse
+from ..schemas.batch import BatchIdsRequest, BatchResponse
+from ..schemas.clone import SessionCloneRequest, CloneResponse
+from ..schemas.attendance import SessionAttendanceStatsResponse
 from ..crud.session import SessionCRUD
-from ..utils.auth import get_current_user, require_admin
+from ..crud.clone import CloneCRUD
+from ..crud.attendance_rollup import AttendanceRollupCRUD
+from ..utils.auth import TokenUser, get_current_user, require_admin
+from ..utils.calendar import calendar_cache
+from ..utils.fields import field_selector, render_fields
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
@@ -15,47 +21,89 @@ router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 async def create_session(
         session_data: SessionCreate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     return SessionCRUD.create_session(db, session_data, current_user)
 
-@router.get("", response_model=List[SessionDetailResponse])
+@router.get("", response_model=List[SessionDetailListResponse])
 async def get_sessions(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
+        status: Optional[Literal["NOT_STARTED", "IN_PROGRESS", "FINISHED"]] = Query(
+            None, description="Only sessions with this course_status"
+        ),
+        fields: Optional[List[str]] = Depends(field_selector(SessionDetailResponse, SessionDetailListResponse)),
         db: Session = Depends(get_db)
 ):
-    return SessionCRUD.get_sessions_with_details(db, skip=skip, limit=limit)
+    sessions = SessionCRUD.get_sessions_with_details(
+        db, skip=skip, limit=limit, fields=fields, include_inactive=include_inactive, status=status
+    )
+    return render_fields(sessions, fields)
+
+@router.post("/batch", response_model=BatchResponse[SessionResponse])
+async def get_sessions_batch(
+        request: BatchIdsRequest,
+        db: Session = Depends(get_db)
+):
+    sessions, missing = SessionCRUD.get_sessions_by_ids(db, request.ids)
+    return {"items": sessions, "missing": missing}
 
 @router.get("/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
         session_id: UUID,
+        fields: Optional[List[str]] = Depends(field_selector(SessionDetailResponse)),
         db: Session = Depends(get_db)
 ):
-    session_obj = SessionCRUD.get_session(db, session_id)
+    session_obj = SessionCRUD.get_session(db, session_id, fields=fields)
     if not session_obj:
         raise HTTPException(status_code=404, detail="Session not found")
-    return session_obj
+    return render_fields(session_obj, fields)
+
+@router.post("/{session_id}/clone", response_model=CloneResponse)
+async def clone_session(
+        session_id: UUID,
+        request: SessionCloneRequest,
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(require_admin)
+):
+    """세션을 강의와 함께 복사 (course_id 를 주면 그 과정으로, shift_days 만큼 날짜 이동)"""
+    cloned = CloneCRUD.clone_session(db, session_id, request, current_user)
+    if not cloned:
+        raise HTTPException(status_code=404, detail="Session or course not found")
+    return cloned
+
+@router.get("/{session_id}/attendance-stats", response_model=SessionAttendanceStatsResponse)
+async def get_session_attendance_stats(
+        session_id: UUID,
+        db: Session = Depends(get_db)
+):
+    stats = AttendanceRollupCRUD.get_session_stats(db, session_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return stats
 
 @router.put("/{session_id}", response_model=SessionResponse)
 async def update_session(
         session_id: UUID,
         session_update: SessionUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     session_obj = SessionCRUD.update_session(db, session_id, session_update)
     if not session_obj:
         raise HTTPException(status_code=404, detail="Session not found")
+    calendar_cache.invalidate()
     return session_obj
 
 @router.delete("/{session_id}")
 async def delete_session(
         session_id: UUID,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     success = SessionCRUD.delete_session(db, session_id)
     if not success:
         raise HTTPException(status_code=404, detail="Session not found")
+    calendar_cache.invalidate()
     return {"message": "Session deactivated successfully"}
\ No newline at end of file
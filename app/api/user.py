@@ -1,39 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime, time, timedelta, timezone
+from typing import List, Optional
 from uuid import UUID
 
 from ..database import get_db
 from ..models.user import User
-from ..schemas.user import UserResponse, UserUpdate, UserInfoResponse
+from ..schemas.user import UserResponse, UserUpdate, UserInfoResponse, UserInfoListResponse, UserListResponse, UserDashboardResponse
+from ..schemas.batch import BatchIdsRequest, BatchResponse
+from ..schemas.lecture import LectureCalendarResponse
+from ..config import settings
+from ..crud.lecture import LectureCRUD
 from ..crud.user import UserCRUD
-from ..utils.auth import get_current_user, require_admin
+from ..utils.auth import TokenUser, get_current_user, get_token_user, require_admin
+from ..utils.calendar import calendar_cache, etag_matches, to_ics
+from ..utils.fields import field_selector, render_fields
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
-@router.get("/info", response_model=List[UserInfoResponse])
+@router.get("/info", response_model=List[UserInfoListResponse])
 async def get_users_info(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    fields: Optional[List[str]] = Depends(field_selector(UserInfoResponse, UserInfoListResponse)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)  # admin 권한 요구
+    current_user: TokenUser = Depends(require_admin)  # admin 권한 요구
 ):
-    users = UserCRUD.get_active_users(db, skip=skip, limit=limit)
-    return users
+    users = UserCRUD.get_active_users(db, skip=skip, limit=limit, fields=fields)
+    return render_fields(users, fields)
 
-@router.get("", response_model=List[UserResponse])
+@router.get("", response_model=List[UserListResponse])
 async def get_users(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
+        role: Optional[str] = Query(None, description="Only users with this role (e.g. admin)"),
+        include_inactive: bool = Query(False, description="Also return soft-deleted rows"),
+        fields: Optional[List[str]] = Depends(field_selector(UserResponse, UserListResponse)),
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)  # admin 권한 요구
+        current_user: TokenUser = Depends(require_admin)  # admin 권한 요구
 ):
-    users = UserCRUD.get_users(db, skip=skip, limit=limit)
-    return users
+    users = UserCRUD.get_users(db, skip=skip, limit=limit, fields=fields, role=role, include_inactive=include_inactive)
+    return render_fields(users, fields)
+
+
+@router.post("/batch", response_model=BatchResponse[UserResponse])
+async def get_users_batch(
+        request: BatchIdsRequest,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    users, missing = UserCRUD.get_users_by_ids(db, request.ids)
+    return {"items": users, "missing": missing}
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
+        user_id: UUID,
+        fields: Optional[List[str]] = Depends(field_selector(UserResponse)),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    user = UserCRUD.get_user(db, user_id, fields=fields)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return render_fields(user, fields)
+
+
+@router.get("/{user_id}/dashboard", response_model=UserDashboardResponse)
+async def get_user_dashboard(
         user_id: UUID,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
@@ -41,7 +77,67 @@ async def get_user(
     user = UserCRUD.get_user(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return UserCRUD.get_user_dashboard(db, user_id)
+
+
+def _calendar(db: Session, user_id: UUID, current_user: TokenUser,
+              start: Optional[datetime], end: Optional[datetime]):
+    """(etag, events) - 본인 또는 admin 만 조회. 기본 기간은 오늘 0시(UTC)부터 calendar_default_days 일."""
+    if current_user.id != user_id and current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Permission denied")
+
+    if start is None:
+        start = datetime.combine(datetime.now(timezone.utc).date(), time(), tzinfo=timezone.utc)
+    elif start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end is not None and end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end is None:
+        end = start + timedelta(days=settings.calendar_default_days)
+    if end <= start or end - start > timedelta(days=settings.calendar_max_days):
+        raise HTTPException(status_code=400, detail=f"end must be after start and within {settings.calendar_max_days} days")
+
+    key = (user_id, start, end)
+    cached = calendar_cache.get(key)
+    if cached is not None:
+        return cached
+    events = LectureCRUD.get_calendar(db, user_id, start, end)
+    return calendar_cache.put(key, events), events
+
+
+@router.get("/{user_id}/calendar", response_model=List[LectureCalendarResponse])
+async def get_user_calendar(
+        user_id: UUID,
+        start: Optional[datetime] = Query(None, description="Window start (default: today 00:00 UTC)"),
+        end: Optional[datetime] = Query(None, description="Window end, exclusive"),
+        if_none_match: Optional[str] = Header(None),
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(get_token_user)
+):
+    """수강 중인 모든 세션의 기간 내 강의 일정 (ETag / If-None-Match 지원)"""
+    etag, events = _calendar(db, user_id, current_user, start, end)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(jsonable_encoder(events), headers=headers)
+
+
+@router.get("/{user_id}/calendar.ics")
+async def get_user_calendar_ics(
+        user_id: UUID,
+        start: Optional[datetime] = Query(None, description="Window start (default: today 00:00 UTC)"),
+        end: Optional[datetime] = Query(None, description="Window end, exclusive"),
+        if_none_match: Optional[str] = Header(None),
+        db: Session = Depends(get_db),
+        current_user: TokenUser = Depends(get_token_user)
+):
+    """같은 일정의 iCalendar 피드 (text/calendar)"""
+    etag, events = _calendar(db, user_id, current_user, start, end)
+    etag = f'{etag[:-1]}-ics"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(to_ics(events), media_type="text/calendar; charset=utf-8", headers=headers)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -49,7 +145,7 @@ async def update_user(
         user_id: UUID,
         user_update: UserUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     user = UserCRUD.update_user(db, user_id, user_update)
     if not user:
@@ -61,7 +157,7 @@ async def update_user(
 async def delete_user(
         user_id: UUID,
         db: Session = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: TokenUser = Depends(require_admin)
 ):
     success = UserCRUD.delete_user(db, user_id)
     if not success:
@@ -0,0 +1,38 @@
+"""종료된 세션의 출석을 attendance_archives 로 보관
+
+calculate_course_status 기준 FINISHED 이고 종료일이 --older-than-days 보다 오래된 세션의
+attendances 행을 세션당 JSONB 한 행으로 옮긴다. 보관된 출석은 AttendanceCRUD 목록 조회와
+대시보드에서 계속 읽힌다.
+
+Usage:
+    python -m app.commands.archive_attendances [--older-than-days 180] [--batch-size 50]
+"""
+import argparse
+from datetime import timedelta
+
+from ..config import settings
+from ..crud.attendance_archive import AttendanceArchiveCRUD
+from ..database import SessionLocal
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Move attendance of finished sessions into attendance_archives")
+    parser.add_argument("--older-than-days", type=int, default=settings.attendance_archive_after_days,
+                        help="only sessions that ended at least this many days ago")
+    parser.add_argument("--batch-size", type=int, default=50, help="sessions per transaction")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        totals = AttendanceArchiveCRUD.archive_finished(db, timedelta(days=args.older_than_days), args.batch_size)
+    finally:
+        db.close()
+
+    print(f"archived sessions: {totals['sessions']}, rows: {totals['rows']} ({totals['row_bytes']:,} bytes of row data)")
+    print(f"attendances: {totals['hot_bytes_before']:,} -> {totals['hot_bytes_after']:,} bytes "
+          f"(deleted space is reusable after VACUUM)")
+    print(f"attendance_archives: {totals['archive_bytes_before']:,} -> {totals['archive_bytes_after']:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
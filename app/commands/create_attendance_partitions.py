@@ -0,0 +1,74 @@
+"""attendances 월별 파티션 미리 만들기
+
+이번 달부터 --months 개월치 파티션(attendances_YYYY_MM)을 만든다. 이미 있는 파티션은 건너뛰고,
+기본 파티션(attendances_default)에 해당 월의 행이 들어가 있으면 새 파티션으로 옮긴 뒤 붙인다.
+cron 등으로 매월 실행해 두면 새 출석은 항상 월 파티션에 들어간다.
+
+Usage:
+    python -m app.commands.create_attendance_partitions [--months 3] [--start 2026-09]
+"""
+import argparse
+from datetime import date, datetime
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+
+PARENT = "attendances"
+DEFAULT_PARTITION = "attendances_default"
+
+
+def month_ranges(start: date, months: int) -> List[Tuple[date, date]]:
+    """start 가 속한 달부터 months 개월의 [월초, 다음 월초) 목록"""
+    ranges = []
+    year, month = start.year, start.month
+    for _ in range(months):
+        lower = date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        ranges.append((lower, date(year, month, 1)))
+    return ranges
+
+
+def partition_name(lower: date) -> str:
+    return f"{PARENT}_{lower:%Y_%m}"
+
+
+def create_partition(db: Session, lower: date, upper: date) -> bool:
+    """파티션 하나를 만들고 커밋. 이미 있으면 False."""
+    name = partition_name(lower)
+    if db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None:
+        return False
+
+    # 경계는 UTC 자정 (세션 TimeZone 설정과 무관하게 같은 범위)
+    lower_at, upper_at = f"'{lower.isoformat()} 00:00:00+00'", f"'{upper.isoformat()} 00:00:00+00'"
+    db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    # 기본 파티션에 이미 들어간 행이 있으면 ATTACH 가 실패하므로 먼저 옮긴다
+    db.execute(text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= {lower_at} AND created_at < {upper_at} "
+        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+    ))
+    db.execute(text(f"ALTER TABLE {PARENT} ATTACH PARTITION {name} FOR VALUES FROM ({lower_at}) TO ({upper_at})"))
+    db.commit()
+    return True
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Create monthly attendances partitions ahead of time")
+    parser.add_argument("--months", type=int, default=3, help="number of months to create, starting with --start")
+    parser.add_argument("--start", type=lambda value: datetime.strptime(value, "%Y-%m").date(), default=None,
+                        help="first month (YYYY-MM), defaults to the current month")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        for lower, upper in month_ranges(args.start or date.today(), args.months):
+            created = create_partition(db, lower, upper)
+            print(f"{partition_name(lower)}: {'created' if created else 'exists'}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
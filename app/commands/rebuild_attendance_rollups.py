@@ -0,0 +1,28 @@
+"""attendance_rollups 전체 재계산
+
+Usage:
+    python -m app.commands.rebuild_attendance_rollups [--session-id SESSION_ID]
+"""
+import argparse
+from uuid import UUID
+
+from ..crud.attendance_rollup import AttendanceRollupCRUD
+from ..database import SessionLocal
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild attendance rollups from the attendances table")
+    parser.add_argument("--session-id", type=UUID, default=None, help="only rebuild this session")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        rows = AttendanceRollupCRUD.rebuild(db, session_id=args.session_id)
+    finally:
+        db.close()
+
+    print(f"attendance_rollups rebuilt: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,73 @@ class Settings(BaseSettings):
     # JWT
     secret_key: str = "your-secret-key-here"
     algorithm: str = "HS256"
-    access_token_expire_minutes: int = 30
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 14
+    revocation_refresh_seconds: int = 30
 
     # Kakao OAuth
     kakao_client_id: str = ""
     kakao_client_secret: str = ""
     kakao_redirect_uri: str = "http://localhost:8000/auth/kakao/callback"
 
+    # Database pool
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_connection_budget: int = 0  # 전체 워커가 나눠 쓸 최대 커넥션 수 (0 = 워커별 db_pool_size/db_max_overflow 사용)
+
+    # Warmup / readiness
+    warmup_connections: int = 2
+    readiness_timeout_ms: int = 500
+    readiness_max_pool_usage: float = 0.9
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    workers: int = 0  # 0 = CPU 코어 수
+    timeout_keep_alive: int = 5
+    timeout_graceful_shutdown: int = 30
+    backlog: int = 2048
+
+    # API
+    batch_max_ids: int = 200
+
+    # Auth rate limiting (토큰 버킷, 분당 허용 횟수 - 0 이면 해당 라우트 제한 없음)
+    rate_limit_enabled: bool = True
+    rate_limit_store: str = "memory"  # memory (워커별) | postgres (워커 간 공유)
+    rate_limit_login_per_minute: int = 10
+    rate_limit_register_per_minute: int = 5
+    rate_limit_kakao_login_per_minute: int = 10
+    rate_limit_checkin_per_minute: int = 5  # 사용자+강의별 자가 출석 코드 시도 횟수
+
+    # Idempotency-Key (POST 재시도 시 저장된 응답 재전송)
+    idempotency_store: str = "memory"  # memory (워커별) | postgres (워커 간 공유)
+    idempotency_ttl_seconds: int = 86400
+    idempotency_lock_seconds: int = 30  # 처리 중 키의 임대 시간 (워커가 죽으면 이 시간 뒤 재시도 가능)
+
+    # Lecture calendar (기본 조회 기간, 최대 기간, 워커별 캐시 유지 시간)
+    calendar_default_days: int = 90
+    calendar_max_days: int = 366
+    calendar_cache_seconds: int = 60
+
+    # Self check-in
+    checkin_code_ttl_seconds: int = 120
+    checkin_batch_size: int = 200
+    checkin_batch_delay_ms: int = 10
+
+    # Attendance archival (종료 후 이 일수가 지난 세션의 출석을 attendance_archives 로 옮긴다)
+    attendance_archive_after_days: int = 180
+
+    # Live attendance stream (SSE)
+    live_updates_enabled: bool = True  # 켜져 있으면 워커마다 LISTEN 커넥션 하나를 db_connection_budget 에서 뺀다
+    live_heartbeat_seconds: int = 15
+    live_coalesce_ms: int = 50
+    live_queue_size: int = 100
+
+    # Response compression
+    compression_minimum_size: int = 1000
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
 
     # CORS
     allowed_origins: str = "http://localhost:3000,http://localhost:5173"
@@ -30,3 +86,8 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+
+def worker_count() -> int:
+    """설정된 워커 수 (0 이면 CPU 코어 수)"""
+    return settings.workers if settings.workers > 0 else (os.cpu_count() or 1)
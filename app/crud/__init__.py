@@ -3,8 +3,11 @@ from .course import CourseCRUD
 from .session import SessionCRUD
 from .lecture import LectureCRUD
 from .attendance import AttendanceCRUD
+from .attendance_rollup import AttendanceRollupCRUD
+from .attendance_archive import AttendanceArchiveCRUD
 from .certification import CertificationCRUD
 from .enroll import EnrollCRUD
+from .clone import CloneCRUD
 
 __all__ = [
     "UserCRUD",
@@ -12,6 +15,9 @@ __all__ = [
     "SessionCRUD",
     "LectureCRUD",
     "AttendanceCRUD",
+    "AttendanceRollupCRUD",
+    "AttendanceArchiveCRUD",
     "CertificationCRUD",
     "EnrollCRUD",
+    "CloneCRUD",
 ]
\ No newline at end of file
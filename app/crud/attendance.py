@@ -1,8 +1,45 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
-from ..models.user import Attendance, User
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import String, Text, cast, column, exists, func, insert, select, union_all, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session, aliased
+from typing import Dict, Optional, List
+from uuid import UUID, uuid4
+from ..models.user import Attendance, AttendanceArchive, Lecture, User
 from ..schemas.attendance import AttendanceCreate, AttendanceUpdate
+from .attendance_archive import archived_attendances
+from .attendance_rollup import AttendanceRollupCRUD
+from .base import POPULATE_EXISTING, created_between
+from ..utils.fields import load_only_fields
+
+# 출석으로 인정되는 상태값
+ATTENDED_STATUSES = ("present", "late")
+
+# 출석 쓰기마다 커밋 시점에 변경 행을 알리는 LISTEN/NOTIFY 채널
+ATTENDANCE_CHANNEL = "attendance_changes"
+
+
+def notify_change():
+    """RETURNING 절에 붙이는 ``pg_notify`` - 변경된 행마다 추가 왕복 없이 알림을 보낸다"""
+    payload = func.json_build_object("lecture_id", Attendance.lecture_id, "id", Attendance.id)
+    return func.pg_notify(ATTENDANCE_CHANNEL, cast(payload, Text))
+
+def lock_attendance_key(key):
+    """(강의, 사용자) 출석 기록을 트랜잭션 끝까지 직렬화하는 advisory lock (key 는 ``'<lecture_id>:<user_id>'``)"""
+    return func.pg_advisory_xact_lock(func.hashtext(key))
+
+def with_archived(*archive_criteria):
+    """
+    attendances 와 보관본(attendance_archives)을 합친 Attendance 엔티티 (읽기 전용)
+
+    archive_criteria 로 보관본을 세션 단위로 먼저 좁히고, 엔티티에 건 조건은 UNION ALL 양쪽으로
+    내려가 attendances 쪽은 그대로 인덱스/파티션 pruning 을 쓴다.
+    """
+    combined = union_all(
+        select(*Attendance.__table__.columns),
+        archived_attendances(*archive_criteria),
+    ).subquery("attendances_all")
+    return aliased(Attendance, combined)
 
 class AttendanceCRUD:
     @staticmethod
@@ -10,14 +47,20 @@ class AttendanceCRUD:
         return db.query(Attendance).filter(Attendance.id == attendance_id).first()
 
     @staticmethod
-    def get_attendances_by_lecture(db: Session, lecture_id: UUID, skip: int = 0, limit: int = 100) -> List[Attendance]:
-        return db.query(Attendance).filter(Attendance.lecture_id == lecture_id).order_by(Attendance.created_at.desc()).offset(skip).limit(limit).all()
+    def get_attendances_by_lecture(db: Session, lecture_id: UUID, skip: int = 0, limit: int = 100,
+                                   fields: Optional[List[str]] = None, created_from: Optional[datetime] = None,
+                                   created_to: Optional[datetime] = None) -> List[Attendance]:
+        session_id = select(Lecture.session_id).where(Lecture.id == lecture_id).scalar_subquery()
+        source = with_archived(AttendanceArchive.session_id == session_id)
+        return db.query(source).options(*load_only_fields(source, fields)).filter(source.lecture_id == lecture_id, *created_between(source, created_from, created_to)).order_by(source.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
-    def get_attendances_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100) -> List[Attendance]:
-        from ..models.user import Lecture
+    def get_attendances_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100,
+                                   fields: Optional[List[str]] = None, created_from: Optional[datetime] = None,
+                                   created_to: Optional[datetime] = None) -> List[Attendance]:
         lecture_ids = db.query(Lecture.id).filter(Lecture.session_id == session_id).subquery()
-        return db.query(Attendance).filter(Attendance.lecture_id.in_(lecture_ids)).order_by(Attendance.created_at.desc()).offset(skip).limit(limit).all()
+        source = with_archived(AttendanceArchive.session_id == session_id)
+        return db.query(source).options(*load_only_fields(source, fields)).filter(source.lecture_id.in_(lecture_ids), *created_between(source, created_from, created_to)).order_by(source.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
     def create_attendance(db: Session, lecture_id: UUID, attendance: AttendanceCreate, user: User) -> Attendance:
@@ -26,21 +69,103 @@ class AttendanceCRUD:
         attendance_dict['created_by'] = user.id
         attendance_dict['updated_by'] = user.id
 
-        db_attendance = Attendance(**attendance_dict)
-        db.add(db_attendance)
+        # 같은 (강의, 사용자)의 자가 출석 배치(check_in_many)와 같은 키로 잠가 중복 기록을 막는다
+        db.execute(select(lock_attendance_key(f"{lecture_id}:{attendance.user_id}")))
+        db_attendance = db.scalars(
+            insert(Attendance).values(**attendance_dict).returning(Attendance, notify_change())
+        ).one()
+        AttendanceRollupCRUD.apply_deltas(db, {(lecture_id, db_attendance.status): 1})
         db.commit()
-        db.refresh(db_attendance)
         return db_attendance
 
+    @staticmethod
+    def check_in_many(db: Session, check_ins: List[Dict]) -> List[Optional[Attendance]]:
+        """Insert a batch of self check-ins in one multi-row statement and commit once.
+
+        Each item carries ``lecture_id``, ``user_id``, ``status``, ``detail_type`` and ``created_by``.
+        Returns the created attendance per item, in order, or None where the user already has
+        an attendance for that lecture (earlier in the table or earlier in the batch) or where the
+        lecture or user does not exist.
+        """
+        rows = {}
+        for item in check_ins:
+            rows.setdefault((item['lecture_id'], item['user_id']), (uuid4(), item))
+        if not rows:
+            return []
+
+        changes = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("lecture_id", PG_UUID(as_uuid=True)),
+            column("user_id", PG_UUID(as_uuid=True)),
+            column("status", String),
+            column("detail_type", String),
+            column("created_by", PG_UUID(as_uuid=True)),
+            name="changes",
+        ).data([
+            (row_id, item['lecture_id'], item['user_id'], item['status'], item.get('detail_type'), item['created_by'])
+            for row_id, item in rows.values()
+        ])
+        # 같은 (강의, 사용자)를 동시에 기록하는 다른 워커의 배치와 직렬화한다 (키 순서로 잠가 교착을 피한다).
+        # 잠금은 INSERT 보다 앞선 문장이어야 INSERT 의 스냅샷이 먼저 커밋된 출석을 본다.
+        keys = select(
+            (cast(changes.c.lecture_id, Text) + ":" + cast(changes.c.user_id, Text)).label("key")
+        ).distinct().subquery()
+        db.execute(select(lock_attendance_key(keys.c.key)).order_by(keys.c.key)).all()
+
+        # 없는 강의/사용자 행은 FK 오류로 배치 전체를 실패시키지 않도록 JOIN 으로 걸러낸다
+        source = select(
+            changes.c.id, changes.c.lecture_id, changes.c.user_id, changes.c.status,
+            changes.c.detail_type, changes.c.created_by, changes.c.created_by,
+        ).join(Lecture, Lecture.id == changes.c.lecture_id).join(User, User.id == changes.c.user_id).where(
+            ~exists().where(
+                Attendance.lecture_id == changes.c.lecture_id,
+                Attendance.user_id == changes.c.user_id
+            )
+        )
+        stmt = insert(Attendance).from_select(
+            ["id", "lecture_id", "user_id", "status", "detail_type", "created_by", "updated_by"], source
+        ).returning(Attendance, notify_change())
+        created = {attendance.id: attendance for attendance in db.scalars(stmt).all()}
+
+        AttendanceRollupCRUD.apply_deltas(
+            db, Counter((attendance.lecture_id, attendance.status) for attendance in created.values())
+        )
+        db.commit()
+
+        results, seen = [], set()
+        for item in check_ins:
+            key = (item['lecture_id'], item['user_id'])
+            row_id = rows[key][0]
+            results.append(created.get(row_id) if key not in seen else None)
+            seen.add(key)
+        return results
+
     @staticmethod
     def update_attendance(db: Session, attendance_id: UUID, attendance_update: AttendanceUpdate, user: User) -> Optional[Attendance]:
         attendance_dict = attendance_update.model_dump(exclude_unset=True)
         attendance_dict['updated_by'] = user.id
 
-        db_attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
-        if db_attendance:
-            for field, value in attendance_update.model_dump(exclude_unset=True).items():
-                setattr(db_attendance, field, value)
-            db.commit()
-            db.refresh(db_attendance)
+        # 이전 status 는 같은 UPDATE 문 안에서 잠근 스냅샷(CTE)으로 돌려받는다
+        previous = (
+            select(Attendance.id, Attendance.status)
+            .where(Attendance.id == attendance_id)
+            .with_for_update()
+            .cte("previous")
+        )
+        stmt = (
+            update(Attendance)
+            .where(Attendance.id == previous.c.id)
+            .values(**attendance_dict)
+            .returning(Attendance, previous.c.status, notify_change())
+        )
+        db_attendance, previous_status, _ = db.execute(stmt, execution_options=POPULATE_EXISTING).one_or_none() or (None, None, None)
+
+        # 집계 변화량은 요청한 새 status 와 잠근 스냅샷의 이전 status 로만 계산한다
+        new_status = attendance_dict.get('status', previous_status)
+        if db_attendance and new_status != previous_status:
+            AttendanceRollupCRUD.apply_deltas(db, {
+                (db_attendance.lecture_id, previous_status): -1,
+                (db_attendance.lecture_id, new_status): 1,
+            })
+        db.commit()
         return db_attendance
\ No newline at end of file
@@ -0,0 +1,122 @@
+from datetime import timedelta
+from typing import Dict
+
+from sqlalchemy import column, exists, func, literal_column, select, text, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..models.user import Attendance, AttendanceArchive, Lecture
+from ..models.user import Session as SessionModel
+from .session import course_status_filter
+
+ATTENDANCE_COLUMNS = Attendance.__table__.columns
+
+
+def archived_attendances(*criteria):
+    """Archived attendance rows as a select with the same columns, in the same order, as ``attendances``.
+
+    ``criteria`` filter ``attendance_archives`` (e.g. by ``session_id``) before the JSONB arrays
+    are unpacked, so only the matching sessions are decompressed.
+    """
+    record = (
+        func.jsonb_to_recordset(AttendanceArchive.rows)
+        .table_valued(*[column(c.name, c.type) for c in ATTENDANCE_COLUMNS])
+        .render_derived(name="archived", with_types=True)
+    )
+    return (
+        select(*[record.c[c.name] for c in ATTENDANCE_COLUMNS])
+        .select_from(AttendanceArchive)
+        .join(record, true())
+        .where(*criteria)
+    )
+
+
+def _hot_bytes(db: Session) -> int:
+    # 파티션 테이블 자체는 크기가 0 이므로 파티션들의 크기를 더한다
+    return db.execute(text(
+        "SELECT coalesce(sum(pg_total_relation_size(inhrelid)), 0) FROM pg_inherits "
+        "WHERE inhparent = 'attendances'::regclass"
+    )).scalar()
+
+
+class AttendanceArchiveCRUD:
+    @staticmethod
+    def archivable_sessions(db: Session, older_than: timedelta, limit: int):
+        """Ids of FINISHED sessions (see ``course_status_filter``) that ended more than
+        ``older_than`` ago and still have rows in ``attendances``."""
+        return db.scalars(
+            select(SessionModel.id)
+            .where(
+                *course_status_filter("FINISHED"),
+                SessionModel.end_date < func.now() - older_than,
+                exists().where(Lecture.session_id == SessionModel.id, Attendance.lecture_id == Lecture.id),
+            )
+            .order_by(SessionModel.end_date)
+            .limit(limit)
+        ).all()
+
+    @staticmethod
+    def archive_sessions(db: Session, session_ids) -> Dict[str, int]:
+        """Move every attendance row of ``session_ids`` into ``attendance_archives`` and commit.
+
+        The delete and the insert are one statement, so a row is never in both places or in neither.
+        Sessions archived before get the new rows appended to their array.
+        Returns ``{"sessions", "rows", "row_bytes"}`` where ``row_bytes`` is the heap size of the moved rows.
+        """
+        moved = (
+            Attendance.__table__.delete()
+            .where(Attendance.lecture_id == Lecture.id, Lecture.session_id.in_(session_ids))
+            .returning(
+                Lecture.session_id.label("session_id"),
+                func.to_jsonb(literal_column("attendances.*")).label("row"),
+                func.pg_column_size(literal_column("attendances.*")).label("size"),
+            )
+            .cte("moved")
+        )
+        stmt = insert(AttendanceArchive).from_select(
+            ["session_id", "rows", "row_count"],
+            select(moved.c.session_id, func.jsonb_agg(moved.c.row), func.count())
+            .group_by(moved.c.session_id),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttendanceArchive.session_id],
+            set_={
+                "rows": AttendanceArchive.rows.op("||")(stmt.excluded.rows),
+                "row_count": AttendanceArchive.row_count + stmt.excluded.row_count,
+                "archived_at": func.now(),
+            },
+        )
+        archived = stmt.returning(AttendanceArchive.session_id).cte("archived")
+
+        sessions, rows, row_bytes = db.execute(select(
+            select(func.count()).select_from(archived).scalar_subquery(),
+            select(func.count()).select_from(moved).scalar_subquery(),
+            select(func.coalesce(func.sum(moved.c.size), 0)).select_from(moved).scalar_subquery(),
+        )).one()
+        db.commit()
+        return {"sessions": sessions, "rows": rows, "row_bytes": row_bytes}
+
+    @staticmethod
+    def archive_finished(db: Session, older_than: timedelta, batch_size: int = 50) -> Dict[str, int]:
+        """Archive all eligible sessions in batches of ``batch_size`` (one transaction per batch).
+
+        Returns totals plus ``hot_bytes_before``/``hot_bytes_after`` (``attendances`` partitions) and
+        ``archive_bytes_before``/``archive_bytes_after`` (``attendance_archives``). Deleted heap space is
+        reused by new rows after VACUUM; the files only shrink after ``VACUUM FULL`` or dropping a partition.
+        """
+        def archive_bytes() -> int:
+            return db.execute(select(func.pg_total_relation_size("attendance_archives"))).scalar()
+
+        totals = {"sessions": 0, "rows": 0, "row_bytes": 0,
+                  "hot_bytes_before": _hot_bytes(db), "archive_bytes_before": archive_bytes()}
+        while True:
+            session_ids = AttendanceArchiveCRUD.archivable_sessions(db, older_than, batch_size)
+            if not session_ids:
+                break
+            for key, value in AttendanceArchiveCRUD.archive_sessions(db, session_ids).items():
+                totals[key] += value
+
+        totals["hot_bytes_after"] = _hot_bytes(db)
+        totals["archive_bytes_after"] = archive_bytes()
+        db.commit()
+        return totals
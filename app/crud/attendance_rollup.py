@@ -0,0 +1,130 @@
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Integer, String, column, exists, func, select, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.orm import Session
+
+from ..models.user import Attendance, AttendanceArchive, AttendanceRollup, Enroll, Lecture
+from ..models.user import Session as SessionModel
+from ..schemas.attendance import SessionAttendanceStatsResponse
+
+RollupKey = Tuple[UUID, str]
+
+
+class AttendanceRollupCRUD:
+    @staticmethod
+    def apply_deltas(db: Session, deltas: Dict[RollupKey, int]) -> None:
+        """Add ``{(lecture_id, status): delta}`` to the rollup counts in one upsert.
+
+        Runs inside the caller's transaction so the counts commit together with the
+        attendance rows they describe.
+        """
+        rows = [(lecture_id, status, delta) for (lecture_id, status), delta in deltas.items() if delta]
+        if not rows:
+            return
+
+        changes = values(
+            column("lecture_id", PG_UUID(as_uuid=True)),
+            column("status", String),
+            column("delta", Integer),
+            name="changes",
+        ).data(rows)
+
+        stmt = insert(AttendanceRollup).from_select(
+            ["lecture_id", "session_id", "status", "count"],
+            db.query(changes.c.lecture_id, Lecture.session_id, changes.c.status, changes.c.delta)
+            .join(Lecture, Lecture.id == changes.c.lecture_id)
+            .statement,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttendanceRollup.lecture_id, AttendanceRollup.status],
+            set_={
+                "count": AttendanceRollup.count + stmt.excluded.count,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def rebuild(db: Session, session_id: Optional[UUID] = None) -> int:
+        """Recompute rollups from ``attendances`` (all sessions, or just one). Returns rows written.
+
+        Archived sessions keep their rollups: their rows are no longer in ``attendances``.
+        """
+        archived = select(AttendanceArchive.session_id)
+        delete_query = db.query(AttendanceRollup).filter(AttendanceRollup.session_id.not_in(archived))
+        source = (
+            db.query(Attendance.lecture_id, Lecture.session_id, Attendance.status, func.count(Attendance.id))
+            .join(Lecture, Lecture.id == Attendance.lecture_id)
+            .filter(Lecture.session_id.not_in(archived))
+            .group_by(Attendance.lecture_id, Lecture.session_id, Attendance.status)
+        )
+        if session_id is not None:
+            delete_query = delete_query.filter(AttendanceRollup.session_id == session_id)
+            source = source.filter(Lecture.session_id == session_id)
+
+        delete_query.delete(synchronize_session=False)
+        result = db.execute(
+            insert(AttendanceRollup).from_select(
+                ["lecture_id", "session_id", "status", "count"], source.statement
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def get_session_stats(db: Session, session_id: UUID) -> Optional[SessionAttendanceStatsResponse]:
+        """Per-lecture and per-session status counts served from ``attendance_rollups``.
+
+        Returns None when the session does not exist (only checked when it has no lectures).
+        """
+        from .attendance import ATTENDED_STATUSES
+
+        rows = (
+            db.query(Lecture, AttendanceRollup.status, AttendanceRollup.count)
+            .outerjoin(AttendanceRollup, AttendanceRollup.lecture_id == Lecture.id)
+            .filter(Lecture.session_id == session_id)
+            .order_by(Lecture.sequence)
+            .all()
+        )
+        if not rows and not db.query(exists().where(SessionModel.id == session_id)).scalar():
+            return None
+
+        enrolled_count = (
+            db.query(func.count(Enroll.id))
+            .filter(Enroll.session_id == session_id, Enroll.is_active == True)
+            .scalar()
+        )
+
+        lectures = {}
+        session_counts = defaultdict(int)
+        for lecture, status, count in rows:
+            entry = lectures.setdefault(lecture.id, {
+                "lecture_id": lecture.id,
+                "title": lecture.title,
+                "sequence": lecture.sequence,
+                "lecture_date": lecture.lecture_date,
+                "status_counts": {},
+            })
+            if status is not None and count:
+                entry["status_counts"][status] = count
+                session_counts[status] += count
+
+        for entry in lectures.values():
+            attended = sum(entry["status_counts"].get(s, 0) for s in ATTENDED_STATUSES)
+            entry["total"] = sum(entry["status_counts"].values())
+            entry["attendance_rate"] = attended / enrolled_count if enrolled_count else 0.0
+
+        possible = enrolled_count * len(lectures)
+        attended = sum(session_counts.get(s, 0) for s in ATTENDED_STATUSES)
+
+        return SessionAttendanceStatsResponse(
+            session_id=session_id,
+            enrolled_count=enrolled_count,
+            lecture_count=len(lectures),
+            status_counts=dict(session_counts),
+            attendance_rate=attended / possible if possible else 0.0,
+            lectures=list(lectures.values()),
+        )
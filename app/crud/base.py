@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# ``populate_existing`` 는 Session.execute 호출 시점에 넘겨야 이미 로드된 객체도 RETURNING 값으로 덮어쓴다
+POPULATE_EXISTING = {"populate_existing": True}
+
+
+def uuid_array(ids: Sequence[UUID]):
+    """Bind a list of UUIDs as a single ``uuid[]`` parameter"""
+    return bindparam("ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True)), unique=True)
+
+
+def id_in(column, ids: Sequence[UUID]):
+    """``column = ANY(:ids)`` - one array parameter regardless of how many ids are passed"""
+    return column == any_(uuid_array(ids))
+
+
+def active_filter(model, include_inactive: bool = False) -> list:
+    """Soft-delete scope for ``.filter(*active_filter(Model, include_inactive))``.
+
+    Active-only listings match the ``(created_at DESC) WHERE is_active`` partial indexes.
+    """
+    return [] if include_inactive else [model.is_active == True]
+
+
+def created_between(entity, created_from: Optional[datetime] = None, created_to: Optional[datetime] = None) -> list:
+    """``created_at`` range criteria ``[created_from, created_to)``; either bound may be omitted.
+
+    On the partitioned ``attendances`` table the planner also skips partitions outside the range.
+    """
+    criteria = []
+    if created_from is not None:
+        criteria.append(entity.created_at >= created_from)
+    if created_to is not None:
+        criteria.append(entity.created_at < created_to)
+    return criteria
+
+
+def fetch_by_ids(db: Session, model, ids: Sequence[UUID], *options) -> Tuple[List[T], List[UUID]]:
+    """Load rows of ``model`` whose id is in ``ids`` with a single query.
+
+    Returns the rows in request order (duplicates collapsed) and the ids that were not found.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    if not unique_ids:
+        return [], []
+
+    rows = db.query(model).options(*options).filter(id_in(model.id, unique_ids)).all()
+    by_id = {row.id: row for row in rows}
+
+    found = [by_id[i] for i in unique_ids if i in by_id]
+    missing = [i for i in unique_ids if i not in by_id]
+    return found, missing
+
+
+def update_by_id(db: Session, model, row_id: UUID, values: dict):
+    """``UPDATE ... WHERE id = :id RETURNING *`` in one round trip.
+
+    Returns the updated ORM object (identity map refreshed from RETURNING), or None when no row matched.
+    """
+    stmt = update(model).where(model.id == row_id).values(**values).returning(model)
+    return db.scalars(stmt, execution_options=POPULATE_EXISTING).one_or_none()
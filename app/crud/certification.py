@@ -26,5 +26,4 @@ class CertificationCRUD:
         db_certification = Certification(**certification_dict)
         db.add(db_certification)
         db.commit()
-        db.refresh(db_certification)
         return db_certification
\ No newline at end of file
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import exists, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from ..models.user import Course, Lecture, User
+from ..models.user import Session as SessionModel
+from ..schemas.clone import CourseCloneRequest, SessionCloneRequest
+from .base import active_filter
+
+SESSION_COLUMNS = [
+    "id", "course_id", "title", "description", "lecturer_info", "date_info",
+    "begin_date", "end_date", "created_by", "updated_by", "is_active",
+]
+LECTURE_COLUMNS = [
+    "id", "session_id", "title", "sequence", "attendance_type", "lecture_date", "created_by", "updated_by",
+]
+
+
+def _uuid(value):
+    return literal(value, PG_UUID(as_uuid=True))
+
+
+def _copy_sessions(session_map, course_id, title, shift: timedelta, user_id: UUID, *criteria):
+    """``INSERT ... SELECT`` CTEs copying the sessions of ``session_map`` (old_id -> new_id) and their lectures.
+
+    Lectures are only copied for sessions the first CTE actually inserted, so a session whose
+    ``criteria`` fail leaves nothing behind. Returns ``(new_sessions, new_lectures)``.
+    """
+    new_sessions = insert(SessionModel).from_select(
+        SESSION_COLUMNS,
+        select(
+            session_map.c.new_id,
+            course_id,
+            title,
+            SessionModel.description,
+            SessionModel.lecturer_info,
+            SessionModel.date_info,
+            SessionModel.begin_date + shift,
+            SessionModel.end_date + shift,
+            _uuid(user_id),
+            _uuid(user_id),
+            SessionModel.is_active,
+        )
+        .join(session_map, session_map.c.old_id == SessionModel.id)
+        .where(*criteria),
+    ).returning(SessionModel.id).cte("new_sessions")
+
+    new_lectures = insert(Lecture).from_select(
+        LECTURE_COLUMNS,
+        select(
+            func.gen_random_uuid(),
+            session_map.c.new_id,
+            Lecture.title,
+            Lecture.sequence,
+            Lecture.attendance_type,
+            Lecture.lecture_date + shift,
+            _uuid(user_id),
+            _uuid(user_id),
+        )
+        .join(session_map, session_map.c.old_id == Lecture.session_id)
+        .join(new_sessions, new_sessions.c.id == session_map.c.new_id),
+    ).returning(Lecture.id).cte("new_lectures")
+    return new_sessions, new_lectures
+
+
+def _run(db: Session, new_id: UUID, new_sessions, new_lectures, *ctes) -> Optional[dict]:
+    session_ids, lecture_count, *inserted = db.execute(select(
+        select(func.array_agg(new_sessions.c.id)).scalar_subquery(),
+        select(func.count()).select_from(new_lectures).scalar_subquery(),
+        *[select(func.count()).select_from(cte).scalar_subquery() for cte in ctes],
+    )).one()
+    db.commit()
+    if not all(inserted):
+        return None
+    return {"id": new_id, "session_ids": session_ids or [], "lecture_count": lecture_count}
+
+
+class CloneCRUD:
+    @staticmethod
+    def clone_course(db: Session, course_id: UUID, request: CourseCloneRequest, user: User) -> Optional[dict]:
+        """Copy a course with its sessions and their lectures in one statement and commit.
+
+        Dates are moved by ``request.shift_days``; enrollments and attendance are not copied.
+        Returns ``{"id", "session_ids", "lecture_count"}`` for the new course, or None when the course does not exist.
+        """
+        new_course_id = uuid4()
+        new_course = insert(Course).from_select(
+            ["id", "title", "description", "keyword", "created_by", "updated_by", "is_active"],
+            select(
+                _uuid(new_course_id),
+                func.coalesce(request.title, Course.title),
+                Course.description,
+                Course.keyword,
+                _uuid(user.id),
+                _uuid(user.id),
+                literal(True),
+            ).where(Course.id == course_id),
+        ).returning(Course.id).cte("new_course")
+
+        # 세션 id 는 DB 가 만들고 강의의 session_id 를 옮기는 데 쓴다 (volatile 함수라 CTE 는 한 번만 계산된다)
+        session_map = (
+            select(SessionModel.id.label("old_id"), func.gen_random_uuid(type_=PG_UUID(as_uuid=True)).label("new_id"))
+            .where(SessionModel.course_id == course_id, *active_filter(SessionModel, request.include_inactive))
+            .cte("session_map")
+        )
+        new_sessions, new_lectures = _copy_sessions(
+            session_map, _uuid(new_course_id), SessionModel.title, timedelta(days=request.shift_days), user.id
+        )
+        return _run(db, new_course_id, new_sessions, new_lectures, new_course)
+
+    @staticmethod
+    def clone_session(db: Session, session_id: UUID, request: SessionCloneRequest, user: User) -> Optional[dict]:
+        """Copy one session with its lectures in one statement and commit, optionally into another course.
+
+        Returns ``{"id", "session_ids", "lecture_count"}`` for the new session, or None when the session
+        or the target course does not exist.
+        """
+        new_session_id = uuid4()
+        session_map = select(
+            _uuid(session_id).label("old_id"), _uuid(new_session_id).label("new_id")
+        ).cte("session_map")
+        course_id = _uuid(request.course_id) if request.course_id else SessionModel.course_id
+        criteria = [exists().where(Course.id == request.course_id)] if request.course_id else []
+
+        new_sessions, new_lectures = _copy_sessions(
+            session_map, course_id, func.coalesce(request.title, SessionModel.title),
+            timedelta(days=request.shift_days), user.id, *criteria
+        )
+        return _run(db, new_session_id, new_sessions, new_lectures, new_sessions)
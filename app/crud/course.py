@@ -1,28 +1,34 @@
 from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from ..models.user import Course, User, Session as SessionModel
 from ..schemas.course import CourseCreate, CourseUpdate
+from .base import active_filter, fetch_by_ids, update_by_id
+from ..utils.fields import load_only_fields
 
 class CourseCRUD:
     @staticmethod
-    def get_course(db: Session, course_id: UUID) -> Optional[Course]:
-        return db.query(Course).filter(Course.id == course_id).first()
+    def get_course(db: Session, course_id: UUID, fields: Optional[List[str]] = None) -> Optional[Course]:
+        return db.query(Course).options(*load_only_fields(Course, fields)).filter(Course.id == course_id).first()
 
     @staticmethod
-    def get_courses(db: Session, skip: int = 0, limit: int = 100) -> List[Course]:
-        courses = db.query(Course).filter(Course.is_active == True).order_by(Course.created_at.desc()).offset(skip).limit(limit).all()
+    def get_courses_by_ids(db: Session, course_ids: List[UUID]) -> Tuple[List[Course], List[UUID]]:
+        return fetch_by_ids(db, Course, course_ids)
 
+    @staticmethod
+    def get_courses(db: Session, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None,
+                    include_inactive: bool = False) -> List[Course]:
         results = (
             db.query(
                 Course,
                 User.username.label('author'),
                 func.count(SessionModel.id).label('session_count')
             )
+            .options(*load_only_fields(Course, fields))
             .join(User, Course.created_by == User.id)
             .outerjoin(SessionModel, Course.id == SessionModel.course_id)
-            .filter(Course.is_active == True)
+            .filter(*active_filter(Course, include_inactive))
             .group_by(Course.id, User.username)
             .order_by(Course.created_at.desc())
             .offset(skip)
@@ -48,7 +54,6 @@ class CourseCRUD:
         db_course = Course(**course_data)
         db.add(db_course)
         db.commit()
-        db.refresh(db_course)
         return db_course
 
     @staticmethod
@@ -56,10 +61,6 @@ class CourseCRUD:
         course_update_data = course_update.model_dump(exclude_unset=True)
         course_update_data['updated_by'] = user.id
 
-        db_course = db.query(Course).filter(Course.id == course_id).first()
-        if db_course:
-            for field, value in course_update_data.items():
-                setattr(db_course, field, value)
-            db.commit()
-            db.refresh(db_course)
+        db_course = update_by_id(db, Course, course_id, course_update_data)
+        db.commit()
         return db_course
\ No newline at end of file
@@ -1,9 +1,11 @@
+from sqlalchemy import exists, func, insert, literal, select
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
+from typing import Optional, List, Tuple
+from uuid import UUID, uuid4
 from datetime import datetime
-from ..models.user import Enroll, User, Session as SessionModel, Course
+from ..models.user import Enroll, Lecture, User, Session as SessionModel, Course
 from ..schemas.enroll import EnrollCreate, EnrollUpdate, EnrollDetailResponse
+from .base import active_filter, created_between, update_by_id
 
 class EnrollCRUD:
     @staticmethod
@@ -11,150 +13,142 @@ class EnrollCRUD:
         return db.query(Enroll).filter(Enroll.id == enroll_id).first()
 
     @staticmethod
-    def get_enrolls(db: Session, skip: int = 0, limit: int = 100) -> List[Enroll]:
-        return db.query(Enroll).order_by(Enroll.created_at.desc()).offset(skip).limit(limit).all()
+    def get_enrolls(db: Session, skip: int = 0, limit: int = 100, include_inactive: bool = False) -> List[Enroll]:
+        return db.query(Enroll).filter(*active_filter(Enroll, include_inactive)).order_by(Enroll.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
-    def get_enrolls_with_details(db: Session, skip: int = 0, limit: int = 100) -> List[EnrollDetailResponse]:
-        """Get enrollments with user_name, auth_type, session_title, and course_name"""
+    def search_enrolls(db: Session, user_id: Optional[UUID] = None, session_id: Optional[UUID] = None,
+                       course_id: Optional[UUID] = None, enroll_status: Optional[str] = None,
+                       created_from: Optional[datetime] = None, created_to: Optional[datetime] = None,
+                       skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                       with_total: bool = True) -> Tuple[List[EnrollDetailResponse], Optional[int]]:
+        """Enrollments with user_name, auth_type, session_title and course_name, filtered by any combination
+        of user, session, course, status and ``created_at`` range, newest first.
+
+        With ``with_total`` the total number of matching rows comes back in the same query as
+        ``count(*) OVER ()``; only a page past the end needs a separate count. Returns ``(items, total)``.
+        """
+        criteria = [
+            *active_filter(Enroll, include_inactive),
+            *created_between(Enroll, created_from, created_to),
+        ]
+        if user_id is not None:
+            criteria.append(Enroll.user_id == user_id)
+        if session_id is not None:
+            criteria.append(Enroll.session_id == session_id)
+        if course_id is not None:
+            criteria.append(SessionModel.course_id == course_id)
+        if enroll_status is not None:
+            criteria.append(Enroll.enroll_status == enroll_status)
+
+        columns = [
+            Enroll,
+            User.username.label('user_name'),
+            User.auth_type.label('auth_type'),
+            SessionModel.title.label('session_title'),
+            Course.title.label('course_name'),
+        ]
+        if with_total:
+            columns.append(func.count().over().label('total'))
         results = (
-            db.query(
-                Enroll,
-                User.username.label('user_name'),
-                User.auth_type.label('auth_type'),
-                SessionModel.title.label('session_title'),
-                Course.title.label('course_name')
-            )
+            db.query(*columns)
             .join(User, Enroll.user_id == User.id)
             .join(SessionModel, Enroll.session_id == SessionModel.id)
             .join(Course, SessionModel.course_id == Course.id)
+            .filter(*criteria)
             .order_by(Enroll.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-        response_list = []
-        for enroll, user_name, auth_type, session_title, course_name in results:
-            response_data = {
-                "id": enroll.id,
-                "user_id": enroll.user_id,
-                "session_id": enroll.session_id,
-                "enroll_status": enroll.enroll_status,
-                "user_name": user_name,
-                "auth_type": auth_type,
-                "session_title": session_title,
-                "course_name": course_name,
-                "created_at": enroll.created_at,
-                "updated_at": enroll.updated_at,
-                "created_by": enroll.created_by,
-                "updated_by": enroll.updated_by
-            }
-            response_list.append(EnrollDetailResponse(**response_data))
-
-        return response_list
+        total = None
+        if with_total:
+            if results:
+                total = results[0].total
+            elif skip == 0:
+                total = 0
+            else:
+                total = (
+                    db.query(func.count(Enroll.id))
+                    .join(SessionModel, Enroll.session_id == SessionModel.id)
+                    .filter(*criteria)
+                    .scalar()
+                )
+
+        items = [
+            EnrollDetailResponse(
+                id=row.Enroll.id,
+                user_id=row.Enroll.user_id,
+                session_id=row.Enroll.session_id,
+                enroll_status=row.Enroll.enroll_status,
+                user_name=row.user_name,
+                auth_type=row.auth_type,
+                session_title=row.session_title,
+                course_name=row.course_name,
+                created_at=row.Enroll.created_at,
+                updated_at=row.Enroll.updated_at,
+                created_by=row.Enroll.created_by,
+                updated_by=row.Enroll.updated_by,
+            )
+            for row in results
+        ]
+        return items, total
 
     @staticmethod
-    def get_enrolls_by_user(db: Session, user_id: UUID, skip: int = 0, limit: int = 100) -> List[EnrollDetailResponse]:
-        """Get enrollments by user with session and course details"""
-        results = (
-            db.query(
-                Enroll,
-                User.username.label('user_name'),
-                User.auth_type.label('auth_type'),
-                SessionModel.title.label('session_title'),
-                Course.title.label('course_name')
-            )
-            .join(User, Enroll.user_id == User.id)
-            .join(SessionModel, Enroll.session_id == SessionModel.id)
-            .join(Course, SessionModel.course_id == Course.id)
-            .filter(Enroll.user_id == user_id)
-            .order_by(Enroll.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+    def get_enrolls_with_details(db: Session, skip: int = 0, limit: int = 100,
+                                 include_inactive: bool = False) -> List[EnrollDetailResponse]:
+        """Get enrollments with user_name, auth_type, session_title, and course_name"""
+        return EnrollCRUD.search_enrolls(
+            db, skip=skip, limit=limit, include_inactive=include_inactive, with_total=False
+        )[0]
 
-        response_list = []
-        for enroll, user_name, auth_type, session_title, course_name in results:
-            response_data = {
-                "id": enroll.id,
-                "user_id": enroll.user_id,
-                "session_id": enroll.session_id,
-                "enroll_status": enroll.enroll_status,
-                "user_name": user_name,
-                "auth_type": auth_type,
-                "session_title": session_title,
-                "course_name": course_name,
-                "created_at": enroll.created_at,
-                "updated_at": enroll.updated_at,
-                "created_by": enroll.created_by,
-                "updated_by": enroll.updated_by
-            }
-            response_list.append(EnrollDetailResponse(**response_data))
-
-        return response_list
+    @staticmethod
+    def get_enrolls_by_user(db: Session, user_id: UUID, skip: int = 0, limit: int = 100,
+                            include_inactive: bool = False) -> List[EnrollDetailResponse]:
+        """Get enrollments by user with session and course details"""
+        return EnrollCRUD.search_enrolls(
+            db, user_id=user_id, skip=skip, limit=limit, include_inactive=include_inactive, with_total=False
+        )[0]
 
     @staticmethod
-    def get_enrolls_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100) -> List[EnrollDetailResponse]:
+    def get_enrolls_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100,
+                               include_inactive: bool = False) -> List[EnrollDetailResponse]:
         """Get enrollments by session with user and course details"""
-        results = (
-            db.query(
-                Enroll,
-                User.username.label('user_name'),
-                User.auth_type.label('auth_type'),
-                SessionModel.title.label('session_title'),
-                Course.title.label('course_name')
-            )
-            .join(User, Enroll.user_id == User.id)
-            .join(SessionModel, Enroll.session_id == SessionModel.id)
-            .join(Course, SessionModel.course_id == Course.id)
-            .filter(Enroll.session_id == session_id)
-            .order_by(Enroll.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-
-        response_list = []
-        for enroll, user_name, auth_type, session_title, course_name in results:
-            response_data = {
-                "id": enroll.id,
-                "user_id": enroll.user_id,
-                "session_id": enroll.session_id,
-                "enroll_status": enroll.enroll_status,
-                "user_name": user_name,
-                "auth_type": auth_type,
-                "session_title": session_title,
-                "course_name": course_name,
-                "created_at": enroll.created_at,
-                "updated_at": enroll.updated_at,
-                "created_by": enroll.created_by,
-                "updated_by": enroll.updated_by
-            }
-            response_list.append(EnrollDetailResponse(**response_data))
-
-        return response_list
+        return EnrollCRUD.search_enrolls(
+            db, session_id=session_id, skip=skip, limit=limit, include_inactive=include_inactive, with_total=False
+        )[0]
 
     @staticmethod
     def create_enroll(db: Session, enroll: EnrollCreate, user: User) -> Enroll:
-        # Check if user is already enrolled in this session
-        existing_enroll = db.query(Enroll).filter(
-            Enroll.user_id == enroll.user_id,
-            Enroll.session_id == enroll.session_id
-        ).first()
-
-        if existing_enroll:
-            raise ValueError("User is already enrolled in this session")
+        """Insert the enrollment unless the user is already enrolled in the session.
 
+        The duplicate check and the insert are one ``INSERT ... SELECT ... WHERE NOT EXISTS
+        ... RETURNING`` statement.
+        """
         enroll_dict = enroll.model_dump()
+        enroll_dict['id'] = uuid4()
+        enroll_dict['is_active'] = True
         enroll_dict['created_by'] = user.id
         enroll_dict['updated_by'] = user.id
 
-        db_enroll = Enroll(**enroll_dict)
-        db.add(db_enroll)
+        columns = Enroll.__table__.c
+        source = select(
+            *[literal(value, columns[name].type).label(name) for name, value in enroll_dict.items()]
+        ).where(
+            ~exists().where(
+                Enroll.user_id == enroll.user_id,
+                Enroll.session_id == enroll.session_id
+            )
+        )
+        db_enroll = db.scalars(
+            insert(Enroll).from_select(list(enroll_dict), source).returning(Enroll)
+        ).one_or_none()
+
+        if db_enroll is None:
+            raise ValueError("User is already enrolled in this session")
+
         db.commit()
-        db.refresh(db_enroll)
         return db_enroll
 
 
@@ -164,12 +158,8 @@ class EnrollCRUD:
         enroll_dict = enroll_update.model_dump(exclude_unset=True)
         enroll_dict['updated_by'] = user.id
 
-        db_enroll = db.query(Enroll).filter(Enroll.id == enroll_id).first()
-        if db_enroll:
-            for field, value in enroll_dict.items():
-                setattr(db_enroll, field, value)
-            db.commit()
-            db.refresh(db_enroll)
+        db_enroll = update_by_id(db, Enroll, enroll_id, enroll_dict)
+        db.commit()
         return db_enroll
 
     @staticmethod
@@ -178,4 +168,16 @@ class EnrollCRUD:
         return db.query(Enroll).filter(
             Enroll.user_id == user_id,
             Enroll.session_id == session_id
-        ).first()
\ No newline at end of file
+        ).first()
+
+    @staticmethod
+    def is_enrolled_in_lecture(db: Session, user_id: UUID, lecture_id: UUID) -> bool:
+        """Whether the user has an active enrollment in the session of the lecture"""
+        return db.query(
+            exists().where(
+                Enroll.user_id == user_id,
+                Enroll.session_id == Lecture.session_id,
+                Enroll.is_active == True,
+                Lecture.id == lecture_id,
+            )
+        ).scalar()
\ No newline at end of file
@@ -1,21 +1,66 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, String, cast, column, exists, func, insert, literal, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
-from ..models.user import Lecture, User
-from ..schemas.lecture import LectureCreate, LectureUpdate
+from typing import Optional, List, Tuple
+from uuid import UUID, uuid4
+from ..models.user import Course, Enroll, Lecture, User
+from ..models.user import Session as SessionModel
+from ..schemas.lecture import LectureCreate, LectureUpdate, LectureScheduleCreate
+from ..utils.calendar import schedule_dates
+from .base import POPULATE_EXISTING, fetch_by_ids, update_by_id
+from ..utils.fields import load_only_fields
+
+SEQUENCE_CONSTRAINT = "uq_lectures_session_id_sequence"
+
+
+def _is_sequence_conflict(error: IntegrityError) -> bool:
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == SEQUENCE_CONSTRAINT
+
 
 class LectureCRUD:
     @staticmethod
-    def get_lecture(db: Session, lecture_id: UUID) -> Optional[Lecture]:
-        return db.query(Lecture).filter(Lecture.id == lecture_id).first()
+    def get_lecture(db: Session, lecture_id: UUID, fields: Optional[List[str]] = None) -> Optional[Lecture]:
+        return db.query(Lecture).options(*load_only_fields(Lecture, fields)).filter(Lecture.id == lecture_id).first()
+
+    @staticmethod
+    def get_lectures_by_ids(db: Session, lecture_ids: List[UUID]) -> Tuple[List[Lecture], List[UUID]]:
+        return fetch_by_ids(db, Lecture, lecture_ids)
 
     @staticmethod
-    def get_lectures(db: Session, skip: int = 0, limit: int = 100) -> List[Lecture]:
-        return db.query(Lecture).order_by(Lecture.created_at.desc()).offset(skip).limit(limit).all()
+    def get_lectures(db: Session, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None) -> List[Lecture]:
+        return db.query(Lecture).options(*load_only_fields(Lecture, fields)).order_by(Lecture.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
-    def get_lectures_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100) -> List[Lecture]:
-        return db.query(Lecture).filter(Lecture.session_id == session_id).order_by(Lecture.sequence).offset(skip).limit(limit).all()
+    def get_lectures_by_session(db: Session, session_id: UUID, skip: int = 0, limit: int = 100,
+                                fields: Optional[List[str]] = None) -> List[Lecture]:
+        return db.query(Lecture).options(*load_only_fields(Lecture, fields)).filter(Lecture.session_id == session_id).order_by(Lecture.sequence).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def get_calendar(db: Session, user_id: UUID, start: datetime, end: datetime) -> List[dict]:
+        """Lectures dated in ``[start, end)`` across the user's active enrollments, in date order"""
+        rows = (
+            db.query(
+                Lecture.id, Lecture.session_id, SessionModel.course_id, Lecture.title, Lecture.sequence,
+                Lecture.attendance_type, Lecture.lecture_date,
+                SessionModel.title.label('session_title'), Course.title.label('course_title')
+            )
+            .join(Enroll, Enroll.session_id == Lecture.session_id)
+            .join(SessionModel, SessionModel.id == Lecture.session_id)
+            .join(Course, Course.id == SessionModel.course_id)
+            .filter(
+                Enroll.user_id == user_id,
+                Enroll.is_active == True,
+                SessionModel.is_active == True,
+                Lecture.lecture_date >= start,
+                Lecture.lecture_date < end
+            )
+            .order_by(Lecture.lecture_date, Lecture.sequence)
+            .all()
+        )
+        return [row._asdict() for row in rows]
 
     @staticmethod
     def create_lecture(db: Session, lecture: LectureCreate, user: User) -> Lecture:
@@ -25,23 +70,115 @@ class LectureCRUD:
 
         db_lecture = Lecture(**lecture_dict)
         db.add(db_lecture)
-        db.commit()
-        db.refresh(db_lecture)
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if _is_sequence_conflict(e):
+                raise ValueError(f"Sequence {lecture.sequence} is already used in this session")
+            raise
         return db_lecture
 
+    @staticmethod
+    def create_schedule(db: Session, schedule: LectureScheduleCreate, user: User) -> List[Lecture]:
+        """Insert every lecture of a recurrence in one ``INSERT ... SELECT ... RETURNING`` and commit once.
+
+        Sequences continue after the session's highest existing sequence; ``{sequence}`` in the title
+        template is filled in by the same statement. Returns the created lectures in sequence order,
+        or an empty list when the session does not exist.
+        """
+        dates = schedule_dates(schedule.start_date, schedule.weekdays, schedule.count, schedule.start_time)
+        rows = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("n", Integer),
+            column("title", String),
+            column("lecture_date", DateTime(timezone=True)),
+            name="schedule",
+        ).data([
+            (uuid4(), n, schedule.title_template.format(sequence="{sequence}", n=n, date=day.date().isoformat()), day)
+            for n, day in enumerate(dates, start=1)
+        ])
+        last_sequence = (
+            select(func.coalesce(func.max(Lecture.sequence), 0))
+            .where(Lecture.session_id == schedule.session_id)
+            .scalar_subquery()
+        )
+        sequence = last_sequence + rows.c.n
+        source = select(
+            rows.c.id,
+            literal(schedule.session_id, PG_UUID(as_uuid=True)),
+            func.replace(rows.c.title, "{sequence}", cast(sequence, String)),
+            sequence,
+            literal(schedule.attendance_type, String),
+            rows.c.lecture_date,
+            literal(user.id, PG_UUID(as_uuid=True)),
+            literal(user.id, PG_UUID(as_uuid=True)),
+        ).where(exists().where(SessionModel.id == schedule.session_id))
+
+        stmt = insert(Lecture).from_select(
+            ["id", "session_id", "title", "sequence", "attendance_type", "lecture_date", "created_by", "updated_by"],
+            source,
+        ).returning(Lecture)
+        try:
+            lectures = db.scalars(stmt).all()
+            db.commit()
+        except IntegrityError as e:
+            # 같은 세션에 동시에 강의가 추가되어 이어 붙일 sequence 가 이미 쓰인 경우
+            db.rollback()
+            if _is_sequence_conflict(e):
+                raise ValueError("Lectures of this session changed concurrently, retry the schedule")
+            raise
+        return sorted(lectures, key=lambda lecture: lecture.sequence)
+
     @staticmethod
     def update_lecture(db: Session, lecture_id: UUID, lecture_update: LectureUpdate, user: User) -> Optional[Lecture]:
         lecture_dict = lecture_update.model_dump(exclude_unset=True)
         lecture_dict['updated_by'] = str(user.id)
 
-        db_lecture = db.query(Lecture).filter(Lecture.id == lecture_id).first()
-        if db_lecture:
-            for field, value in lecture_dict.items():
-                setattr(db_lecture, field, value)
+        try:
+            db_lecture = update_by_id(db, Lecture, lecture_id, lecture_dict)
             db.commit()
-            db.refresh(db_lecture)
+        except IntegrityError as e:
+            db.rollback()
+            if _is_sequence_conflict(e):
+                raise ValueError(f"Sequence {lecture_update.sequence} is already used in this session")
+            raise
         return db_lecture
 
+    @staticmethod
+    def reorder_lectures(db: Session, session_id: UUID, lecture_ids: List[UUID], user: User) -> Optional[List[Lecture]]:
+        """Set ``sequence`` to 1..n in the order of ``lecture_ids`` and commit.
+
+        ``lecture_ids`` must list every lecture of the session exactly once (``ValueError`` otherwise).
+        The session's lectures are locked, then rewritten by a single ``UPDATE ... FROM (VALUES ...)``;
+        the deferrable ``(session_id, sequence)`` constraint is checked once the whole statement ran,
+        so sequences can be swapped freely. Returns the lectures in their new order, or None when the
+        session has no lectures.
+        """
+        current = db.scalars(
+            select(Lecture.id).where(Lecture.session_id == session_id).with_for_update()
+        ).all()
+        if not current:
+            return None
+        if len(lecture_ids) != len(current) or set(lecture_ids) != set(current):
+            # 잠금은 요청 세션이 끝날 때 풀린다 (호출자의 트랜잭션을 여기서 되돌리지 않는다)
+            raise ValueError("lecture_ids must list every lecture of the session exactly once")
+
+        order = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("sequence", Integer),
+            name="new_order",
+        ).data([(lecture_id, n) for n, lecture_id in enumerate(lecture_ids, start=1)])
+        stmt = (
+            update(Lecture)
+            .where(Lecture.id == order.c.id, Lecture.session_id == session_id)
+            .values(sequence=order.c.sequence, updated_by=user.id)
+            .returning(Lecture)
+        )
+        lectures = db.scalars(stmt, execution_options=POPULATE_EXISTING).all()
+        db.commit()
+        return sorted(lectures, key=lambda lecture: lecture.sequence)
+
     @staticmethod
     def delete_lecture(db: Session, lecture_id: UUID) -> bool:
         db_lecture = db.query(Lecture).filter(Lecture.id == lecture_id).first()
@@ -1,12 +1,15 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
 from uuid import UUID
 
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.orm import Session
 
 from ..models.user import Course, Lecture
 from ..models.user import Session, User
 from ..schemas.session import SessionCreate, SessionUpdate, SessionDetailResponse
+from .base import active_filter, fetch_by_ids, update_by_id
+from ..utils.fields import load_only_fields
 
 
 def calculate_course_status(begin_date: Optional[datetime], end_date: Optional[datetime]) -> str:
@@ -40,105 +43,132 @@ def calculate_course_status(begin_date: Optional[datetime], end_date: Optional[d
         return "FINISHED"
 
 
+COURSE_STATUSES = ("NOT_STARTED", "IN_PROGRESS", "FINISHED")
+
+
+def course_status_expr():
+    """SQL ``CASE`` version of ``calculate_course_status``, evaluated against ``now()``"""
+    now = func.now()
+    return case(
+        (and_(Session.begin_date.is_(None), Session.end_date.is_(None)), "NOT_STARTED"),
+        (Session.begin_date > now, "NOT_STARTED"),
+        (Session.end_date < now, "FINISHED"),
+        else_="IN_PROGRESS",
+    )
+
+
+def course_status_filter(status: Optional[str]) -> list:
+    """Criteria matching one course_status, written as plain date ranges so the
+    begin_date/end_date indexes apply (the CASE itself can't be indexed: ``now()`` changes)."""
+    now = func.now()
+    if status == "NOT_STARTED":
+        return [or_(Session.begin_date > now, and_(Session.begin_date.is_(None), Session.end_date.is_(None)))]
+    if status == "IN_PROGRESS":
+        return [
+            or_(Session.begin_date <= now, and_(Session.begin_date.is_(None), Session.end_date.is_not(None))),
+            or_(Session.end_date.is_(None), Session.end_date >= now),
+        ]
+    if status == "FINISHED":
+        return [Session.end_date < now, or_(Session.begin_date.is_(None), Session.begin_date <= now)]
+    return []
+
+
+def _detail_query(db: Session, fields: Optional[List[str]] = None):
+    """Session + course_name + lecture_count in one query"""
+    lecture_count = (
+        db.query(func.count(Lecture.id))
+        .filter(Lecture.session_id == Session.id)
+        .correlate(Session)
+        .scalar_subquery()
+    )
+    return (
+        db.query(
+            Session,
+            Course.title.label('course_name'),
+            lecture_count.label('lecture_count'),
+            course_status_expr().label('course_status')
+        )
+        .options(*load_only_fields(Session, fields))
+        .join(Course, Session.course_id == Course.id)
+    )
+
+
+def _session_detail(session: Session, course_name: str, lecture_count: int, course_status: str,
+                    fields: Optional[List[str]] = None) -> Union[SessionDetailResponse, dict]:
+    """Build the detail payload; with ``fields`` only those keys are read from the row"""
+    computed = {
+        "course_name": lambda: course_name,
+        "course_status": lambda: course_status,
+        "lecture_count": lambda: lecture_count,
+    }
+
+    if fields is not None:
+        return {
+            field: computed[field]() if field in computed else getattr(session, field)
+            for field in fields
+        }
+
+    return SessionDetailResponse(**{
+        "id": session.id,
+        "title": session.title,
+        "description": session.description,
+        "lecturer_info": session.lecturer_info,
+        "date_info": session.date_info,
+        "begin_date": session.begin_date,
+        "end_date": session.end_date,
+        "course_id": session.course_id,
+        "course_name": course_name,
+        "course_status": course_status,
+        "lecture_count": lecture_count,
+        "created_at": session.created_at,
+        "updated_at": session.updated_at,
+        "created_by": session.created_by,
+        "updated_by": session.updated_by
+    })
+
+
 class SessionCRUD:
     @staticmethod
-    def get_session(db: Session, session_id: UUID) -> Optional[SessionDetailResponse]:
-        session, course_name = (
-            db.query(
-                Session,
-                Course.title.label('course_name')
-            )
-            .join(Course, Session.course_id == Course.id)
-            .filter(Session.id == session_id)
-            .first()
-        )
+    def get_session(db: Session, session_id: UUID,
+                    fields: Optional[List[str]] = None) -> Optional[Union[SessionDetailResponse, dict]]:
+        result = _detail_query(db, fields).filter(Session.id == session_id).first()
 
-        if not session:
+        if not result:
             return None
 
-        course_status = calculate_course_status(session.begin_date, session.end_date)
-
-        # Count lectures for this session
-        lecture_count = (
-            db.query(Lecture)
-            .filter(Lecture.session_id == session.id)
-            .count()
-        )
+        return _session_detail(*result, fields)
 
-        return SessionDetailResponse(**{
-            "id": session.id,
-            "title": session.title,
-            "description": session.description,
-            "lecturer_info": session.lecturer_info,
-            "date_info": session.date_info,
-            "begin_date": session.begin_date,
-            "end_date": session.end_date,
-            "course_id": session.course_id,
-            "course_name": course_name,
-            "course_status": course_status,
-            "lecture_count": lecture_count,
-            "created_at": session.created_at,
-            "updated_at": session.updated_at,
-            "created_by": session.created_by,
-            "updated_by": session.updated_by
-        })
+    @staticmethod
+    def get_sessions_by_ids(db: Session, session_ids: List[UUID]) -> Tuple[List[Session], List[UUID]]:
+        return fetch_by_ids(db, Session, session_ids)
 
     @staticmethod
-    def get_sessions(db: Session, skip: int = 0, limit: int = 100) -> List[Session]:
-        return db.query(Session).filter(Session.is_active == True).order_by(Session.created_at.desc()).offset(
+    def get_sessions(db: Session, skip: int = 0, limit: int = 100, include_inactive: bool = False) -> List[Session]:
+        return db.query(Session).filter(*active_filter(Session, include_inactive)).order_by(Session.created_at.desc()).offset(
             skip).limit(limit).all()
 
     @staticmethod
-    def get_sessions_with_details(db: Session, skip: int = 0, limit: int = 100) -> List[SessionDetailResponse]:
-        """Get sessions with course_name, course_status, and total_lectures count"""
+    def get_sessions_with_details(db: Session, skip: int = 0, limit: int = 100,
+                                  fields: Optional[List[str]] = None,
+                                  include_inactive: bool = False,
+                                  status: Optional[str] = None) -> List[Union[SessionDetailResponse, dict]]:
+        """Get sessions with course_name, course_status, and total_lectures count,
+        optionally only those whose course_status is ``status``"""
         results = (
-            db.query(
-                Session,
-                Course.title.label('course_name')
-            )
-            .join(Course, Session.course_id == Course.id)
-            .filter(Session.is_active == True)
+            _detail_query(db, fields)
+            .filter(*active_filter(Session, include_inactive), *course_status_filter(status))
             .order_by(Session.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-        response_list = []
-        for session, course_name in results:
-            course_status = calculate_course_status(session.begin_date, session.end_date)
-
-            # Count lectures for this session
-            lecture_count = (
-                db.query(Lecture)
-                .filter(Lecture.session_id == session.id)
-                .count()
-            )
-
-            response_data = {
-                "id": session.id,
-                "title": session.title,
-                "description": session.description,
-                "lecturer_info": session.lecturer_info,
-                "date_info": session.date_info,
-                "begin_date": session.begin_date,
-                "end_date": session.end_date,
-                "course_id": session.course_id,
-                "course_name": course_name,
-                "course_status": course_status,
-                "lecture_count": lecture_count,
-                "created_at": session.created_at,
-                "updated_at": session.updated_at,
-                "created_by": session.created_by,
-                "updated_by": session.updated_by
-            }
-            response_list.append(SessionDetailResponse(**response_data))
-
-        return response_list
+        return [_session_detail(*result, fields) for result in results]
 
     @staticmethod
-    def get_sessions_by_course(db: Session, course_id: UUID, skip: int = 0, limit: int = 100) -> List[Session]:
-        return db.query(Session).filter(Session.course_id == course_id, Session.is_active == True).order_by(
+    def get_sessions_by_course(db: Session, course_id: UUID, skip: int = 0, limit: int = 100,
+                               include_inactive: bool = False) -> List[Session]:
+        return db.query(Session).filter(Session.course_id == course_id, *active_filter(Session, include_inactive)).order_by(
             Session.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
@@ -150,17 +180,12 @@ class SessionCRUD:
         db_session = Session(**session_dict)
         db.add(db_session)
         db.commit()
-        db.refresh(db_session)
         return db_session
 
     @staticmethod
     def update_session(db: Session, session_id: UUID, session_update: SessionUpdate) -> Optional[Session]:
-        db_session = db.query(Session).filter(Session.id == session_id).first()
-        if db_session:
-            for field, value in session_update.model_dump(exclude_unset=True).items():
-                setattr(db_session, field, value)
-            db.commit()
-            db.refresh(db_session)
+        db_session = update_by_id(db, Session, session_id, session_update.model_dump(exclude_unset=True))
+        db.commit()
         return db_session
 
     @staticmethod
@@ -1,13 +1,28 @@
+from sqlalchemy import func, distinct
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from ..models.user import User
-from ..schemas.user import UserCreate, UserUpdate
+from ..models.user import User, Enroll, Session as SessionModel, Course, Lecture, AttendanceArchive, Certification
+from ..schemas.user import UserCreate, UserUpdate, UserDashboardResponse
+from .attendance import ATTENDED_STATUSES, with_archived
+from .base import active_filter, fetch_by_ids, update_by_id
+from ..utils.fields import load_only_fields
+from .session import calculate_course_status
+
+def with_role(values: dict) -> dict:
+    """``authorizations`` 가 주어지면 그 안의 role 을 ``role`` 컬럼 값으로도 넣는다"""
+    if "authorizations" in values:
+        values["role"] = (values["authorizations"] or {}).get("role", "user")
+    return values
 
 class UserCRUD:
     @staticmethod
-    def get_user(db: Session, user_id: UUID) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+    def get_user(db: Session, user_id: UUID, fields: Optional[List[str]] = None) -> Optional[User]:
+        return db.query(User).options(*load_only_fields(User, fields)).filter(User.id == user_id).first()
+
+    @staticmethod
+    def get_users_by_ids(db: Session, user_ids: List[UUID]) -> Tuple[List[User], List[UUID]]:
+        return fetch_by_ids(db, User, user_ids)
 
     @staticmethod
     def get_user_by_username(db: Session, username: str) -> Optional[User]:
@@ -18,30 +33,29 @@ class UserCRUD:
         return db.query(User).filter(User.kakao_id == kakao_id).first()
 
     @staticmethod
-    def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    def get_users(db: Session, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None,
+                  role: Optional[str] = None, include_inactive: bool = False) -> List[User]:
+        query = db.query(User).options(*load_only_fields(User, fields)).filter(*active_filter(User, include_inactive))
+        if role is not None:
+            query = query.filter(User.role == role)
+        return query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
 
     @staticmethod
     def create_user(db: Session, user: UserCreate) -> User:
-        db_user = User(**user.model_dump())
+        db_user = User(**with_role(user.model_dump()))
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
         return db_user
 
     @staticmethod
     def update_user(db: Session, user_id: UUID, user_update: UserUpdate) -> Optional[User]:
-        db_user = db.query(User).filter(User.id == user_id).first()
-        if db_user:
-            for field, value in user_update.model_dump(exclude_unset=True).items():
-                setattr(db_user, field, value)
-            db.commit()
-            db.refresh(db_user)
+        db_user = update_by_id(db, User, user_id, with_role(user_update.model_dump(exclude_unset=True)))
+        db.commit()
         return db_user
 
     @staticmethod
-    def get_active_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).filter(User.is_active == True).order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    def get_active_users(db: Session, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None) -> List[User]:
+        return UserCRUD.get_users(db, skip=skip, limit=limit, fields=fields)
 
     @staticmethod
     def delete_user(db: Session, user_id: UUID) -> bool:
@@ -50,4 +64,91 @@ class UserCRUD:
             db_user.is_active = False
             db.commit()
             return True
-        return False
\ No newline at end of file
+        return False
+
+    @staticmethod
+    def get_user_dashboard(db: Session, user_id: UUID) -> UserDashboardResponse:
+        """Enrollments with session/course, lecture totals and attendance rate, plus certifications.
+
+        Lecture totals and attended counts are aggregated per session in the same query
+        instead of being looked up session by session.
+        """
+        enrolled_sessions = db.query(Enroll.session_id).filter(
+            Enroll.user_id == user_id,
+            Enroll.is_active == True
+        )
+
+        lecture_totals = (
+            db.query(
+                Lecture.session_id.label('session_id'),
+                func.count(Lecture.id).label('lecture_count')
+            )
+            .filter(Lecture.session_id.in_(enrolled_sessions))
+            .group_by(Lecture.session_id)
+            .subquery()
+        )
+
+        # 보관된(종료된) 세션의 출석도 함께 센다
+        attendances = with_archived(AttendanceArchive.session_id.in_(enrolled_sessions))
+        attended_totals = (
+            db.query(
+                Lecture.session_id.label('session_id'),
+                func.count(distinct(attendances.lecture_id)).label('attended_count')
+            )
+            .join(attendances, attendances.lecture_id == Lecture.id)
+            .filter(
+                attendances.user_id == user_id,
+                attendances.status.in_(ATTENDED_STATUSES),
+                Lecture.session_id.in_(enrolled_sessions)
+            )
+            .group_by(Lecture.session_id)
+            .subquery()
+        )
+
+        results = (
+            db.query(
+                Enroll,
+                SessionModel,
+                Course.title.label('course_name'),
+                func.coalesce(lecture_totals.c.lecture_count, 0).label('lecture_count'),
+                func.coalesce(attended_totals.c.attended_count, 0).label('attended_count')
+            )
+            .join(SessionModel, Enroll.session_id == SessionModel.id)
+            .join(Course, SessionModel.course_id == Course.id)
+            .outerjoin(lecture_totals, lecture_totals.c.session_id == SessionModel.id)
+            .outerjoin(attended_totals, attended_totals.c.session_id == SessionModel.id)
+            .filter(Enroll.user_id == user_id, Enroll.is_active == True)
+            .order_by(Enroll.created_at.desc())
+            .all()
+        )
+
+        enrollments = []
+        for enroll, session, course_name, lecture_count, attended_count in results:
+            enrollments.append({
+                "enroll_id": enroll.id,
+                "enroll_status": enroll.enroll_status,
+                "enrolled_at": enroll.created_at,
+                "session_id": session.id,
+                "session_title": session.title,
+                "begin_date": session.begin_date,
+                "end_date": session.end_date,
+                "course_status": calculate_course_status(session.begin_date, session.end_date),
+                "course_id": session.course_id,
+                "course_name": course_name,
+                "lecture_count": lecture_count,
+                "attended_count": attended_count,
+                "attendance_rate": attended_count / lecture_count if lecture_count else 0.0
+            })
+
+        certifications = (
+            db.query(Certification)
+            .filter(Certification.user_id == user_id)
+            .order_by(Certification.issued_at.desc())
+            .all()
+        )
+
+        return UserDashboardResponse(
+            user_id=user_id,
+            enrollments=enrollments,
+            certifications=certifications
+        )
\ No newline at end of file
@@ -1,10 +1,29 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from .config import settings
+from .config import settings, worker_count
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def pool_limits() -> tuple:
+    """
+    워커 하나의 (pool_size, max_overflow). db_connection_budget 이 있으면 워커 수로 나눈다.
+
+    실시간 출석 스트림이 켜져 있으면 워커마다 풀 밖의 LISTEN 커넥션 하나를 몫에서 미리 뺀다.
+    """
+    if settings.db_connection_budget > 0:
+        reserved = 1 if settings.live_updates_enabled else 0
+        return max(1, settings.db_connection_budget // worker_count() - reserved), 0
+    return settings.db_pool_size, settings.db_max_overflow
+
+
+pool_size, max_overflow = pool_limits()
+engine = create_engine(
+    settings.database_url,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+)
+# RETURNING 으로 받은 값을 커밋 후에도 그대로 쓰도록 만료시키지 않는다
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
@@ -1,11 +1,63 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from .config import settings
 from .api import auth, user, course, session, lecture, attendance, certification, enroll
 from .database import engine
 from .models.user import User, Course, Session, Lecture, Attendance, Certification
+from .utils.attendance_events import AttendanceBroadcaster
+from .utils.checkin import CheckInBatcher, flush_check_ins
+from .utils.compression import CompressionMiddleware
+from .utils.idempotency import IdempotencyMiddleware, create_idempotency_store
+from .utils.rate_limit import create_rate_limit_store
+from .utils.warmup import check_readiness, retry_warm_up, warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 풀 커넥션과 주요 쿼리를 미리 데워둔 워커만 /ready 를 통과
+    app.state.ready = False
+    if settings.warmup_connections > 0:
+        app.state.ready = await run_in_threadpool(warm_up, settings.warmup_connections)
+    else:
+        app.state.ready = True
+
+    app.state.rate_limit_store = create_rate_limit_store(settings.rate_limit_store)
+    app.state.idempotency_store = create_idempotency_store(settings.idempotency_store)
+    app.state.checkin_batcher = CheckInBatcher(
+        flush_check_ins,
+        max_size=settings.checkin_batch_size,
+        max_delay_ms=settings.checkin_batch_delay_ms,
+    )
+    app.state.checkin_batcher.start()
+    app.state.attendance_broadcaster = AttendanceBroadcaster(
+        coalesce_ms=settings.live_coalesce_ms,
+        queue_size=settings.live_queue_size,
+    )
+    yield
+    await app.state.attendance_broadcaster.stop()
+    await app.state.checkin_batcher.stop()
 
-app = FastAPI(title="STG Academy API", version="1.0.0")
+
+app = FastAPI(title="STG Academy API", version="1.0.0", lifespan=lifespan)
+
+# 가장 안쪽 미들웨어 - 압축 전 응답을 저장하고, 재전송도 바깥 미들웨어(압축/CORS)를 거친다
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=[
+        "/api/attendances/lectures/{lecture_id}/attendances",
+        "/api/enrolls/",
+        "/api/certifications",
+        "/api/courses/{course_id}/clone",
+        "/api/sessions/{session_id}/clone",
+    ],
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    lock_seconds=settings.idempotency_lock_seconds,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,6 +67,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+
 app.include_router(auth.router)
 app.include_router(user.router)
 app.include_router(course.router)
@@ -31,3 +90,16 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/ready")
+def readiness_check():
+    if not app.state.ready:
+        # 기동 시 DB 가 없었던 경우 백그라운드에서 다시 데우고, 끝나기 전까지는 바로 503
+        app.state.ready = retry_warm_up(settings.warmup_connections)
+    if not app.state.ready:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "reason": "warming up"})
+
+    result = check_readiness()
+    if "reason" in result:
+        return JSONResponse(status_code=503, content={"status": "unavailable", **result})
+    return {"status": "ready", **result}
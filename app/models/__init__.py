@@ -1,3 +1,3 @@
-from .user import User, Course, Session, Lecture, Attendance, Certification
+from .user import User, Course, Session, Lecture, Attendance, AttendanceRollup, AttendanceArchive, Certification, RateLimitBucket, RevokedToken, IdempotencyKey
 
-__all__ = ["User", "Course", "Session", "Lecture", "Attendance", "Certification"]
\ No newline at end of file
+__all__ = ["User", "Course", "Session", "Lecture", "Attendance", "AttendanceRollup", "AttendanceArchive", "Certification", "RateLimitBucket", "RevokedToken", "IdempotencyKey"]
\ No newline at end of file
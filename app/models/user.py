@@ -1,12 +1,15 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Float, Integer, Text, ForeignKey, Index, UniqueConstraint, DDL, LargeBinary, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
 import uuid
 
+# eager_defaults: created_at/updated_at 같은 서버 생성 값을 INSERT/UPDATE ... RETURNING 으로 함께 받는다
+
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String, nullable=False, unique=True)
@@ -15,17 +18,26 @@ class User(Base):
     kakao_id = Column(String)
     information = Column(Text)
     authorizations = Column(JSONB)
+    role = Column(String, nullable=False, default="user", server_default="user")  # authorizations.role 과 동기화
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     last_login = Column(DateTime(timezone=True))
     is_active = Column(Boolean, nullable=False, default=True)
 
+    __table_args__ = (
+        # 역할별 목록 (WHERE role = ? ORDER BY created_at DESC)
+        Index("ix_users_role_created_at", "role", "created_at"),
+        # 활성 행 목록 (WHERE is_active ORDER BY created_at DESC) - 소프트 삭제된 행은 인덱스에 들어가지 않는다
+        Index("ix_users_active_created_at", created_at.desc(), postgresql_where=is_active),
+    )
+
     attendances = relationship("Attendance", back_populates="user")
     certifications = relationship("Certification", back_populates="user")
     enrollments = relationship("Enroll", back_populates="user")
 
 class Course(Base):
     __tablename__ = "courses"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
@@ -37,11 +49,16 @@ class Course(Base):
     updated_by = Column(UUID(as_uuid=True), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
+    __table_args__ = (
+        Index("ix_courses_active_created_at", created_at.desc(), postgresql_where=is_active),
+    )
+
     sessions = relationship("Session", back_populates="course")
     certifications = relationship("Certification", back_populates="course")
 
 class Session(Base):
     __tablename__ = "sessions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
@@ -57,12 +74,20 @@ class Session(Base):
     updated_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
+    __table_args__ = (
+        Index("ix_sessions_active_created_at", created_at.desc(), postgresql_where=is_active),
+        # course_status 필터 (begin_date/end_date 와 now() 의 범위 비교)
+        Index("ix_sessions_begin_date", "begin_date"),
+        Index("ix_sessions_end_date", "end_date"),
+    )
+
     course = relationship("Course", back_populates="sessions")
     lectures = relationship("Lecture", back_populates="session")
     enrollments = relationship("Enroll", back_populates="session")
 
 class Lecture(Base):
     __tablename__ = "lectures"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False)
@@ -75,10 +100,24 @@ class Lecture(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     updated_by = Column(UUID(as_uuid=True), nullable=False)
 
+    __table_args__ = (
+        # 세션별 일정 범위 조회 (캘린더: session_id IN (수강 세션) AND lecture_date 범위)
+        Index("ix_lectures_session_id_lecture_date", "session_id", "lecture_date"),
+        # 세션 안의 강의 순서는 유일 - DEFERRABLE 이라 한 문장으로 순서를 바꿀 때(맞바꾸기 포함) 문장 끝에서 검사한다
+        UniqueConstraint("session_id", "sequence", name="uq_lectures_session_id_sequence", deferrable=True),
+    )
+
     session = relationship("Session", back_populates="lectures")
     attendances = relationship("Attendance", back_populates="lecture")
 
 class Attendance(Base):
+    """
+    출석 기록 - created_at 기준 월별 RANGE 파티션 테이블
+
+    파티션 키가 PK 에 포함되어야 해서 테이블 PK 는 (id, created_at) 이고, ORM 식별자는 id 하나로 둔다.
+    월 파티션은 ``python -m app.commands.create_attendance_partitions`` 로 미리 만들고,
+    범위 밖의 행은 attendances_default 파티션에 들어간다.
+    """
     __tablename__ = "attendances"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -88,16 +127,57 @@ class Attendance(Base):
     detail_type = Column(String)
     description = Column(Text)
     assignment_id = Column(String)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     created_by = Column(UUID(as_uuid=True), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     updated_by = Column(UUID(as_uuid=True), nullable=False)
 
+    __table_args__ = (
+        # 파티션마다 만들어지는 로컬 인덱스 - id 단건 조회/수정과 강의별·사용자별 조회
+        Index("ix_attendances_id", "id"),
+        Index("ix_attendances_lecture_id_user_id", "lecture_id", "user_id"),
+        Index("ix_attendances_user_id", "user_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    __mapper_args__ = {"eager_defaults": True, "primary_key": [id]}
+
     lecture = relationship("Lecture", back_populates="attendances")
     user = relationship("User", back_populates="attendances")
 
+# create_all 로 만든 빈 DB(테스트 등)에서도 INSERT 가 가능하도록 기본 파티션을 함께 만든다
+event.listen(
+    Attendance.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS attendances_default PARTITION OF attendances DEFAULT").execute_if(dialect="postgresql"),
+)
+
+class AttendanceRollup(Base):
+    """강의별/상태별 출석 집계 (AttendanceCRUD 쓰기 시 증분 갱신)"""
+    __tablename__ = "attendance_rollups"
+
+    lecture_id = Column(UUID(as_uuid=True), ForeignKey("lectures.id"), primary_key=True)
+    status = Column(String, primary_key=True)
+    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False, index=True)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+class AttendanceArchive(Base):
+    """
+    종료된 세션의 출석 보관본 - 세션당 한 행
+
+    출석 행들을 JSONB 배열 하나로 묶어 두어 행/인덱스 오버헤드 없이 TOAST 압축으로 저장된다.
+    ``python -m app.commands.archive_attendances`` 가 attendances 에서 옮겨 온다.
+    """
+    __tablename__ = "attendance_archives"
+
+    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), primary_key=True)
+    rows = Column(JSONB, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
 class Certification(Base):
     __tablename__ = "certifications"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     course_id = Column(UUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
@@ -114,6 +194,7 @@ class Certification(Base):
 
 class Enroll(Base):
     __tablename__ = "enrollments"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -125,5 +206,41 @@ class Enroll(Base):
     updated_by = Column(UUID(as_uuid=True), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
+    __table_args__ = (
+        Index("ix_enrollments_active_created_at", created_at.desc(), postgresql_where=is_active),
+        # 사용자별/세션별 수강 목록 (WHERE user_id|session_id = ? ORDER BY created_at DESC)
+        Index("ix_enrollments_user_id_created_at", "user_id", "created_at"),
+        Index("ix_enrollments_session_id_created_at", "session_id", "created_at"),
+    )
+
     user = relationship("User", back_populates="enrollments")
-    session = relationship("Session", back_populates="enrollments")
\ No newline at end of file
+    session = relationship("Session", back_populates="enrollments")
+
+class RateLimitBucket(Base):
+    """인증 엔드포인트 토큰 버킷 (rate_limit_store=postgres 일 때 워커 간 공유, 유실돼도 되므로 UNLOGGED)"""
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+class RevokedToken(Base):
+    """로그아웃/재발급으로 폐기된 토큰 (만료 전까지만 의미가 있다)"""
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+class IdempotencyKey(Base):
+    """Idempotency-Key 헤더로 받은 POST 요청의 저장된 응답 (status_code 가 NULL 이면 처리 중)"""
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    status_code = Column(Integer)
+    content_type = Column(String)
+    body = Column(LargeBinary)
+    locked_until = Column(DateTime(timezone=True))  # 처리 중인 행의 임대 만료 (지나면 다른 재시도가 가져간다)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,32 +1,44 @@
 from .session import SessionCreate, SessionUpdate, SessionResponse
 from .user import (
-    UserCreate, UserUpdate, UserResponse, UserInfoResponse,
+    UserCreate, UserUpdate, UserResponse, UserInfoResponse, UserListResponse, UserInfoListResponse,
     KakaoLoginRequest, KakaoLoginResponse, GeneralLoginRequest, GeneralLoginResponse,
     GeneralRegisterRequest, GeneralRegisterResponse, KakaoRegisterRequest,
-    KakaoRegisterResponse, UsernameCheckResponse, ManualRegisterRequest, ManualRegisterResponse
+    KakaoRegisterResponse, UsernameCheckResponse, ManualRegisterRequest, ManualRegisterResponse,
+    TokenRefreshRequest, TokenRefreshResponse
 )
 from .course import CourseCreate, CourseUpdate, CourseResponse
-from .lecture import LectureCreate, LectureUpdate, LectureResponse
-from .attendance import AttendanceCreate, AttendanceUpdate, AttendanceResponse
+from .lecture import LectureCreate, LectureUpdate, LectureResponse, LectureCalendarResponse, LectureScheduleCreate
+from .attendance import (
+    AttendanceCreate, AttendanceUpdate, AttendanceResponse, AttendanceListResponse, SessionAttendanceStatsResponse,
+    CheckInRequest, CheckInCodeResponse
+)
 from .certification import CertificationCreate, CertificationUpdate, CertificationResponse
-from .enroll import EnrollCreate, EnrollUpdate, EnrollResponse, EnrollDetailResponse
+from .enroll import EnrollCreate, EnrollUpdate, EnrollResponse, EnrollDetailResponse, EnrollSearchResponse
+from .batch import BatchIdsRequest, BatchResponse
+from .clone import CloneRequest, CourseCloneRequest, SessionCloneRequest, CloneResponse
 
 __all__ = [
     # User
-    "UserCreate", "UserUpdate", "UserResponse", "UserInfoResponse",
+    "UserCreate", "UserUpdate", "UserResponse", "UserInfoResponse", "UserListResponse", "UserInfoListResponse",
     "KakaoLoginRequest", "KakaoLoginResponse", "GeneralLoginRequest", "GeneralLoginResponse",
     "GeneralRegisterRequest", "GeneralRegisterResponse", "KakaoRegisterRequest",
     "KakaoRegisterResponse", "UsernameCheckResponse", "ManualRegisterRequest", "ManualRegisterResponse",
+    "TokenRefreshRequest", "TokenRefreshResponse",
     # Course
     "CourseCreate", "CourseUpdate", "CourseResponse",
     # Session
     "SessionCreate", "SessionUpdate", "SessionResponse",
     # Lecture
-    "LectureCreate", "LectureUpdate", "LectureResponse",
+    "LectureCreate", "LectureUpdate", "LectureResponse", "LectureCalendarResponse", "LectureScheduleCreate",
     # Attendance
-    "AttendanceCreate", "AttendanceUpdate", "AttendanceResponse",
+    "AttendanceCreate", "AttendanceUpdate", "AttendanceResponse", "AttendanceListResponse", "SessionAttendanceStatsResponse",
+    "CheckInRequest", "CheckInCodeResponse",
     # Certification
     "CertificationCreate", "CertificationUpdate", "CertificationResponse",
     # Enroll
-    "EnrollCreate", "EnrollUpdate", "EnrollResponse", "EnrollDetailResponse",
+    "EnrollCreate", "EnrollUpdate", "EnrollResponse", "EnrollDetailResponse", "EnrollSearchResponse",
+    # Batch
+    "BatchIdsRequest", "BatchResponse",
+    # Clone
+    "CloneRequest", "CourseCloneRequest", "SessionCloneRequest", "CloneResponse",
 ]
\ No newline at end of file
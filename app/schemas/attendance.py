@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Optional, Dict, List
 from datetime import datetime
 from uuid import UUID
 
@@ -27,4 +27,44 @@ class AttendanceResponse(AttendanceBase):
     created_at: datetime
     updated_at: datetime
     created_by: UUID
-    updated_by: UUID
\ No newline at end of file
+    updated_by: UUID
+
+class AttendanceListResponse(BaseModel):
+    """출석 목록 항목 - AttendanceResponse 에서 description 을 뺀 것"""
+    model_config = ConfigDict(from_attributes=True)
+
+    status: str
+    detail_type: Optional[str] = None
+    assignment_id: Optional[str] = None
+    id: UUID
+    lecture_id: UUID
+    user_id: UUID
+    created_at: datetime
+    updated_at: datetime
+    created_by: UUID
+    updated_by: UUID
+
+class CheckInRequest(BaseModel):
+    code: str
+
+class CheckInCodeResponse(BaseModel):
+    lecture_id: UUID
+    code: str
+    expires_at: datetime
+
+class LectureAttendanceStats(BaseModel):
+    lecture_id: UUID
+    title: str
+    sequence: int
+    lecture_date: Optional[datetime] = None
+    status_counts: Dict[str, int]
+    total: int
+    attendance_rate: float
+
+class SessionAttendanceStatsResponse(BaseModel):
+    session_id: UUID
+    enrolled_count: int
+    lecture_count: int
+    status_counts: Dict[str, int]
+    attendance_rate: float
+    lectures: List[LectureAttendanceStats]
\ No newline at end of file
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Generic, List, TypeVar
+from uuid import UUID
+
+from ..config import settings
+
+T = TypeVar("T")
+
+class BatchIdsRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=settings.batch_max_ids)
+
+class BatchResponse(BaseModel, Generic[T]):
+    items: List[T]
+    missing: List[UUID]
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+
+class CloneRequest(BaseModel):
+    title: Optional[str] = Field(None, description="Title of the copy, defaults to the original title")
+    shift_days: int = Field(0, ge=-3660, le=3660, description="Days added to begin_date, end_date and lecture_date")
+
+class CourseCloneRequest(CloneRequest):
+    include_inactive: bool = Field(False, description="Also copy soft-deleted sessions")
+
+class SessionCloneRequest(CloneRequest):
+    course_id: Optional[UUID] = Field(None, description="Course of the copy, defaults to the original course")
+
+class CloneResponse(BaseModel):
+    id: UUID
+    session_ids: List[UUID]
+    lecture_count: int
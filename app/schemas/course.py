@@ -30,6 +30,19 @@ class CourseResponse(CourseBase):
 class CourseInfoResponse(CourseBase):
     model_config = ConfigDict(from_attributes=True)
 
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+    author: str
+    lecture_count: int
+
+class CourseInfoListResponse(BaseModel):
+    """강좌 목록 항목 - CourseInfoResponse 에서 description 을 뺀 것"""
+    model_config = ConfigDict(from_attributes=True)
+
+    title: str
+    keyword: Optional[str] = None
+    is_active: bool = True
     id: UUID
     created_at: datetime
     updated_at: datetime
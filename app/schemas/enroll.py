@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -34,4 +34,8 @@ class EnrollDetailResponse(EnrollBase):
     created_at: datetime
     updated_at: datetime
     created_by: UUID
-    updated_by: UUID
\ No newline at end of file
+    updated_by: UUID
+
+class EnrollSearchResponse(BaseModel):
+    items: List[EnrollDetailResponse]
+    total: int
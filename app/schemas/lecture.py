@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from string import Formatter
+from typing import List, Optional
+from datetime import date, datetime, time
 from uuid import UUID
 
 class LectureBase(BaseModel):
@@ -26,4 +27,58 @@ class LectureResponse(LectureBase):
     created_at: datetime
     updated_at: datetime
     created_by: UUID
-    updated_by: UUID
\ No newline at end of file
+    updated_by: UUID
+class LectureCalendarResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    session_id: UUID
+    course_id: UUID
+    title: str
+    sequence: int
+    attendance_type: Optional[str] = None
+    lecture_date: datetime
+    session_title: str
+    course_title: str
+
+class LectureScheduleCreate(BaseModel):
+    """반복 규칙으로 한 세션의 강의들을 한 번에 만든다 (sequence 는 세션의 마지막 강의 다음부터)"""
+    session_id: UUID
+    start_date: date
+    weekdays: List[int] = Field(..., min_length=1, description="0=Monday ... 6=Sunday")
+    count: int = Field(..., ge=1, le=200)
+    title_template: str = Field("{sequence}회차", description="Placeholders: {sequence}, {n} (1-based), {date}")
+    start_time: Optional[time] = Field(None, description="Start time of every lecture (naive = UTC)")
+    attendance_type: Optional[str] = None
+
+    @field_validator("weekdays")
+    @classmethod
+    def check_weekdays(cls, weekdays: List[int]) -> List[int]:
+        if any(day < 0 or day > 6 for day in weekdays):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return sorted(set(weekdays))
+
+    @field_validator("title_template")
+    @classmethod
+    def check_title_template(cls, template: str) -> str:
+        error = ValueError("title_template may only use {sequence}, {n} and {date}")
+        try:
+            fields = list(Formatter().parse(template))
+        except ValueError:
+            raise error
+        for _, name, spec, conversion in fields:
+            if name is None:
+                continue
+            # 속성/인덱스/변환은 허용하지 않고, {sequence} 는 DB 가 채우므로 서식 지정도 {n} 에만 쓸 수 있다
+            if name not in ("sequence", "n", "date") or conversion or (spec and (name != "n" or "{" in spec)):
+                raise error
+        try:
+            template.format(sequence="{sequence}", n=1, date="2026-01-01")
+        except ValueError:
+            raise error
+        return template
+
+
+class LectureReorderRequest(BaseModel):
+    """세션의 모든 강의 id 를 새 순서대로 (sequence 는 1 부터 다시 매긴다)"""
+    lecture_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
@@ -36,6 +36,25 @@ class SessionResponse(SessionBase):
 class SessionDetailResponse(SessionBase):
     model_config = ConfigDict(from_attributes=True)
 
+    id: UUID
+    course_id: UUID
+    course_name: str
+    course_status: str
+    lecture_count: int
+    created_at: datetime
+    updated_at: datetime
+    created_by: UUID
+    updated_by: UUID
+
+class SessionDetailListResponse(BaseModel):
+    """세션 목록 항목 - SessionDetailResponse 에서 description 을 뺀 것"""
+    model_config = ConfigDict(from_attributes=True)
+
+    title: str
+    lecturer_info: Optional[str] = None
+    date_info: Optional[str] = None
+    begin_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     id: UUID
     course_id: UUID
     course_name: str
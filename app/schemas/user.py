@@ -1,8 +1,10 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
 
+from .certification import CertificationResponse
+
 class UserBase(BaseModel):
     username: str
     auth_type: str
@@ -24,6 +26,21 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
+    role: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    last_login: Optional[datetime] = None
+
+class UserListResponse(BaseModel):
+    """사용자 목록 항목 - UserResponse 에서 information 을 뺀 것"""
+    model_config = ConfigDict(from_attributes=True)
+
+    username: str
+    auth_type: str
+    authorizations: Optional[Dict[str, Any]] = None
+    is_active: bool = True
+    id: UUID
+    role: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     last_login: Optional[datetime] = None
@@ -33,6 +50,7 @@ class KakaoLoginRequest(BaseModel):
 
 class KakaoLoginResponse(BaseModel):
     token: str
+    refresh_token: Optional[str] = None
     user: Dict[str, Any]
     requires_registration: bool
 
@@ -42,6 +60,7 @@ class GeneralLoginRequest(BaseModel):
 
 class GeneralLoginResponse(BaseModel):
     token: str
+    refresh_token: Optional[str] = None
     user: Dict[str, Any]
 
 class GeneralRegisterRequest(BaseModel):
@@ -51,6 +70,7 @@ class GeneralRegisterRequest(BaseModel):
 
 class GeneralRegisterResponse(BaseModel):
     token: str
+    refresh_token: Optional[str] = None
     user: Dict[str, Any]
 
 class KakaoRegisterRequest(BaseModel):
@@ -59,8 +79,16 @@ class KakaoRegisterRequest(BaseModel):
 
 class KakaoRegisterResponse(BaseModel):
     token: str
+    refresh_token: Optional[str] = None
     user: Dict[str, Any]
 
+class TokenRefreshRequest(BaseModel):
+    refresh_token: str
+
+class TokenRefreshResponse(BaseModel):
+    token: str
+    refresh_token: str
+
 class UsernameCheckResponse(BaseModel):
     available: bool
     message: str
@@ -80,4 +108,33 @@ class UserInfoResponse(BaseModel):
     username: str
     auth_type: str
     information: Optional[str] = None
-    is_active: bool
\ No newline at end of file
+    is_active: bool
+
+class UserInfoListResponse(BaseModel):
+    """UserInfoResponse 에서 information 을 뺀 목록 항목"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    username: str
+    auth_type: str
+    is_active: bool
+
+class DashboardEnrollment(BaseModel):
+    enroll_id: UUID
+    enroll_status: Optional[str] = None
+    enrolled_at: datetime
+    session_id: UUID
+    session_title: str
+    begin_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    course_status: str
+    course_id: UUID
+    course_name: str
+    lecture_count: int
+    attended_count: int
+    attendance_rate: float
+
+class UserDashboardResponse(BaseModel):
+    user_id: UUID
+    enrollments: List[DashboardEnrollment]
+    certifications: List[CertificationResponse]
\ No newline at end of file
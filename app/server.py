@@ -0,0 +1,45 @@
+"""운영용 서버 실행
+
+Settings(host, port, workers, timeout_*, backlog)를 읽어 uvicorn 워커 프로세스를 띄운다.
+각 워커는 app.database 를 따로 import 하므로 자신만의 커넥션 풀을 가지며,
+db_connection_budget 이 설정되어 있으면 워커 수로 나눈 크기로 풀이 만들어진다.
+
+Usage:
+    python -m app.server [--workers N] [--host HOST] [--port PORT]
+"""
+import argparse
+import os
+
+import uvicorn
+
+from .config import settings, worker_count
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run the STG Academy API server")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=worker_count())
+    args = parser.parse_args(argv)
+
+    # debug 모드는 단일 프로세스 + 자동 리로드
+    workers = 1 if settings.debug else max(1, args.workers)
+
+    # 워커 프로세스가 같은 값으로 풀 크기를 계산하도록 환경변수로 전달
+    os.environ["WORKERS"] = str(workers)
+
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        reload=settings.debug,
+        timeout_keep_alive=settings.timeout_keep_alive,
+        timeout_graceful_shutdown=settings.timeout_graceful_shutdown,
+        backlog=settings.backlog,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
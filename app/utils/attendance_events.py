@@ -0,0 +1,160 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..crud.attendance import ATTENDANCE_CHANNEL
+from ..crud.base import fetch_by_ids
+from ..database import SessionLocal, engine
+from ..models.user import Attendance
+from ..schemas.attendance import AttendanceResponse
+
+logger = logging.getLogger(__name__)
+
+
+def load_changes(ids_by_lecture: Dict[UUID, Set[UUID]]) -> Dict[UUID, list]:
+    """알림으로 받은 출석 id 들을 한 번의 쿼리로 읽어 강의별 JSON 문자열 목록으로 변환"""
+    ids = [i for lecture_ids in ids_by_lecture.values() for i in lecture_ids]
+    with SessionLocal() as db:
+        rows, _ = fetch_by_ids(db, Attendance, ids)
+
+    events = defaultdict(list)
+    for row in rows:
+        events[row.lecture_id].append(AttendanceResponse.model_validate(row).model_dump_json())
+    return events
+
+
+class AttendanceBroadcaster:
+    """
+    워커당 LISTEN 커넥션 하나로 출석 변경 알림을 받아 강의별 구독자에게 전달
+
+    여러 알림은 coalesce_ms 동안 모아 한 번만 조회하고, 구독자가 있는 강의의 행만 읽는다.
+    구독자 큐가 가득 차면(느린 클라이언트) 해당 구독을 끊어 재접속하게 한다.
+    """
+
+    def __init__(self, coalesce_ms: int = 50, queue_size: int = 100) -> None:
+        self.coalesce = coalesce_ms / 1000
+        self.queue_size = queue_size
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = defaultdict(set)
+        self._pending: Dict[UUID, Set[UUID]] = defaultdict(set)
+        self._connection = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def subscribe(self, lecture_id: UUID):
+        """강의 하나의 변경 행(JSON 문자열)을 받는 큐. 연결이 끊기면 None 이 들어온다."""
+        await self.listen()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[lecture_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[lecture_id].discard(queue)
+            if not self._subscribers[lecture_id]:
+                del self._subscribers[lecture_id]
+
+    async def stream(self, lecture_id: UUID, heartbeat_seconds: float):
+        """``text/event-stream`` 본문. 변경 행은 ``event: attendance``, 유휴 시에는 주석 heartbeat."""
+        async with self.subscribe(lecture_id) as queue:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    row = await asyncio.wait_for(queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if row is None:
+                    break
+                yield f"event: attendance\ndata: {row}\n\n"
+
+    async def stop(self) -> None:
+        self._disconnect()
+
+    async def listen(self) -> None:
+        """LISTEN 커넥션이 없으면 연다 (DB 에 연결할 수 없으면 예외)"""
+        async with self._lock:
+            if self._connection is None:
+                self._connection = await run_in_threadpool(self._connect)
+                asyncio.get_running_loop().add_reader(self._connection.fileno(), self._on_readable)
+
+    @staticmethod
+    def _connect():
+        # 풀 밖의 전용 커넥션 (풀 슬롯을 영구 점유하지 않도록)
+        cargs, cparams = engine.dialect.create_connect_args(engine.url)
+        connection = engine.dialect.connect(*cargs, **cparams)
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {ATTENDANCE_CHANNEL}")
+        return connection
+
+    def _disconnect(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._connection is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._connection.fileno())
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._close(queue)
+
+    def _on_readable(self) -> None:
+        try:
+            self._connection.poll()
+        except Exception:
+            logger.warning("Attendance listener connection lost", exc_info=True)
+            self._disconnect()
+            return
+
+        while self._connection.notifies:
+            notify = self._connection.notifies.pop(0)
+            try:
+                payload = json.loads(notify.payload)
+                lecture_id = UUID(payload["lecture_id"])
+                attendance_id = UUID(payload["id"])
+            except (ValueError, KeyError, TypeError):
+                continue
+            if lecture_id in self._subscribers:
+                self._pending[lecture_id].add(attendance_id)
+
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.coalesce, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, defaultdict(set)
+        try:
+            events = await run_in_threadpool(load_changes, pending)
+        except Exception:
+            logger.warning("Failed to load attendance changes", exc_info=True)
+            return
+
+        for lecture_id, rows in events.items():
+            for queue in list(self._subscribers.get(lecture_id, ())):
+                try:
+                    for row in rows:
+                        queue.put_nowait(row)
+                except asyncio.QueueFull:
+                    self._subscribers[lecture_id].discard(queue)
+                    self._close(queue)
+
+    @staticmethod
+    def _close(queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
@@ -1,4 +1,3 @@
-import json
 import bcrypt
 from typing import List, Optional
 from uuid import UUID
@@ -11,50 +10,84 @@ from starlette import status
 from app.crud import UserCRUD
 from app.database import get_db
 from app.models import User
-from app.utils.security import verify_token, create_access_token
+from app.utils.revocation import revoked_tokens
+from app.utils.security import verify_token, create_access_token, create_refresh_token
 
 security = HTTPBearer()
 
 
-def get_current_user(
+class TokenUser:
+    """access 토큰 클레임(sub, role, active)만으로 만든 요청 사용자 - DB 조회 없이 권한 검사에 쓴다"""
+
+    def __init__(self, id: UUID, role: str, is_active: bool = True):
+        self.id = id
+        self.role = role
+        self.is_active = is_active
+
+
+def _invalid_token(detail: str = "Invalid token") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_access_payload(
         credentials: HTTPAuthorizationCredentials = Depends(security),
         db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    payload = verify_token(token)
+) -> dict:
+    """검증된 access 토큰 클레임 (refresh/임시 토큰, 폐기된 토큰은 401)"""
+    payload = verify_token(credentials.credentials)
 
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if payload is None or payload.get("sub") is None or payload.get("type", "access") != "access":
+        raise _invalid_token()
+
+    if payload.get("jti") and revoked_tokens.is_revoked(db, payload["jti"]):
+        raise _invalid_token("Token revoked")
+
+    return payload
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    user = UserCRUD.get_user(db, UUID(user_id))
+def get_current_user(
+        payload: dict = Depends(get_access_payload),
+        db: Session = Depends(get_db)
+) -> User:
+    user = UserCRUD.get_user(db, UUID(payload["sub"]))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token("User not found")
 
     return user
 
 
+def get_token_user(
+        payload: dict = Depends(get_access_payload),
+        db: Session = Depends(get_db)
+) -> TokenUser:
+    """토큰 클레임의 사용자. role 클레임이 없는 (이전에 발급된) 토큰만 DB 에서 읽는다."""
+    if "role" in payload:
+        return TokenUser(UUID(payload["sub"]), payload["role"], payload.get("active", True))
+
+    user = get_current_user(payload, db)
+    return TokenUser(user.id, get_user_role(user), user.is_active)
+
+
+def create_user_tokens(user: User) -> dict:
+    """로그인/회원가입 응답용 access 토큰(역할/활성 클레임 포함)과 refresh 토큰"""
+    return {
+        "token": create_access_token(data={
+            "sub": str(user.id),
+            "type": "access",
+            "role": get_user_role(user),
+            "active": bool(user.is_active),
+        }),
+        "refresh_token": create_refresh_token(user.id),
+    }
+
+
 def get_user_role(user: User) -> str:
-    """사용자의 역할을 추출"""
-    if user.authorizations:
-        auth_data = user.authorizations if isinstance(user.authorizations, dict) else json.loads(user.authorizations)
-        return auth_data.get("role", "user")
-    return "user"
+    """사용자의 역할 (authorizations.role 과 동기화되는 role 컬럼)"""
+    return user.role or "user"
 
 
 def check_user_role(required_roles: List[str]):
@@ -65,10 +98,14 @@ def check_user_role(required_roles: List[str]):
         required_roles: 허용할 역할 리스트 (예: ["admin"] 또는 ["admin", "user"])
     """
 
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        user_role = get_user_role(current_user)
+    def role_checker(current_user: TokenUser = Depends(get_token_user)) -> TokenUser:
+        if not current_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="비활성화된 사용자입니다"
+            )
 
-        if user_role not in required_roles:
+        if current_user.role not in required_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"접근 권한이 없습니다. 필요한 권한: {', '.join(required_roles)}"
@@ -97,11 +134,7 @@ def get_temp_user(
     payload = verify_token(token)
 
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_token()
 
     # 임시 토큰인지 확인
     if payload.get("type") != "temp":
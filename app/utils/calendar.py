@@ -0,0 +1,134 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+
+from ..config import settings
+
+CalendarKey = Tuple[UUID, datetime, datetime]
+
+
+class CalendarCache:
+    """
+    사용자별 강의 캘린더의 워커 메모리 캐시 (ETag 포함)
+
+    같은 워커의 강의/수강 변경은 invalidate 로 즉시 반영되고, 다른 워커의 변경은 ttl_seconds 안에 반영된다.
+    항목 수는 max_entries 로 제한한다 (오래 쓰이지 않은 것부터 삭제).
+    """
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CalendarKey, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CalendarKey) -> Optional[Tuple[str, List[dict]]]:
+        """(etag, events) 또는 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def put(self, key: CalendarKey, events: List[dict]) -> str:
+        """events 를 저장하고 그 ETag 를 돌려준다"""
+        etag = calendar_etag(events)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), etag, events)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return etag
+
+    def invalidate(self, user_id: Optional[UUID] = None) -> None:
+        """한 사용자(수강 변경) 또는 전체(강의 변경)의 캐시를 비운다"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == user_id]:
+                    del self._entries[key]
+
+
+def schedule_dates(start_date: date, weekdays: List[int], count: int, at: Optional[day_time] = None) -> List[datetime]:
+    """start_date 부터 weekdays(0=월요일) 에 해당하는 날짜 count 개의 at 시각 (시간대가 없으면 UTC)"""
+    at = at or day_time()
+    tzinfo = at.tzinfo or timezone.utc
+    days, day = [], start_date
+    while len(days) < count:
+        if day.weekday() in weekdays:
+            days.append(datetime.combine(day, at.replace(tzinfo=None), tzinfo=tzinfo))
+        day += timedelta(days=1)
+    return days
+
+
+def calendar_etag(events: List[dict]) -> str:
+    body = json.dumps(jsonable_encoder(events), sort_keys=True, separators=(",", ":")).encode()
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _ics_text(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ics_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> str:
+    """RFC 5545 - 75 옥텟 넘는 줄은 CRLF + 공백으로 접는다"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+    parts, current = [], b""
+    for char in line:
+        size = len(char.encode())
+        if len(current) + size > (75 if not parts else 74):
+            parts.append(current.decode())
+            current = b""
+        current += char.encode()
+    parts.append(current.decode())
+    return "\r\n ".join(parts)
+
+
+def to_ics(events: List[dict], name: str = "STG Academy") -> str:
+    """캘린더 이벤트 목록을 iCalendar(VCALENDAR) 문서로 변환"""
+    stamp = _ics_time(datetime.now(timezone.utc))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//STG Academy//Lecture Calendar//KO",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_text(name)}",
+    ]
+    for event in events:
+        description = f"{event['course_title']} / {event['session_title']} #{event['sequence']}"
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{event['id']}@stg-academy",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{_ics_time(event['lecture_date'])}",
+            f"SUMMARY:{_ics_text(event['title'])}",
+            f"DESCRIPTION:{_ics_text(description)}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
+
+
+calendar_cache = CalendarCache(ttl_seconds=settings.calendar_cache_seconds)
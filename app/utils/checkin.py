@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import hmac
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..config import settings
+from ..crud import AttendanceCRUD
+from ..database import SessionLocal
+
+
+def _window(at: Optional[float] = None) -> int:
+    return int((time.time() if at is None else at) // settings.checkin_code_ttl_seconds)
+
+
+def _code_for(lecture_id: UUID, window: int) -> str:
+    digest = hmac.new(settings.secret_key.encode(), f"{lecture_id}:{window}".encode(), hashlib.sha256).digest()
+    return f"{int.from_bytes(digest[:4], 'big') % 1_000_000:06d}"
+
+
+def create_checkin_code(lecture_id: UUID, at: Optional[float] = None) -> Tuple[str, datetime]:
+    """
+    강의 자가 출석용 6자리 코드 발급 (DB 저장 없이 secret_key 로 서명)
+
+    Returns:
+        (코드, 만료 시각). 코드는 발급된 구간과 다음 구간 동안 유효하다.
+    """
+    window = _window(at)
+    expires_at = datetime.fromtimestamp((window + 2) * settings.checkin_code_ttl_seconds, tz=timezone.utc)
+    return _code_for(lecture_id, window), expires_at
+
+
+def verify_checkin_code(lecture_id: UUID, code: str, at: Optional[float] = None) -> bool:
+    """현재 구간 또는 직전 구간에 발급된 코드인지 확인"""
+    window = _window(at)
+    return any(hmac.compare_digest(code, _code_for(lecture_id, w)) for w in (window, window - 1))
+
+
+def flush_check_ins(check_ins: List[Dict]) -> list:
+    """배치 하나를 별도 세션에서 한 번의 INSERT 와 커밋으로 기록"""
+    with SessionLocal() as db:
+        return AttendanceCRUD.check_in_many(db, check_ins)
+
+
+class CheckInBatcher:
+    """
+    자가 출석 요청을 모아 마이크로 배치로 기록
+
+    첫 요청이 들어온 뒤 max_delay_ms 가 지나거나 max_size 만큼 쌓이면 flush 를 스레드풀에서 한 번 호출한다.
+    submit 은 자신이 포함된 배치가 커밋될 때까지 기다렸다가 해당 결과를 돌려준다.
+    """
+
+    def __init__(self, flush: Callable[[List[Dict]], list], max_size: int = 200, max_delay_ms: int = 10) -> None:
+        self.flush = flush
+        self.max_size = max_size
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Future] = None
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._full = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # 이미 스레드풀에서 실행 중인 flush 는 커밋했을 수 있으므로 끝까지 기다려 결과를 전달한다
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        pending = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("Check-in batcher stopped"))
+
+    async def submit(self, check_in: Dict):
+        if self._task is None:
+            raise RuntimeError("Check-in batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((check_in, future))
+        if self._queue.qsize() >= self.max_size - 1:
+            self._full.set()
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                if self._queue.qsize() < self.max_size - 1:
+                    self._full.clear()
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._full.wait(), self.max_delay)
+                while len(batch) < self.max_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Check-in batcher stopped"))
+                raise
+            # 취소가 flush 까지 끊지 않도록 shield 한다 (남은 flush 는 stop 이 기다린다)
+            self._flushing = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+
+    async def _flush(self, batch: list) -> None:
+        try:
+            results = await run_in_threadpool(self.flush, [check_in for check_in, _ in batch])
+        except Exception as exc:
+            self._fail(batch, exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: list, exc: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
@@ -0,0 +1,71 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        body = self.compressor.process(body)
+        if not more_body:
+            body += self.compressor.finish()
+        return body
+
+
+def parse_accept_encoding(value: str) -> dict:
+    """``"gzip, br;q=0.8, *;q=0"`` -> ``{"gzip": 1.0, "br": 0.8, "*": 0.0}``"""
+    encodings = {}
+    for item in value.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name.strip().lower()] = q
+    return encodings
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 후 br(설치된 경우) 또는 gzip 으로 응답 압축
+
+    minimum_size 미만의 응답, 이미 Content-Encoding 이 있는 응답, SSE 는 그대로 전달한다.
+    스트리밍 응답은 청크 단위로 압축된다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = parse_accept_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+
+        responder: ASGIApp
+        if brotli is not None and accepted.get("br", 0) > 0 and accepted["br"] >= accepted.get("gzip", 0):
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif accepted.get("gzip", 0) > 0:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -0,0 +1,81 @@
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+
+class DefaultFields(list):
+    """``?fields=`` 가 없을 때 쓰는 목록 스키마의 필드 - 응답은 endpoint 의 response_model 로 직렬화한다"""
+
+
+def field_selector(response_model: Type[BaseModel], list_model: Optional[Type[BaseModel]] = None):
+    """
+    ``?fields=id,title`` 쿼리 파라미터를 검증하는 dependency
+
+    Args:
+        response_model: 선택 가능한 필드를 정의하는 응답 스키마
+        list_model: fields 미지정 시의 응답 스키마 (목록 조회에서 큰 Text 컬럼을 뺀 것, endpoint 의 response_model)
+
+    Returns:
+        요청된 필드 목록. 파라미터가 없으면 list_model 의 필드(DefaultFields), list_model 도 없으면 None.
+        스키마에 없는 필드는 400.
+    """
+    defaults = list(list_model.model_fields) if list_model is not None else None
+
+    def selector(
+            fields: Optional[str] = Query(
+                None, description=f"Comma-separated subset of: {', '.join(response_model.model_fields)}"
+            )
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return DefaultFields(defaults) if defaults is not None else None
+
+        requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in response_model.model_fields]
+        if not requested or unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown) or '(empty)'}"
+            )
+        return requested
+
+    return selector
+
+
+def load_only_fields(model, fields: Optional[List[str]], *required: str) -> list:
+    """Query options loading only the mapped columns among ``fields`` (plus ``required``).
+
+    Names that are not columns of ``model`` (joined or computed values) are ignored here;
+    the primary key is always loaded.
+    """
+    if fields is None:
+        return []
+
+    mapper = inspect(model).mapper  # aliased() 엔티티도 받는다
+    columns = mapper.column_attrs.keys()
+    names = [name for name in dict.fromkeys([*fields, *required]) if name in columns]
+    if not names:
+        names = [column.key for column in mapper.primary_key]
+    return [load_only(*[getattr(model, name) for name in names])]
+
+
+def render_fields(data: Any, fields: Optional[List[str]]):
+    """Return ``data`` untouched, or only the explicitly requested ``fields`` of each item.
+
+    ``DefaultFields`` also returns ``data`` untouched so the endpoint's list ``response_model``
+    validates and serialises it.
+    """
+    if fields is None or isinstance(fields, DefaultFields):
+        return data
+
+    def pick(item):
+        if isinstance(item, dict):
+            return {field: item.get(field) for field in fields}
+        return {field: getattr(item, field, None) for field in fields}
+
+    content = [pick(item) for item in data] if isinstance(data, list) else pick(data)
+    return JSONResponse(content=jsonable_encoder(content))
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..database import engine
+from ..models.user import IdempotencyKey
+from .security import verify_token
+
+HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+PURGE_EVERY = 1000
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: Optional[int]  # None = 첫 요청이 아직 처리 중
+    content_type: Optional[str]
+    body: Optional[bytes]
+
+
+class MemoryIdempotencyStore:
+    """워커 프로세스 안의 저장소 (다른 워커로 간 재시도는 알아보지 못한다)"""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def reserve(self, key: str, fingerprint: str, lock_seconds: int) -> Optional[StoredResponse]:
+        """키를 선점한다. 선점했으면 None, 아니면 이미 저장된(또는 처리 중인) 응답.
+
+        처리 중인 키는 lock_seconds 동안만 유지되므로, 완료/해제 없이 죽은 요청의 키는 그 뒤 다시 선점된다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            if self._calls % PURGE_EVERY == 0:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            self._entries[key] = (now + lock_seconds, StoredResponse(fingerprint, None, None, None))
+            return None
+
+    def complete(self, key: str, status_code: int, content_type: Optional[str], body: bytes, ttl_seconds: int) -> None:
+        """응답을 저장하고 키를 ttl_seconds 동안 유지한다"""
+        with self._lock:
+            _, stored = self._entries.get(key, (None, None))
+            if stored is not None:
+                self._entries[key] = (
+                    time.monotonic() + ttl_seconds,
+                    stored._replace(status_code=status_code, content_type=content_type, body=body),
+                )
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class PostgresIdempotencyStore:
+    """
+    ``idempotency_keys`` 테이블 저장소 (모든 워커가 공유)
+
+    선점은 ``INSERT ... ON CONFLICT`` 한 번으로 하고(만료된 키와 locked_until 이 지난 처리 중 키는 덮어쓴다),
+    선점하지 못했을 때만 저장된 행을 읽는다. 처리 중인 행은 짧은 임대(locked_until)만 갖고,
+    expires_at 은 complete 에서 전체 TTL 로 늘린다.
+    """
+
+    def __init__(self) -> None:
+        self._calls = 0
+
+    def reserve(self, key: str, fingerprint: str, lock_seconds: int) -> Optional[StoredResponse]:
+        table = IdempotencyKey.__table__
+        lease = func.now() + timedelta(seconds=lock_seconds)
+        stmt = insert(table).values(key=key, fingerprint=fingerprint, locked_until=lease, expires_at=lease)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "status_code": None,
+                "content_type": None,
+                "body": None,
+                "locked_until": stmt.excluded.locked_until,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=or_(
+                table.c.expires_at <= func.now(),
+                and_(table.c.status_code.is_(None), table.c.locked_until <= func.now()),
+            ),
+        ).returning(table.c.key)
+
+        self._calls += 1
+        with engine.begin() as connection:
+            if connection.execute(stmt).first() is not None:
+                if self._calls % PURGE_EVERY == 0:
+                    connection.execute(delete(table).where(table.c.expires_at <= func.now()))
+                return None
+            row = connection.execute(
+                select(table.c.fingerprint, table.c.status_code, table.c.content_type, table.c.body)
+                .where(table.c.key == key)
+            ).first()
+        # 그 사이 지워졌다면 처리 중으로 보고 재시도하게 한다
+        return StoredResponse(*row) if row is not None else StoredResponse(fingerprint, None, None, None)
+
+    def complete(self, key: str, status_code: int, content_type: Optional[str], body: bytes, ttl_seconds: int) -> None:
+        table = IdempotencyKey.__table__
+        with engine.begin() as connection:
+            connection.execute(
+                table.update().where(table.c.key == key, table.c.status_code.is_(None))
+                .values(
+                    status_code=status_code, content_type=content_type, body=body, locked_until=None,
+                    expires_at=func.now() + timedelta(seconds=ttl_seconds),
+                )
+            )
+
+    def release(self, key: str) -> None:
+        table = IdempotencyKey.__table__
+        with engine.begin() as connection:
+            connection.execute(delete(table).where(table.c.key == key))
+
+
+def create_idempotency_store(kind: str):
+    if kind == "postgres":
+        return PostgresIdempotencyStore()
+    return MemoryIdempotencyStore()
+
+
+class IdempotencyMiddleware:
+    """
+    ``Idempotency-Key`` 헤더가 있는 POST 요청의 응답을 저장해 두었다가 재시도에 그대로 돌려준다
+
+    paths 에 등록한 라우트(경로 템플릿)에만 적용되고, 키는 토큰의 사용자(sub)와 경로별로 나뉜다.
+    재시도는 라우트/CRUD 를 거치지 않고 저장된 응답(``Idempotent-Replayed: true``)으로 끝난다.
+    같은 키에 다른 본문이면 422, 첫 요청이 아직 처리 중이면 409. 5xx 와 예외는 저장하지 않는다.
+    처리 중 표시는 lock_seconds 만 유효해서, 워커가 죽어 해제되지 못한 키도 그 뒤에는 재시도할 수 있다.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str], ttl_seconds: int = 86400, lock_seconds: int = 30) -> None:
+        self.app = app
+        self.patterns = [compile_path(path)[0] for path in paths]
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or not any(
+            pattern.match(scope["path"]) for pattern in self.patterns
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(HEADER)
+        payload = _bearer_payload(headers)
+        if idempotency_key is None or payload is None or "sub" not in payload:
+            # 인증 실패는 라우트가 401 로 처리한다
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _send_json(send, 400, {"detail": "Invalid Idempotency-Key"})
+            return
+
+        body = await _read_body(receive)
+        key = f"{payload['sub']}:{scope['path']}:{idempotency_key}"
+        fingerprint = hashlib.sha256(body).hexdigest()
+        store = scope["app"].state.idempotency_store
+
+        stored = await self._call(store, store.reserve, key, fingerprint, self.lock_seconds)
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await _send_json(send, 422, {"detail": "Idempotency-Key was used with a different request"})
+            elif stored.status_code is None:
+                await _send_json(send, 409, {"detail": "A request with this Idempotency-Key is in progress"})
+            else:
+                await _send(send, stored.status_code, stored.content_type, stored.body or b"", replayed=True)
+            return
+
+        response: Dict = {"status": 500, "content_type": None, "body": []}
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["content_type"] = Headers(raw=message["headers"]).get("content-type")
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, _replay(body, receive), capture)
+        except BaseException:
+            await self._call(store, store.release, key)
+            raise
+
+        if response["status"] >= 500:
+            await self._call(store, store.release, key)
+        else:
+            await self._call(
+                store, store.complete, key, response["status"], response["content_type"], b"".join(response["body"]),
+                self.ttl_seconds,
+            )
+
+    @staticmethod
+    async def _call(store, method, *args):
+        if isinstance(store, MemoryIdempotencyStore):
+            return method(*args)
+        return await run_in_threadpool(method, *args)
+
+
+def _bearer_payload(headers: Headers) -> Optional[dict]:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return verify_token(token)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+async def _send(send: Send, status_code: int, content_type: Optional[str], body: bytes, replayed: bool = False) -> None:
+    headers = [(b"content-length", str(len(body)).encode())]
+    if content_type:
+        headers.append((b"content-type", content_type.encode()))
+    if replayed:
+        headers.append((b"idempotent-replayed", b"true"))
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send: Send, status_code: int, content: dict) -> None:
+    await _send(send, status_code, "application/json", json.dumps(content).encode())
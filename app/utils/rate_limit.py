@@ -0,0 +1,148 @@
+import math
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ..config import settings
+from ..database import engine
+from ..models.user import RateLimitBucket
+
+# 1분 이상 쓰이지 않은 버킷은 가득 찬 상태와 같으므로 지워도 된다
+IDLE_SECONDS = 60
+PURGE_EVERY = 1000
+
+
+class MemoryRateLimitStore:
+    """워커 프로세스 안의 토큰 버킷 (워커마다 따로 센다)"""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def take(self, key: str, per_minute: int) -> float:
+        """토큰 하나를 쓴다. 허용되면 0, 아니면 다음 토큰까지 기다릴 초."""
+        rate = per_minute / 60
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            if self._calls % PURGE_EVERY == 0:
+                self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < IDLE_SECONDS}
+
+            tokens, updated_at = self._buckets.get(key, (per_minute, now))
+            tokens = min(per_minute, tokens + (now - updated_at) * rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / rate
+
+
+class PostgresRateLimitStore:
+    """
+    ``rate_limit_buckets`` 테이블의 토큰 버킷 (모든 워커가 공유)
+
+    보충/차감을 한 번의 ``INSERT ... ON CONFLICT DO UPDATE ... WHERE ... RETURNING`` 으로 처리하고 바로 커밋한다.
+    거절될 때만 남은 토큰을 한 번 더 읽어 Retry-After 를 계산한다.
+    요청 트랜잭션과 분리되어 있어 로그인이 실패해도 차감이 남는다.
+    """
+
+    def __init__(self) -> None:
+        self._calls = 0
+
+    def take(self, key: str, per_minute: int) -> float:
+        rate = per_minute / 60
+        bucket = RateLimitBucket.__table__
+        refilled = func.least(
+            per_minute, bucket.c.tokens + func.extract("epoch", func.now() - bucket.c.updated_at) * rate
+        )
+
+        # 보충한 토큰이 1개 이상일 때만 차감한다. 잠긴 최신 행에 WHERE 가 평가되므로
+        # 행이 돌아오면 허용, 돌아오지 않으면 거절 (버킷은 그대로 둔다)
+        stmt = insert(bucket).values(key=key, tokens=per_minute - 1, updated_at=func.now())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[bucket.c.key],
+            set_={"tokens": refilled - 1, "updated_at": func.now()},
+            where=refilled >= 1,
+        ).returning(bucket.c.tokens)
+
+        self._calls += 1
+        with engine.begin() as connection:
+            allowed = connection.execute(stmt).first() is not None
+            tokens = None if allowed else connection.execute(select(refilled).where(bucket.c.key == key)).scalar()
+            if self._calls % PURGE_EVERY == 0:
+                connection.execute(
+                    delete(bucket).where(bucket.c.updated_at < func.now() - timedelta(seconds=IDLE_SECONDS))
+                )
+        if allowed:
+            return 0.0
+        # 거절과 조회 사이에 토큰이 보충됐더라도 거절은 유지한다
+        return (1 - tokens) / rate if tokens < 1 else 1 / rate
+
+
+def create_rate_limit_store(kind: str):
+    if kind == "postgres":
+        return PostgresRateLimitStore()
+    return MemoryRateLimitStore()
+
+
+def rate_limit(route: str):
+    """
+    라우트별 토큰 버킷 dependency (클라이언트 IP, 그리고 요청 본문의 username 기준)
+
+    Args:
+        route: ``rate_limit_<route>_per_minute`` 설정 이름에 쓰일 라우트 이름
+
+    한도를 넘으면 엔드포인트 본문(bcrypt, 외부 API 호출)이 실행되기 전에 429 와 Retry-After 로 거절한다.
+    """
+    setting = f"rate_limit_{route}_per_minute"
+
+    async def limiter(request: Request) -> None:
+        per_minute = getattr(settings, setting)
+        if not settings.rate_limit_enabled or per_minute <= 0:
+            return
+
+        keys = [f"{route}:ip:{request.client.host if request.client else 'unknown'}"]
+        username = await _body_username(request)
+        if username:
+            keys.append(f"{route}:user:{username.lower()}")
+        await enforce_rate_limit(request, keys, per_minute)
+
+    return limiter
+
+
+async def enforce_rate_limit(request: Request, keys: List[str], per_minute: int) -> None:
+    """keys 마다 토큰 하나씩 쓰고, 하나라도 모자라면 429 와 Retry-After 로 거절"""
+    if not settings.rate_limit_enabled or per_minute <= 0:
+        return
+
+    store = request.app.state.rate_limit_store
+    retry_after = 0.0
+    for key in keys:
+        if isinstance(store, MemoryRateLimitStore):
+            wait = store.take(key, per_minute)
+        else:
+            wait = await run_in_threadpool(store.take, key, per_minute)
+        retry_after = max(retry_after, wait)
+
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def _body_username(request: Request) -> Optional[str]:
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    username = body.get("username") if isinstance(body, dict) else None
+    return username if isinstance(username, str) else None
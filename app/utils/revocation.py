@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Set
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.user import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    폐기된 토큰 jti 의 워커 메모리 사본
+
+    매 요청은 메모리 set 만 확인하고, revocation_refresh_seconds 마다 한 번 만료되지 않은 jti 를
+    다시 읽어 다른 워커에서 폐기된 토큰도 반영한다. 같은 워커에서 폐기한 토큰은 즉시 반영된다.
+    """
+
+    def __init__(self) -> None:
+        self._jtis: Set[str] = set()
+        self._loaded_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        if time.monotonic() - self._loaded_at >= settings.revocation_refresh_seconds:
+            self._reload(db)
+        return jti in self._jtis
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> None:
+        db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        db.commit()
+        self._jtis.add(jti)
+
+    def claim(self, db: Session, jti: str, expires_at: datetime) -> bool:
+        """jti 를 DB 에 폐기로 기록하고 커밋. 이미 폐기된 jti 면 False (일회용 토큰의 사용 여부를 원자적으로 판정)."""
+        claimed = db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        ).first()
+        db.commit()
+        self._jtis.add(jti)
+        return claimed is not None
+
+    def _reload(self, db: Session) -> None:
+        with self._lock:
+            if time.monotonic() - self._loaded_at < settings.revocation_refresh_seconds:
+                return
+            try:
+                rows = db.query(RevokedToken.jti).filter(RevokedToken.expires_at > func.now()).all()
+            except SQLAlchemyError:
+                # DB 를 읽지 못하면 다음 주기까지 기존 목록으로 판단한다
+                logger.warning("Failed to reload revoked tokens", exc_info=True)
+                db.rollback()
+                self._loaded_at = time.monotonic()
+                return
+            self._jtis = {jti for jti, in rows}
+            self._loaded_at = time.monotonic()
+
+
+def token_expiry(payload: dict) -> datetime:
+    return datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+
+revoked_tokens = RevocationList()
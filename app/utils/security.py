@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import uuid4
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from ..config import settings
@@ -24,9 +25,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
+def create_refresh_token(user_id) -> str:
+    """access 토큰 재발급 전용 토큰 (역할 클레임 없음, 사용 시 DB 에서 사용자 상태를 다시 읽는다)"""
+    return create_access_token(
+        data={"sub": str(user_id), "type": "refresh"},
+        expires_delta=timedelta(days=settings.refresh_token_expire_days)
+    )
+
 def verify_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
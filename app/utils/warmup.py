@@ -0,0 +1,116 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..config import settings
+from ..crud import AttendanceCRUD, CourseCRUD, LectureCRUD, SessionCRUD, UserCRUD
+from ..database import SessionLocal, engine, pool_limits
+
+logger = logging.getLogger(__name__)
+
+# 준비 상태 점검 전용 스레드 (막힌 체크아웃이 쌓이지 않도록 하나만 둔다)
+_probe = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness")
+
+# 기동 시 실패한 예열의 재시도 (한 번에 하나만 돌고, /ready 는 기다리지 않는다)
+_rewarm = ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup")
+_rewarming: Optional[Future] = None
+
+
+def warm_up(connections: int) -> bool:
+    """
+    풀 커넥션을 미리 열고 주요 CRUD 경로를 한 번씩 실행
+
+    Args:
+        connections: 미리 열어둘 커넥션 수 (pool_size 로 제한)
+
+    Returns:
+        성공 여부. DB 에 연결할 수 없으면 경고만 남기고 False.
+    """
+    try:
+        opened = [engine.connect() for _ in range(min(connections, engine.pool.size()))]
+        for connection in opened:
+            connection.execute(text("SELECT 1"))
+        for connection in opened:
+            connection.close()
+
+        # 매퍼 설정, 쿼리 컴파일 캐시 등 첫 요청 비용을 미리 지불
+        db = SessionLocal()
+        try:
+            CourseCRUD.get_courses(db, limit=1)
+            SessionCRUD.get_sessions_with_details(db, limit=1)
+            LectureCRUD.get_lectures(db, limit=1)
+            AttendanceCRUD.get_attendances_by_lecture(db, uuid4(), limit=1)
+            UserCRUD.get_user(db, uuid4())
+        finally:
+            db.close()
+    except SQLAlchemyError as e:
+        logger.warning("Warmup failed: %s", e)
+        return False
+
+    return True
+
+
+def retry_warm_up(connections: int) -> bool:
+    """
+    예열을 백그라운드에서 다시 시도하고 기다리지 않는다
+
+    Returns:
+        이전에 시작한 재시도가 끝나 성공했으면 True. 진행 중이면 False, 실패했으면 새로 시작하고 False.
+    """
+    global _rewarming
+    if _rewarming is not None and _rewarming.done():
+        if _rewarming.exception() is None and _rewarming.result():
+            return True
+        _rewarming = None
+    if _rewarming is None:
+        _rewarming = _rewarm.submit(warm_up, connections)
+    return False
+
+
+def pool_usage() -> dict:
+    capacity = sum(pool_limits())
+    checked_out = engine.pool.checkedout()
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "usage": checked_out / capacity if capacity else 1.0,
+    }
+
+
+def _ping() -> None:
+    with engine.connect() as connection:
+        # SET LOCAL 은 커넥션을 반납할 때(롤백) 함께 사라진다
+        connection.execute(text(f"SET LOCAL statement_timeout = {int(settings.readiness_timeout_ms)}"))
+        connection.execute(text("SELECT 1"))
+
+
+def check_readiness() -> dict:
+    """DB 왕복 지연과 풀 포화도를 점검. 문제가 있으면 "reason" 키를 포함한다."""
+    result = {"pool": pool_usage()}
+
+    # 포화된 풀에서 체크아웃하면 pool_timeout 동안 막히므로 풀을 건드리기 전에 판정한다
+    if result["pool"]["usage"] > settings.readiness_max_pool_usage:
+        result["reason"] = "connection pool saturated"
+        return result
+
+    # 체크아웃과 쿼리는 전용 스레드에서 실행하고 readiness_timeout_ms 까지만 기다린다
+    # (이전 점검이 아직 막혀 있으면 새 점검은 대기열에서 시간 초과된다)
+    start = time.perf_counter()
+    try:
+        _probe.submit(_ping).result(timeout=settings.readiness_timeout_ms / 1000)
+    except FutureTimeoutError:
+        result["reason"] = "database latency over budget"
+    except SQLAlchemyError:
+        result["reason"] = "database unreachable"
+    finally:
+        result["db_latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    if "reason" not in result and result["db_latency_ms"] > settings.readiness_timeout_ms:
+        result["reason"] = "database latency over budget"
+
+    return result
@@ -0,0 +1,112 @@
+"""응답 압축 벤치마크 - 엔드포인트별 절감 바이트와 CPU 시간
+
+실제 응답 스키마로 1000행 페이지를 직렬화한 뒤 gzip 레벨별(및 brotli 설치 시 품질별)로
+압축 크기와 CPU 시간을 측정한다. DB 연결은 필요 없다.
+
+Usage:
+    python -m benchmarks.bench_compression [--rows 1000] [--repeat 20]
+"""
+import argparse
+import gzip
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.course import CourseInfoResponse
+from app.schemas.enroll import EnrollDetailResponse
+from app.schemas.session import SessionDetailResponse
+from app.utils.compression import brotli
+
+NOW = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def enroll_rows(n):
+    admin = uuid4()
+    sessions = [(uuid4(), f"2026 봄학기 {i}반", f"성경개론 {i}") for i in range(20)]
+    return [
+        EnrollDetailResponse(
+            id=uuid4(), user_id=uuid4(), session_id=sessions[i % 20][0], enroll_status="ENROLLED",
+            user_name=f"student{i:04d}", auth_type="kakao", session_title=sessions[i % 20][1],
+            course_name=sessions[i % 20][2], created_at=NOW + timedelta(seconds=i),
+            updated_at=NOW + timedelta(seconds=i), created_by=admin, updated_by=admin,
+        )
+        for i in range(n)
+    ]
+
+
+def attendance_rows(n):
+    admin, lecture = uuid4(), uuid4()
+    return [
+        AttendanceResponse(
+            id=uuid4(), lecture_id=lecture, user_id=uuid4(), status=("present", "late", "absent")[i % 3],
+            detail_type="offline", description=None, created_at=NOW + timedelta(seconds=i),
+            updated_at=NOW + timedelta(seconds=i), created_by=admin, updated_by=admin,
+        )
+        for i in range(n)
+    ]
+
+
+def session_rows(n):
+    admin, course = uuid4(), uuid4()
+    return [
+        SessionDetailResponse(
+            id=uuid4(), title=f"Session {i}", description="주간 성경 공부 모임입니다. " * 8,
+            lecturer_info="홍길동 목사", date_info="매주 화요일 19:30", begin_date=NOW, end_date=NOW + timedelta(days=90),
+            course_id=course, course_name="성경개론", course_status="IN_PROGRESS", lecture_count=12,
+            created_at=NOW, updated_at=NOW, created_by=admin, updated_by=admin,
+        )
+        for i in range(n)
+    ]
+
+
+def course_rows(n):
+    return [
+        CourseInfoResponse(
+            id=uuid4(), title=f"Course {i}", description="과정 소개 문구입니다. " * 12, keyword="성경,기초",
+            created_at=NOW, updated_at=NOW, author="admin", lecture_count=4,
+        )
+        for i in range(n)
+    ]
+
+
+ENDPOINTS = {
+    "GET /api/enrolls/": enroll_rows,
+    "GET /api/attendances/sessions/{id}/attendances": attendance_rows,
+    "GET /api/sessions": session_rows,
+    "GET /api/courses": course_rows,
+}
+
+
+def measure(compress, body, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        out = compress(body)
+    cpu_ms = (time.process_time() - start) * 1000 / repeat
+    return len(out), cpu_ms
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    codecs = [(f"gzip-{level}", lambda b, level=level: gzip.compress(b, compresslevel=level)) for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [(f"br-{q}", lambda b, q=q: brotli.compress(b, quality=q)) for q in (4, 11)]
+
+    print(f"{'endpoint':<48} {'codec':<8} {'raw':>10} {'sent':>10} {'saved':>7} {'cpu ms':>8}")
+    for endpoint, build in ENDPOINTS.items():
+        body = JSONResponse(jsonable_encoder(build(args.rows))).body
+        for name, compress in codecs:
+            size, cpu_ms = measure(compress, body, args.repeat)
+            saved = 1 - size / len(body)
+            print(f"{endpoint:<48} {name:<8} {len(body):>10} {size:>10} {saved:>7.1%} {cpu_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
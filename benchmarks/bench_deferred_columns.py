@@ -0,0 +1,114 @@
+"""목록 조회에서 Text 컬럼 지연 로딩 벤치마크 - DB 전송 바이트와 메모리
+
+DATABASE_URL(또는 --database-url)의 DB 에 트랜잭션 안에서 강좌/세션/출석 1000행씩을 만들고,
+전체 컬럼 조회와 목록 기본 필드(description/information 제외) 조회를 비교한 뒤 롤백한다.
+
+- bytes from DB: 같은 쿼리를 ``sum(pg_column_size(row))`` 로 감싼 서버 측 행 크기 합
+- memory: ORM 로딩 + 응답 dict 생성 구간의 tracemalloc peak
+
+Usage:
+    python -m benchmarks.bench_deferred_columns [--rows 1000] [--text-size 2000]
+"""
+import argparse
+import os
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.schemas.attendance import AttendanceResponse
+from app.models.user import Attendance, Course, Lecture, Session, User
+from app.schemas.course import CourseInfoResponse
+from app.schemas.session import SessionDetailResponse
+from app.utils.fields import load_only_fields
+
+CASES = [
+    ("courses", Course, CourseInfoResponse, "description"),
+    ("sessions", Session, SessionDetailResponse, "description"),
+    ("attendances", Attendance, AttendanceResponse, "description"),
+]
+
+
+def seed(db, rows: int, text_size: int) -> None:
+    text = ("출석 메모와 강좌 소개 문구 " * (text_size // 10 + 1))[:text_size]
+    admin = User(id=uuid.uuid4(), username=f"bench-{uuid.uuid4()}", auth_type="manual", information=text)
+    db.add(admin)
+    db.flush()
+
+    courses = [Course(title=f"Course {i}", description=text, created_by=admin.id, updated_by=admin.id) for i in range(rows)]
+    db.add_all(courses)
+    db.flush()
+
+    sessions = [
+        Session(course_id=courses[i].id, title=f"Session {i}", description=text, created_by=admin.id, updated_by=admin.id)
+        for i in range(rows)
+    ]
+    db.add_all(sessions)
+    db.flush()
+
+    lecture = Lecture(session_id=sessions[0].id, title="Lecture", sequence=1, created_by=admin.id, updated_by=admin.id)
+    db.add(lecture)
+    db.flush()
+
+    db.add_all([
+        Attendance(lecture_id=lecture.id, user_id=admin.id, status="present", description=text,
+                   created_by=admin.id, updated_by=admin.id)
+        for _ in range(rows)
+    ])
+    db.flush()
+
+
+def measure(db, model, fields, rows):
+    query = db.query(model).options(*load_only_fields(model, fields)).limit(rows)
+
+    # 로더 옵션은 subquery 에 반영되지 않으므로 같은 컬럼 목록으로 직접 구성
+    columns = model.__table__.columns.keys()
+    selected = [getattr(model, name) for name in (fields or columns) if name in columns]
+    subquery = db.query(*selected).limit(rows).subquery()
+    db_bytes = db.execute(select(func.sum(func.pg_column_size(subquery.table_valued())))).scalar() or 0
+
+    db.expunge_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = query.all()
+    names = fields or columns
+    payload = [{name: getattr(item, name, None) for name in names} for item in items]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del payload
+    return db_bytes, peak, elapsed_ms
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--text-size", type=int, default=2000, help="characters per Text column")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = sessionmaker(bind=connection)()
+
+    try:
+        seed(db, args.rows, args.text_size)
+
+        print(f"{'list':<12} {'mode':<9} {'db bytes':>12} {'peak mem':>12} {'ms':>8}")
+        for name, model, response_model, deferred in CASES:
+            list_fields = [f for f in response_model.model_fields if f != deferred]
+            for mode, fields in (("full", None), ("deferred", list_fields)):
+                db_bytes, peak, elapsed_ms = measure(db, model, fields, args.rows)
+                print(f"{name:<12} {mode:<9} {db_bytes:>12,} {peak:>12,} {elapsed_ms:>8.1f}")
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,13 @@ from app.crud.course import CourseCRUD
 from app.crud.session import SessionCRUD
 from app.crud.lecture import LectureCRUD
 from app.crud.attendance import AttendanceCRUD
+from app.crud.enroll import EnrollCRUD
 from app.schemas.user import UserCreate
 from app.schemas.course import CourseCreate
 from app.schemas.session import SessionCreate
 from app.schemas.lecture import LectureCreate
 from app.schemas.attendance import AttendanceCreate
+from app.schemas.enroll import EnrollCreate
 
 
 class TestAttendanceAPI:
@@ -238,4 +240,166 @@ class TestAttendanceAPI:
         """Test getting non-existent attendance"""
         fake_id = uuid4()
         response = client.get(f"/api/attendances/{fake_id}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_check_in_code_and_invalid_code(self, client: TestClient, db_session):
+        """Test an admin gets a check-in code and a wrong code is rejected before queueing"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="checkin_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Check-in Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Check-in Session"), admin)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Check-in Lecture", sequence=1), admin
+        )
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=admin.id, session_id=session.id), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.get(f"/api/attendances/lectures/{lecture.id}/check-in-code", headers=headers)
+        assert response.status_code == 200
+        code = response.json()["code"]
+        assert len(code) == 6
+
+        wrong = "000000" if code != "000000" else "111111"
+        response = client.post(
+            f"/api/attendances/lectures/{lecture.id}/check-in", json={"code": wrong}, headers=headers
+        )
+        assert response.status_code == 400
+
+    def test_check_in(self, client: TestClient, db_session, monkeypatch):
+        """Test an enrolled student checks in with the current code once"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="checkin_ok_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        student = UserCRUD.create_user(db_session, UserCreate(username="checkin_ok_student", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Check-in OK Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Check-in OK Session"), admin)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Check-in OK Lecture", sequence=1), admin
+        )
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=student.id, session_id=session.id), admin)
+        # 배치는 테스트 트랜잭션 안에서 기록한다
+        monkeypatch.setattr(
+            client.app.state.checkin_batcher, "flush", lambda items: AttendanceCRUD.check_in_many(db_session, items)
+        )
+        admin_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(student.id)})}"}
+        code = client.get(f"/api/attendances/lectures/{lecture.id}/check-in-code", headers=admin_headers).json()["code"]
+        url = f"/api/attendances/lectures/{lecture.id}/check-in"
+
+        response = client.post(url, json={"code": code}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["user_id"] == str(student.id)
+        assert response.json()["status"] == "present"
+
+        response = client.post(url, json={"code": code}, headers=headers)
+        assert response.status_code == 409
+
+    def test_check_in_requires_enrollment(self, client: TestClient, db_session):
+        """Test a user who is not enrolled in the lecture's session cannot check in"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="checkin_enroll_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        outsider = UserCRUD.create_user(db_session, UserCreate(username="checkin_outsider", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Closed Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Closed Session"), admin)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Closed Lecture", sequence=1), admin
+        )
+        admin_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+        code = client.get(f"/api/attendances/lectures/{lecture.id}/check-in-code", headers=admin_headers).json()["code"]
+
+        response = client.post(
+            f"/api/attendances/lectures/{lecture.id}/check-in", json={"code": code},
+            headers={"Authorization": f"Bearer {create_access_token(data={'sub': str(outsider.id)})}"}
+        )
+
+        assert response.status_code == 403
+
+    def test_check_in_attempts_are_throttled(self, client: TestClient, db_session):
+        """Test repeated wrong codes for one lecture are cut off with 429"""
+        from app.config import settings
+
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="checkin_throttle_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        student = UserCRUD.create_user(db_session, UserCreate(username="checkin_guesser", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Throttle Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Throttle Session"), admin)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Throttle Lecture", sequence=1), admin
+        )
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=student.id, session_id=session.id), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(student.id)})}"}
+        url = f"/api/attendances/lectures/{lecture.id}/check-in"
+
+        statuses = [
+            client.post(url, json={"code": f"{i:06d}"}, headers=headers).status_code
+            for i in range(settings.rate_limit_checkin_per_minute + 1)
+        ]
+
+        assert statuses[-1] == 429
+        assert 429 not in statuses[:-1]
+
+    def test_check_in_code_requires_admin(self, client: TestClient, db_session):
+        """Test a regular user cannot issue check-in codes"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="checkin_student", auth_type="local"))
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+        response = client.get(f"/api/attendances/lectures/{uuid4()}/check-in-code", headers=headers)
+
+        assert response.status_code == 403
+
+    def test_get_attendances_by_lecture_created_range(self, client: TestClient, db_session):
+        """Test the created_at bounds filter lecture attendances"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="attendance_range", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Range Course"), user)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Range Session"), user)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Range Lecture", sequence=1), user
+        )
+        AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=user.id, status="present"), user
+        )
+        url = f"/api/attendances/lectures/{lecture.id}/attendances"
+
+        response = client.get(url, params={"created_from": "2000-01-01T00:00:00Z"})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+        response = client.get(url, params={"created_to": "2000-01-01T00:00:00Z"})
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_create_attendance_idempotency_key(self, client: TestClient, db_session):
+        """Test a retried create with the same Idempotency-Key replays the first attendance"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="attendance_retry", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Retry Course"), user)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Retry Session"), user)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Retry Lecture", sequence=1), user
+        )
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}",
+            "Idempotency-Key": str(uuid4()),
+        }
+        url = f"/api/attendances/lectures/{lecture.id}/attendances"
+
+        first = client.post(url, json={"user_id": str(user.id), "status": "present"}, headers=headers)
+        second = client.post(url, json={"user_id": str(user.id), "status": "present"}, headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["id"] == second.json()["id"]
+        assert second.headers["idempotent-replayed"] == "true"
+        assert len(AttendanceCRUD.get_attendances_by_lecture(db_session, lecture.id)) == 1
+
+    def test_stream_unavailable_when_live_updates_disabled(self, client: TestClient, monkeypatch):
+        """Test the SSE stream answers 503 without opening a LISTEN connection when live updates are off"""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "live_updates_enabled", False)
+
+        response = client.get(f"/api/attendances/lectures/{uuid4()}/stream")
+
+        assert response.status_code == 503
+        assert client.app.state.attendance_broadcaster._connection is None
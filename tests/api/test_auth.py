@@ -51,4 +51,74 @@ def test_get_current_user_info_with_auth(client: TestClient, db_session, test_us
 
     assert response.status_code == 200
     assert response.json()["username"] == test_user_data["username"]
-    assert response.json()["id"] == str(user.id)
\ No newline at end of file
+    assert response.json()["id"] == str(user.id)
+
+
+def test_login_rate_limited(client: TestClient, db_session):
+    """Test repeated logins are rejected with 429 and Retry-After once the bucket is empty"""
+    from app.config import settings
+
+    payload = {"username": "rate_limited_user", "password": "wrong"}
+    for _ in range(settings.rate_limit_login_per_minute):
+        assert client.post("/auth/login", json=payload).status_code == 401
+
+    response = client.post("/auth/login", json=payload)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_refresh_token_rotation(client: TestClient, db_session):
+    """Test a refresh token issues a new pair once and is rejected when reused"""
+    response = client.post(
+        "/auth/register",
+        json={"username": "refresh_user", "password": "secret123", "information": "refresh"}
+    )
+    assert response.status_code == 200
+    refresh_token = response.json()["refresh_token"]
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 200
+    assert response.json()["refresh_token"] != refresh_token
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {response.json()['token']}"}).status_code == 200
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 401
+
+
+def test_refresh_token_reuse_rejected_by_database(client: TestClient, db_session):
+    """Test a reused refresh token is rejected even when this worker's memory list has not seen it"""
+    from app.utils.revocation import revoked_tokens
+    from app.utils.security import verify_token
+
+    response = client.post(
+        "/auth/register",
+        json={"username": "refresh_replay_user", "password": "secret123", "information": "replay"}
+    )
+    refresh_token = response.json()["refresh_token"]
+
+    assert client.post("/auth/refresh", json={"refresh_token": refresh_token}).status_code == 200
+    # 다른 워커에서 재사용하는 경우 - 메모리 목록에는 아직 없다
+    revoked_tokens._jtis.discard(verify_token(refresh_token)["jti"])
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 401
+
+
+def test_refresh_token_is_not_an_access_token(client: TestClient, db_session):
+    """Test a refresh token cannot be used as a bearer token"""
+    from app.utils.security import create_refresh_token
+
+    response = client.get("/auth/me", headers={"Authorization": f"Bearer {create_refresh_token(uuid4())}"})
+    assert response.status_code == 401
+
+
+def test_logout_revokes_access_token(client: TestClient, db_session, test_user_data):
+    """Test an access token is rejected after logout"""
+    from app.crud.user import UserCRUD
+    from app.schemas.user import UserCreate
+
+    user = UserCRUD.create_user(db_session, UserCreate(**test_user_data))
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+    assert client.get("/auth/me", headers=headers).status_code == 401
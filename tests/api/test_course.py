@@ -4,8 +4,12 @@ from datetime import datetime
 from app.utils.security import create_access_token
 from app.crud.user import UserCRUD
 from app.crud.course import CourseCRUD
+from app.crud.session import SessionCRUD
+from app.crud.lecture import LectureCRUD
 from app.schemas.user import UserCreate
 from app.schemas.course import CourseCreate, CourseUpdate
+from app.schemas.session import SessionCreate
+from app.schemas.lecture import LectureCreate
 
 
 class TestCourseAPI:
@@ -131,4 +135,105 @@ class TestCourseAPI:
         """Test getting non-existent course"""
         fake_id = uuid4()
         response = client.get(f"/api/courses/{fake_id}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_get_courses_with_fields(self, client: TestClient, db_session):
+        """Test sparse fieldsets limit the returned keys"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="fields_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Sparse Course", description="long text"), user)
+
+        response = client.get(f"/api/courses/{course.id}?fields=id,title")
+
+        assert response.status_code == 200
+        assert response.json() == {"id": str(course.id), "title": "Sparse Course"}
+
+        response = client.get("/api/courses?fields=title,author")
+
+        assert response.status_code == 200
+        assert all(set(item) == {"title", "author"} for item in response.json())
+
+    def test_get_courses_with_unknown_field(self, client: TestClient):
+        """Test unknown fields are rejected"""
+        response = client.get("/api/courses?fields=title,password")
+        assert response.status_code == 400
+
+    def test_get_courses_defers_description(self, client: TestClient, db_session):
+        """Test list responses leave out description unless requested"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="deferred_user", auth_type="local"))
+        CourseCRUD.create_course(db_session, CourseCreate(title="Deferred Course", description="long text"), user)
+
+        response = client.get("/api/courses")
+
+        assert response.status_code == 200
+        assert all("description" not in item for item in response.json())
+
+        response = client.get("/api/courses?fields=title,description")
+
+        assert response.status_code == 200
+        assert any(item["description"] == "long text" for item in response.json())
+
+    def test_get_courses_list_schema_is_documented(self, client: TestClient, db_session):
+        """Test the default list payload matches the list schema published in OpenAPI"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="list_schema_user", auth_type="local"))
+        CourseCRUD.create_course(db_session, CourseCreate(title="Schema Course", description="long text"), user)
+
+        schema = client.get("/openapi.json").json()
+        items = schema["paths"]["/api/courses"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["items"]
+        documented = schema["components"]["schemas"][items["$ref"].rsplit("/", 1)[-1]]["properties"]
+
+        response = client.get("/api/courses")
+
+        assert response.status_code == 200
+        assert "description" not in documented
+        assert all(set(item) == set(documented) for item in response.json())
+
+    def test_get_courses_hides_inactive(self, client: TestClient, db_session):
+        """Test soft-deleted courses are listed only with include_inactive"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="inactive_course_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Retired Course"), user)
+        CourseCRUD.update_course(db_session, course.id, CourseUpdate(is_active=False), user)
+
+        response = client.get("/api/courses?fields=id")
+        assert str(course.id) not in {item["id"] for item in response.json()}
+
+        response = client.get("/api/courses?fields=id&include_inactive=true")
+        assert str(course.id) in {item["id"] for item in response.json()}
+
+    def test_clone_course(self, client: TestClient, db_session):
+        """Test cloning a course copies its sessions and lectures with shifted dates"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="clone_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Spring Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(
+            course_id=course.id, title="Spring Session", begin_date=datetime(2026, 3, 2), end_date=datetime(2026, 6, 26)
+        ), admin)
+        for i in range(1, 3):
+            LectureCRUD.create_lecture(db_session, LectureCreate(
+                session_id=session.id, title=f"Lecture {i}", sequence=i, lecture_date=datetime(2026, 3, i + 1)
+            ), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post(f"/api/courses/{course.id}/clone",
+                               json={"title": "Fall Course", "shift_days": 182}, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] != str(course.id)
+        assert len(data["session_ids"]) == 1
+        assert data["lecture_count"] == 2
+        assert client.get(f"/api/courses/{data['id']}").json()["title"] == "Fall Course"
+        lectures = client.get(f"/api/lectures/session/{data['session_ids'][0]}").json()
+        assert [l["sequence"] for l in lectures] == [1, 2]
+        assert lectures[0]["lecture_date"][:10] == "2026-08-31"
+
+    def test_clone_course_not_found(self, client: TestClient, db_session):
+        """Test cloning a non-existent course returns 404"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="clone_admin_404", auth_type="local", authorizations={"role": "admin"}
+        ))
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post(f"/api/courses/{uuid4()}/clone", json={}, headers=headers)
+
+        assert response.status_code == 404
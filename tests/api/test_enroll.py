@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+from app.crud.user import UserCRUD
+from app.crud.course import CourseCRUD
+from app.crud.session import SessionCRUD
+from app.crud.enroll import EnrollCRUD
+from app.schemas.user import UserCreate
+from app.schemas.course import CourseCreate
+from app.schemas.session import SessionCreate
+from app.schemas.enroll import EnrollCreate
+
+
+class TestEnrollAPI:
+    """Test enrollment API endpoints"""
+
+    def _enrollments(self, db_session):
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="enroll_search_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        students = [
+            UserCRUD.create_user(db_session, UserCreate(username=f"enroll_search_student_{i}", auth_type="local"))
+            for i in range(3)
+        ]
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Search Course"), admin)
+        other_course = CourseCRUD.create_course(db_session, CourseCreate(title="Other Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Search Session"), admin)
+        other = SessionCRUD.create_session(db_session, SessionCreate(course_id=other_course.id, title="Other Session"), admin)
+        for i, student in enumerate(students):
+            EnrollCRUD.create_enroll(db_session, EnrollCreate(
+                user_id=student.id, session_id=session.id, enroll_status="ENROLLED" if i else "WAITING"
+            ), admin)
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(
+            user_id=students[0].id, session_id=other.id, enroll_status="ENROLLED"
+        ), admin)
+        return course, session, students
+
+    def test_search_enrolls(self, client: TestClient, db_session):
+        """Test filters combine and the total ignores paging"""
+        course, _, _ = self._enrollments(db_session)
+
+        response = client.get("/api/enrolls/search", params={
+            "course_id": str(course.id), "enroll_status": "ENROLLED", "limit": 1
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert len(data["items"]) == 1
+        assert data["items"][0]["course_name"] == "Search Course"
+        assert data["items"][0]["enroll_status"] == "ENROLLED"
+
+    def test_search_enrolls_past_last_page(self, client: TestClient, db_session):
+        """Test a page past the end still reports the total"""
+        _, _, students = self._enrollments(db_session)
+
+        response = client.get("/api/enrolls/search", params={"user_id": str(students[0].id), "skip": 10})
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "total": 2}
+
+    def test_get_enrolls_by_session(self, client: TestClient, db_session):
+        """Test the per-session listing still returns detail rows"""
+        _, session, _ = self._enrollments(db_session)
+
+        response = client.get(f"/api/enrolls/sessions/{session.id}/enrolls")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert {e["session_title"] for e in response.json()} == {"Search Session"}
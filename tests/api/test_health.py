@@ -0,0 +1,60 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_health(client: TestClient):
+    """Test liveness endpoint"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+
+
+def test_ready_when_warm(client: TestClient, db_engine, monkeypatch):
+    """Test readiness reports DB latency and pool usage once warmed up"""
+    from app.utils import warmup
+
+    app.state.ready = True
+    monkeypatch.setattr(warmup, "engine", db_engine)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert "db_latency_ms" in data
+    assert data["pool"]["capacity"] > 0
+
+
+def test_ready_when_pool_saturated(client: TestClient, monkeypatch):
+    """Test readiness fails when the pool is over the configured usage"""
+    from app.config import settings
+
+    app.state.ready = True
+    monkeypatch.setattr(settings, "readiness_max_pool_usage", -1.0)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "connection pool saturated"
+
+
+def test_ready_while_warming_up_answers_immediately(client: TestClient, monkeypatch):
+    """Test a worker that is not warmed up yet reports 503 without waiting for the retried warm-up"""
+    import threading
+    import time
+    from app.utils import warmup
+
+    release = threading.Event()
+    monkeypatch.setattr(warmup, "warm_up", lambda connections: release.wait(5))
+    monkeypatch.setattr(warmup, "_rewarming", None)
+    app.state.ready = False
+
+    start = time.perf_counter()
+    response = client.get("/ready")
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "warming up"
+    assert elapsed < 1
@@ -301,4 +301,113 @@ class TestLectureAPI:
         """Test getting non-existent lecture"""
         fake_id = uuid4()
         response = client.get(f"/api/lectures/{fake_id}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_create_lecture_schedule(self, client: TestClient, db_session):
+        """Test a recurrence creates every lecture with sequences and dates filled in"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="schedule_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Schedule Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Schedule Session"), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="Orientation", sequence=1), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post("/api/lectures/schedule", json={
+            "session_id": str(session.id),
+            "start_date": "2026-03-02",
+            "weekdays": [0, 3],
+            "count": 4,
+            "start_time": "09:30:00",
+            "title_template": "Week {n} ({date}) #{sequence}",
+        }, headers=headers)
+
+        assert response.status_code == 200
+        lectures = response.json()
+        assert [l["sequence"] for l in lectures] == [2, 3, 4, 5]
+        assert [l["lecture_date"][:10] for l in lectures] == ["2026-03-02", "2026-03-05", "2026-03-09", "2026-03-12"]
+        assert lectures[0]["title"] == "Week 1 (2026-03-02) #2"
+
+    def test_create_lecture_schedule_unknown_session(self, client: TestClient, db_session):
+        """Test scheduling into a missing session returns 404"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="schedule_admin_404", auth_type="local", authorizations={"role": "admin"}
+        ))
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post("/api/lectures/schedule", json={
+            "session_id": str(uuid4()), "start_date": "2026-03-02", "weekdays": [0], "count": 2
+        }, headers=headers)
+
+        assert response.status_code == 404
+
+    def test_create_lecture_schedule_rejects_template_lookups(self, client: TestClient, db_session):
+        """Test attribute, index and unknown placeholders in the title template return 422"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="schedule_admin_template", auth_type="local", authorizations={"role": "admin"}
+        ))
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        for template in ["{date.year}", "{n[0]}", "{n!r}", "{sequence:03d}", "{title}"]:
+            response = client.post("/api/lectures/schedule", json={
+                "session_id": str(uuid4()), "start_date": "2026-03-02", "weekdays": [0], "count": 1,
+                "title_template": template,
+            }, headers=headers)
+            assert response.status_code == 422, template
+
+    def test_reorder_lectures(self, client: TestClient, db_session):
+        """Test reordering rewrites every sequence, including swaps"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="reorder_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Reorder Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Reorder Session"), admin)
+        lectures = [
+            LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title=f"Lecture {i}", sequence=i), admin)
+            for i in range(1, 4)
+        ]
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+        new_order = [str(lectures[2].id), str(lectures[0].id), str(lectures[1].id)]
+
+        response = client.put(f"/api/lectures/session/{session.id}/order",
+                              json={"lecture_ids": new_order}, headers=headers)
+
+        assert response.status_code == 200
+        assert [l["id"] for l in response.json()] == new_order
+        assert [l["sequence"] for l in response.json()] == [1, 2, 3]
+        listed = client.get(f"/api/lectures/session/{session.id}").json()
+        assert [l["title"] for l in listed] == ["Lecture 3", "Lecture 1", "Lecture 2"]
+
+    def test_reorder_lectures_requires_full_list(self, client: TestClient, db_session):
+        """Test reordering with a partial id list returns 400 and keeps the old order"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="reorder_admin_partial", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Partial Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Partial Session"), admin)
+        first = LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="First", sequence=1), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="Second", sequence=2), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.put(f"/api/lectures/session/{session.id}/order",
+                              json={"lecture_ids": [str(first.id)]}, headers=headers)
+
+        assert response.status_code == 400
+        listed = client.get(f"/api/lectures/session/{session.id}").json()
+        assert [l["title"] for l in listed] == ["First", "Second"]
+
+    def test_create_lecture_duplicate_sequence(self, client: TestClient, db_session):
+        """Test a second lecture with the same sequence in a session returns 409"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="duplicate_sequence_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Duplicate Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Duplicate Session"), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="Taken", sequence=1), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post("/api/lectures", json={
+            "session_id": str(session.id), "title": "Clash", "sequence": 1
+        }, headers=headers)
+
+        assert response.status_code == 409
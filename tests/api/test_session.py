@@ -1,13 +1,15 @@
 from fastapi.testclient import TestClient
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from app.utils.security import create_access_token
 from app.crud.user import UserCRUD
 from app.crud.course import CourseCRUD
 from app.crud.session import SessionCRUD
+from app.crud.lecture import LectureCRUD
 from app.schemas.user import UserCreate
 from app.schemas.course import CourseCreate
 from app.schemas.session import SessionCreate, SessionUpdate
+from app.schemas.lecture import LectureCreate
 
 
 class TestSessionAPI:
@@ -84,6 +86,33 @@ class TestSessionAPI:
         sessions = response.json()
         assert len(sessions) >= 1
 
+    def test_get_sessions_by_status(self, client: TestClient, db_session):
+        """Test the status filter returns only sessions with that course_status"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="session_status_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Status Course"), user)
+        now = datetime.now(timezone.utc)
+        finished = SessionCRUD.create_session(db_session, SessionCreate(
+            course_id=course.id, title="Finished", begin_date=now - timedelta(days=60), end_date=now - timedelta(days=30)
+        ), user)
+        running = SessionCRUD.create_session(db_session, SessionCreate(
+            course_id=course.id, title="Running", begin_date=now - timedelta(days=1), end_date=now + timedelta(days=30)
+        ), user)
+
+        response = client.get("/api/sessions", params={"status": "IN_PROGRESS", "limit": 1000})
+
+        assert response.status_code == 200
+        sessions = response.json()
+        ids = {s["id"] for s in sessions}
+        assert str(running.id) in ids
+        assert str(finished.id) not in ids
+        assert all(s["course_status"] == "IN_PROGRESS" for s in sessions)
+
+    def test_get_sessions_invalid_status(self, client: TestClient):
+        """Test an unknown status is rejected"""
+        response = client.get("/api/sessions", params={"status": "SOMETIME"})
+
+        assert response.status_code == 422
+
     def test_get_session_by_id(self, client: TestClient, db_session):
         """Test getting a specific session by ID"""
         user_data = {
@@ -202,4 +231,103 @@ class TestSessionAPI:
         """Test getting non-existent session"""
         fake_id = uuid4()
         response = client.get(f"/api/sessions/{fake_id}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_get_session_attendance_stats(self, client: TestClient, db_session):
+        """Test attendance stats are served from incrementally maintained rollups"""
+        from app.crud.lecture import LectureCRUD
+        from app.crud.attendance import AttendanceCRUD
+        from app.crud.enroll import EnrollCRUD
+        from app.schemas.lecture import LectureCreate
+        from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+        from app.schemas.enroll import EnrollCreate
+
+        user = UserCRUD.create_user(db_session, UserCreate(username="stats_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Stats Course"), user)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Stats Session"), user)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Stats Lecture", sequence=1), user
+        )
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+
+        attendance = AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=user.id, status="absent"), user
+        )
+        AttendanceCRUD.update_attendance(db_session, attendance.id, AttendanceUpdate(status="present"), user)
+
+        response = client.get(f"/api/sessions/{session.id}/attendance-stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["enrolled_count"] == 1
+        assert data["status_counts"] == {"present": 1}
+        assert data["attendance_rate"] == 1.0
+        assert data["lectures"][0]["status_counts"] == {"present": 1}
+
+    def test_attendance_stats_follow_repeated_updates(self, client: TestClient, db_session):
+        """Test rollups track each status change of an attendance that is already loaded"""
+        from app.crud.lecture import LectureCRUD
+        from app.crud.attendance import AttendanceCRUD
+        from app.schemas.lecture import LectureCreate
+        from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+
+        user = UserCRUD.create_user(db_session, UserCreate(username="stats_repeat_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Repeat Stats Course"), user)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Repeat Stats Session"), user)
+        lecture = LectureCRUD.create_lecture(
+            db_session, LectureCreate(session_id=session.id, title="Repeat Stats Lecture", sequence=1), user
+        )
+        attendance = AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=user.id, status="absent"), user
+        )
+
+        AttendanceCRUD.update_attendance(db_session, attendance.id, AttendanceUpdate(status="present"), user)
+        AttendanceCRUD.update_attendance(db_session, attendance.id, AttendanceUpdate(description="note only"), user)
+        updated = AttendanceCRUD.update_attendance(db_session, attendance.id, AttendanceUpdate(status="late"), user)
+
+        assert updated.status == "late"
+        response = client.get(f"/api/sessions/{session.id}/attendance-stats")
+        assert response.status_code == 200
+        assert response.json()["status_counts"] == {"late": 1}
+
+    def test_get_session_attendance_stats_not_found(self, client: TestClient):
+        """Test attendance stats for a non-existent session return 404"""
+        response = client.get(f"/api/sessions/{uuid4()}/attendance-stats")
+        assert response.status_code == 404
+
+    def test_clone_session_into_other_course(self, client: TestClient, db_session):
+        """Test cloning a session into another course copies its lectures"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="session_clone_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Source Course"), admin)
+        target = CourseCRUD.create_course(db_session, CourseCreate(title="Target Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Source Session"), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="Only Lecture", sequence=1), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post(f"/api/sessions/{session.id}/clone",
+                               json={"course_id": str(target.id), "title": "Copied Session"}, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["session_ids"] == [data["id"]]
+        assert data["lecture_count"] == 1
+        copied = client.get(f"/api/sessions/{data['id']}").json()
+        assert copied["course_id"] == str(target.id)
+        assert copied["title"] == "Copied Session"
+
+    def test_clone_session_unknown_course(self, client: TestClient, db_session):
+        """Test cloning into a missing course returns 404 and copies nothing"""
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="session_clone_admin_404", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Lonely Course"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Lonely Session"), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(session_id=session.id, title="Lonely Lecture", sequence=1), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+
+        response = client.post(f"/api/sessions/{session.id}/clone",
+                               json={"course_id": str(uuid4())}, headers=headers)
+
+        assert response.status_code == 404
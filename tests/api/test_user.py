@@ -170,4 +170,217 @@ class TestUserAPI:
             headers={"Authorization": f"Bearer {token}"}
         )
 
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_get_users_batch(self, client: TestClient, db_session):
+        """Test fetching several users by id in one request"""
+        from app.crud.user import UserCRUD
+        from app.schemas.user import UserCreate
+
+        first = UserCRUD.create_user(db_session, UserCreate(username="batch_user_1", auth_type="local"))
+        second = UserCRUD.create_user(db_session, UserCreate(username="batch_user_2", auth_type="local"))
+
+        token = create_access_token(data={"sub": str(first.id)})
+
+        fake_id = uuid4()
+        response = client.post(
+            "/api/users/batch",
+            json={"ids": [str(second.id), str(fake_id), str(first.id), str(second.id)]},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [user["id"] for user in data["items"]] == [str(second.id), str(first.id)]
+        assert data["missing"] == [str(fake_id)]
+
+    def test_get_user_dashboard(self, client: TestClient, db_session):
+        """Test the per-user dashboard aggregates enrollments and attendance"""
+        from datetime import datetime
+        from app.crud.user import UserCRUD
+        from app.crud.course import CourseCRUD
+        from app.crud.session import SessionCRUD
+        from app.crud.lecture import LectureCRUD
+        from app.crud.attendance import AttendanceCRUD
+        from app.crud.enroll import EnrollCRUD
+        from app.schemas.user import UserCreate
+        from app.schemas.course import CourseCreate
+        from app.schemas.session import SessionCreate
+        from app.schemas.lecture import LectureCreate
+        from app.schemas.attendance import AttendanceCreate
+        from app.schemas.enroll import EnrollCreate
+
+        user = UserCRUD.create_user(db_session, UserCreate(username="dashboard_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Dashboard Course"), user)
+        session = SessionCRUD.create_session(
+            db_session, SessionCreate(course_id=course.id, title="Dashboard Session"), user
+        )
+        lectures = [
+            LectureCRUD.create_lecture(
+                db_session,
+                LectureCreate(session_id=session.id, title=f"Lecture {i}", sequence=i, lecture_date=datetime.utcnow()),
+                user
+            )
+            for i in (1, 2)
+        ]
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+        AttendanceCRUD.create_attendance(
+            db_session, lectures[0].id, AttendanceCreate(user_id=user.id, status="present"), user
+        )
+
+        token = create_access_token(data={"sub": str(user.id)})
+
+        response = client.get(
+            f"/api/users/{user.id}/dashboard",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["enrollments"]) == 1
+        enrollment = data["enrollments"][0]
+        assert enrollment["course_name"] == "Dashboard Course"
+        assert enrollment["lecture_count"] == 2
+        assert enrollment["attended_count"] == 1
+        assert enrollment["attendance_rate"] == 0.5
+        assert data["certifications"] == []
+
+    def test_role_claim_skips_user_lookup(self, client: TestClient, db_session):
+        """Test an access token carrying the admin role passes require_admin without a users row"""
+        token = create_access_token(data={"sub": str(uuid4()), "type": "access", "role": "admin", "active": True})
+
+        response = client.get("/api/users", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+
+    def test_inactive_role_claim_is_forbidden(self, client: TestClient, db_session):
+        """Test an access token for an inactive user is rejected by role checks"""
+        token = create_access_token(data={"sub": str(uuid4()), "type": "access", "role": "admin", "active": False})
+
+        response = client.get("/api/users", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 403
+
+    def test_get_users_filtered_by_role(self, client: TestClient, db_session):
+        """Test ?role= returns only users with that role"""
+        from app.crud.user import UserCRUD
+        from app.schemas.user import UserCreate
+
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="role_filter_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        UserCRUD.create_user(db_session, UserCreate(
+            username="role_filter_user", auth_type="local", authorizations={"role": "user"}
+        ))
+        token = create_access_token(data={"sub": str(admin.id)})
+
+        response = client.get("/api/users?role=admin", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        users = response.json()
+        assert {u["role"] for u in users} == {"admin"}
+        assert "role_filter_admin" in {u["username"] for u in users}
+        assert "role_filter_user" not in {u["username"] for u in users}
+
+    def test_role_column_follows_authorizations(self, db_session):
+        """Test create_user and update_user keep the role column in sync with authorizations"""
+        from app.crud.user import UserCRUD
+        from app.models.user import User
+        from app.schemas.user import UserCreate, UserUpdate
+
+        user = UserCRUD.create_user(db_session, UserCreate(username="role_sync_user", auth_type="local"))
+        assert user.role == "user"
+
+        user = UserCRUD.update_user(db_session, user.id, UserUpdate(authorizations={"role": "admin"}))
+        assert user.role == "admin"
+        assert user.authorizations == {"role": "admin"}
+
+        user = UserCRUD.update_user(db_session, user.id, UserUpdate(information="unchanged role"))
+        assert user.role == "admin"
+        assert user.information == "unchanged role"
+        assert db_session.query(User.role).filter(User.id == user.id).scalar() == "admin"
+
+    def test_get_user_calendar_etag(self, client: TestClient, db_session):
+        """Test the calendar lists enrolled lectures in the window and answers If-None-Match with 304"""
+        from datetime import datetime, timedelta, timezone
+        from app.crud.user import UserCRUD
+        from app.crud.course import CourseCRUD
+        from app.crud.session import SessionCRUD
+        from app.crud.lecture import LectureCRUD
+        from app.crud.enroll import EnrollCRUD
+        from app.schemas.user import UserCreate
+        from app.schemas.course import CourseCreate
+        from app.schemas.session import SessionCreate
+        from app.schemas.lecture import LectureCreate
+        from app.schemas.enroll import EnrollCreate
+
+        user = UserCRUD.create_user(db_session, UserCreate(username="calendar_user", auth_type="local"))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Calendar Course"), user)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Calendar Session"), user)
+        now = datetime.now(timezone.utc)
+        upcoming = LectureCRUD.create_lecture(db_session, LectureCreate(
+            session_id=session.id, title="Upcoming", sequence=1, lecture_date=now + timedelta(days=3)
+        ), user)
+        LectureCRUD.create_lecture(db_session, LectureCreate(
+            session_id=session.id, title="Far away", sequence=2, lecture_date=now + timedelta(days=300)
+        ), user)
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+        response = client.get(f"/api/users/{user.id}/calendar", headers=headers)
+
+        assert response.status_code == 200
+        events = response.json()
+        assert [e["id"] for e in events] == [str(upcoming.id)]
+        assert events[0]["course_title"] == "Calendar Course"
+
+        response = client.get(
+            f"/api/users/{user.id}/calendar", headers={**headers, "If-None-Match": response.headers["etag"]}
+        )
+        assert response.status_code == 304
+
+        response = client.get(f"/api/users/{user.id}/calendar.ics", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert f"UID:{upcoming.id}@stg-academy" in response.text
+
+    def test_calendar_reflects_course_rename(self, client: TestClient, db_session):
+        """Test renaming a course invalidates cached calendars that show its title"""
+        from datetime import datetime, timedelta, timezone
+        from app.crud.user import UserCRUD
+        from app.crud.course import CourseCRUD
+        from app.crud.session import SessionCRUD
+        from app.crud.lecture import LectureCRUD
+        from app.crud.enroll import EnrollCRUD
+        from app.schemas.user import UserCreate
+        from app.schemas.course import CourseCreate
+        from app.schemas.session import SessionCreate
+        from app.schemas.lecture import LectureCreate
+        from app.schemas.enroll import EnrollCreate
+
+        admin = UserCRUD.create_user(db_session, UserCreate(
+            username="calendar_rename_admin", auth_type="local", authorizations={"role": "admin"}
+        ))
+        course = CourseCRUD.create_course(db_session, CourseCreate(title="Old Title"), admin)
+        session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Rename Session"), admin)
+        LectureCRUD.create_lecture(db_session, LectureCreate(
+            session_id=session.id, title="Soon", sequence=1, lecture_date=datetime.now(timezone.utc) + timedelta(days=1)
+        ), admin)
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=admin.id, session_id=session.id), admin)
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"}
+        url = f"/api/users/{admin.id}/calendar"
+
+        etag = client.get(url, headers=headers).headers["etag"]
+        assert client.put(f"/api/courses/{course.id}", json={"title": "New Title"}, headers=headers).status_code == 200
+
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()[0]["course_title"] == "New Title"
+
+    def test_get_other_user_calendar_is_forbidden(self, client: TestClient, db_session):
+        """Test a regular user cannot read another user's calendar"""
+        token = create_access_token(data={"sub": str(uuid4()), "type": "access", "role": "user", "active": True})
+
+        response = client.get(f"/api/users/{uuid4()}/calendar", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 403
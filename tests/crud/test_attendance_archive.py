@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from app.crud.user import UserCRUD
+from app.crud.course import CourseCRUD
+from app.crud.session import SessionCRUD
+from app.crud.lecture import LectureCRUD
+from app.crud.attendance import AttendanceCRUD
+from app.crud.attendance_archive import AttendanceArchiveCRUD
+from app.models.user import Attendance
+from app.schemas.user import UserCreate
+from app.schemas.course import CourseCreate
+from app.schemas.session import SessionCreate
+from app.schemas.lecture import LectureCreate
+from app.schemas.attendance import AttendanceCreate
+
+
+def make_attendance(db_session, username, end_date):
+    user = UserCRUD.create_user(db_session, UserCreate(username=username, auth_type="local"))
+    course = CourseCRUD.create_course(db_session, CourseCreate(title="Archive Course"), user)
+    session = SessionCRUD.create_session(
+        db_session,
+        SessionCreate(course_id=course.id, title="Archive Session", begin_date=end_date - timedelta(days=90), end_date=end_date),
+        user
+    )
+    lecture = LectureCRUD.create_lecture(
+        db_session, LectureCreate(session_id=session.id, title="Archive Lecture", sequence=1), user
+    )
+    attendance = AttendanceCRUD.create_attendance(
+        db_session, lecture.id, AttendanceCreate(user_id=user.id, status="present"), user
+    )
+    return user, session, lecture, attendance
+
+
+class TestAttendanceArchive:
+    """Archiving finished sessions and reading archived rows back"""
+
+    def test_archive_finished_session(self, db_session):
+        """Test a long-finished session's rows move to the archive and are still listed"""
+        _, session, lecture, attendance = make_attendance(
+            db_session, "archive_finished", datetime.now(timezone.utc) - timedelta(days=400)
+        )
+
+        totals = AttendanceArchiveCRUD.archive_finished(db_session, timedelta(days=180))
+
+        assert totals["sessions"] >= 1
+        assert totals["rows"] >= 1
+        assert db_session.query(Attendance).filter(Attendance.lecture_id == lecture.id).count() == 0
+
+        by_session = AttendanceCRUD.get_attendances_by_session(db_session, session.id)
+        by_lecture = AttendanceCRUD.get_attendances_by_lecture(db_session, lecture.id)
+        assert [a.id for a in by_session] == [attendance.id]
+        assert [a.id for a in by_lecture] == [attendance.id]
+        assert by_lecture[0].status == "present"
+
+    def test_recent_session_is_not_archived(self, db_session):
+        """Test sessions that ended recently stay in attendances"""
+        _, session, lecture, _ = make_attendance(
+            db_session, "archive_recent", datetime.now(timezone.utc) - timedelta(days=10)
+        )
+
+        AttendanceArchiveCRUD.archive_finished(db_session, timedelta(days=180))
+
+        assert db_session.query(Attendance).filter(Attendance.lecture_id == lecture.id).count() == 1
@@ -0,0 +1,180 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud.user import UserCRUD
+from app.crud.course import CourseCRUD
+from app.crud.session import SessionCRUD
+from app.crud.lecture import LectureCRUD
+from app.crud.enroll import EnrollCRUD
+from app.crud.attendance import AttendanceCRUD
+from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.course import CourseCreate, CourseUpdate
+from app.schemas.session import SessionCreate, SessionUpdate
+from app.schemas.lecture import LectureCreate, LectureUpdate
+from app.schemas.enroll import EnrollCreate, EnrollUpdate
+from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+
+
+def make_lecture(db_session, username):
+    user = UserCRUD.create_user(db_session, UserCreate(username=username, auth_type="local"))
+    course = CourseCRUD.create_course(db_session, CourseCreate(title="Round Trip Course"), user)
+    session = SessionCRUD.create_session(db_session, SessionCreate(course_id=course.id, title="Round Trip Session"), user)
+    lecture = LectureCRUD.create_lecture(
+        db_session,
+        LectureCreate(session_id=session.id, title="Round Trip Lecture", sequence=1, lecture_date=datetime.utcnow()),
+        user
+    )
+    return user, course, session, lecture
+
+
+class TestUpdateRoundTrips:
+    """Each update_* method is a single UPDATE ... RETURNING"""
+
+    def test_update_user(self, db_session, query_counter):
+        """Test update_user issues one statement"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="rt_update_user", auth_type="local"))
+        query_counter.clear()
+
+        updated = UserCRUD.update_user(db_session, user.id, UserUpdate(information="updated"))
+
+        assert updated.information == "updated"
+        assert len(query_counter) == 1
+
+    def test_update_course(self, db_session, query_counter):
+        """Test update_course issues one statement"""
+        user, course, _, _ = make_lecture(db_session, "rt_update_course")
+        query_counter.clear()
+
+        updated = CourseCRUD.update_course(db_session, course.id, CourseUpdate(title="Renamed"), user)
+
+        assert updated.title == "Renamed"
+        assert len(query_counter) == 1
+
+    def test_update_session(self, db_session, query_counter):
+        """Test update_session issues one statement"""
+        _, _, session, _ = make_lecture(db_session, "rt_update_session")
+        query_counter.clear()
+
+        updated = SessionCRUD.update_session(db_session, session.id, SessionUpdate(title="Renamed"))
+
+        assert updated.title == "Renamed"
+        assert len(query_counter) == 1
+
+    def test_update_lecture(self, db_session, query_counter):
+        """Test update_lecture issues one statement"""
+        user, _, _, lecture = make_lecture(db_session, "rt_update_lecture")
+        query_counter.clear()
+
+        updated = LectureCRUD.update_lecture(db_session, lecture.id, LectureUpdate(title="Renamed"), user)
+
+        assert updated.title == "Renamed"
+        assert len(query_counter) == 1
+
+    def test_update_enroll(self, db_session, query_counter):
+        """Test update_enroll issues one statement"""
+        user, _, session, _ = make_lecture(db_session, "rt_update_enroll")
+        enroll = EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+        query_counter.clear()
+
+        updated = EnrollCRUD.update_enroll(db_session, enroll.id, EnrollUpdate(enroll_status="COMPLETED"), user)
+
+        assert updated.enroll_status == "COMPLETED"
+        assert len(query_counter) == 1
+
+    def test_update_attendance(self, db_session, query_counter):
+        """Test update_attendance without a status change issues one statement"""
+        user, _, _, lecture = make_lecture(db_session, "rt_update_attendance")
+        attendance = AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=user.id, status="present"), user
+        )
+        query_counter.clear()
+
+        updated = AttendanceCRUD.update_attendance(
+            db_session, attendance.id, AttendanceUpdate(description="noted"), user
+        )
+
+        assert updated.description == "noted"
+        assert len(query_counter) == 1
+        assert "pg_notify" in query_counter[0]
+
+    def test_update_missing_row_returns_none(self, db_session):
+        """Test updating a missing row still returns None"""
+        from uuid import uuid4
+
+        assert UserCRUD.update_user(db_session, uuid4(), UserUpdate(information="x")) is None
+
+
+class TestCreateRoundTrips:
+    """create_* methods get server defaults back from INSERT ... RETURNING instead of refreshing"""
+
+    def test_create_user(self, db_session, query_counter):
+        """Test create_user issues one statement and returns the server timestamps"""
+        user = UserCRUD.create_user(db_session, UserCreate(username="rt_create_user", auth_type="local"))
+
+        assert user.created_at is not None
+        assert user.updated_at is not None
+        assert len(query_counter) == 1
+
+    def test_create_attendance(self, db_session, query_counter):
+        """Test create_attendance issues the advisory lock, the insert (with its NOTIFY) and the rollup upsert only"""
+        user, _, _, lecture = make_lecture(db_session, "rt_create_attendance")
+        query_counter.clear()
+
+        attendance = AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=user.id, status="present"), user
+        )
+
+        assert attendance.created_at is not None
+        assert len(query_counter) == 3
+        assert "pg_advisory_xact_lock" in query_counter[0]
+        assert "pg_notify" in query_counter[1]
+
+    def test_create_enroll(self, db_session, query_counter):
+        """Test create_enroll checks for duplicates and inserts in one statement"""
+        user, _, session, _ = make_lecture(db_session, "rt_create_enroll")
+        query_counter.clear()
+
+        enroll = EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+
+        assert enroll.created_at is not None
+        assert enroll.is_active is True
+        assert len(query_counter) == 1
+
+    def test_create_enroll_duplicate(self, db_session):
+        """Test a duplicate enrollment is still rejected"""
+        user, _, session, _ = make_lecture(db_session, "rt_create_enroll_dup")
+        EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+
+        with pytest.raises(ValueError):
+            EnrollCRUD.create_enroll(db_session, EnrollCreate(user_id=user.id, session_id=session.id), user)
+
+
+class TestCheckInRoundTrips:
+    """A batch of self check-ins is one advisory-lock SELECT, one INSERT and one rollup upsert"""
+
+    def test_check_in_many(self, db_session, query_counter):
+        """Test a batch with a duplicate and an existing attendance"""
+        user, _, _, lecture = make_lecture(db_session, "rt_check_in")
+        students = [
+            UserCRUD.create_user(db_session, UserCreate(username=f"rt_check_in_{i}", auth_type="local"))
+            for i in range(3)
+        ]
+        AttendanceCRUD.create_attendance(
+            db_session, lecture.id, AttendanceCreate(user_id=students[0].id, status="present"), user
+        )
+        query_counter.clear()
+
+        check_ins = [
+            {"lecture_id": lecture.id, "user_id": student.id, "status": "present", "created_by": student.id}
+            for student in [*students, students[1]]
+        ]
+        results = AttendanceCRUD.check_in_many(db_session, check_ins)
+
+        assert results[0] is None
+        assert results[1].user_id == students[1].id
+        assert results[2].user_id == students[2].id
+        assert results[3] is None
+        assert len(query_counter) == 3
+        assert "pg_advisory_xact_lock" in query_counter[0]
+        assert "pg_notify" in query_counter[1]
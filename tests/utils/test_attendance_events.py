@@ -0,0 +1,121 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.crud.attendance import AttendanceCRUD
+from app.crud.course import CourseCRUD
+from app.crud.lecture import LectureCRUD
+from app.crud.session import SessionCRUD
+from app.crud.user import UserCRUD
+from app.models.user import Attendance, AttendanceRollup, Course, Lecture, Session, User
+from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+from app.schemas.course import CourseCreate
+from app.schemas.lecture import LectureCreate
+from app.schemas.session import SessionCreate
+from app.schemas.user import UserCreate
+from app.utils import attendance_events
+from app.utils.attendance_events import AttendanceBroadcaster
+
+
+@pytest.fixture
+def committed_db(db_engine, monkeypatch):
+    """A committing session with two lectures, since NOTIFY is only delivered on commit.
+
+    The broadcaster's LISTEN connection and row lookups are pointed at the test database;
+    the rows created here are deleted afterwards.
+    """
+    Local = sessionmaker(bind=db_engine, expire_on_commit=False)
+    monkeypatch.setattr(attendance_events, "engine", db_engine)
+    monkeypatch.setattr(attendance_events, "SessionLocal", Local)
+
+    db = Local()
+    suffix = uuid4().hex[:8]
+    user = UserCRUD.create_user(db, UserCreate(username=f"events_admin_{suffix}", auth_type="local"))
+    students = [
+        UserCRUD.create_user(db, UserCreate(username=f"events_student_{i}_{suffix}", auth_type="local"))
+        for i in range(2)
+    ]
+    course = CourseCRUD.create_course(db, CourseCreate(title="Events Course"), user)
+    session = SessionCRUD.create_session(db, SessionCreate(course_id=course.id, title="Events Session"), user)
+    lectures = [
+        LectureCRUD.create_lecture(db, LectureCreate(session_id=session.id, title=f"Events {n}", sequence=n), user)
+        for n in (1, 2)
+    ]
+    try:
+        yield db, user, students, lectures
+    finally:
+        db.rollback()
+        lecture_ids = [lecture.id for lecture in lectures]
+        db.query(Attendance).filter(Attendance.lecture_id.in_(lecture_ids)).delete(synchronize_session=False)
+        db.query(AttendanceRollup).filter(AttendanceRollup.lecture_id.in_(lecture_ids)).delete(synchronize_session=False)
+        db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).delete(synchronize_session=False)
+        db.query(Session).filter(Session.id == session.id).delete(synchronize_session=False)
+        db.query(Course).filter(Course.id == course.id).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_([user.id, *(s.id for s in students)])).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+class TestAttendanceBroadcaster:
+    """Test LISTEN/NOTIFY fan-out of attendance changes to per-lecture subscribers"""
+
+    def test_change_reaches_only_its_lecture(self, committed_db):
+        """Test created and updated attendances reach the lecture's subscriber and not another lecture's"""
+        db, user, students, (lecture, other_lecture) = committed_db
+
+        async def scenario():
+            broadcaster = AttendanceBroadcaster(coalesce_ms=10)
+            try:
+                async with broadcaster.subscribe(lecture.id) as queue, broadcaster.subscribe(other_lecture.id) as other:
+                    attendance = AttendanceCRUD.create_attendance(
+                        db, lecture.id, AttendanceCreate(user_id=students[0].id, status="absent"), user
+                    )
+                    created = json.loads(await asyncio.wait_for(queue.get(), 5))
+
+                    AttendanceCRUD.update_attendance(db, attendance.id, AttendanceUpdate(status="present"), user)
+                    updated = json.loads(await asyncio.wait_for(queue.get(), 5))
+
+                    await asyncio.sleep(0.05)
+                    return attendance, created, updated, other.empty()
+            finally:
+                await broadcaster.stop()
+
+        attendance, created, updated, other_empty = asyncio.run(scenario())
+
+        assert created["id"] == str(attendance.id)
+        assert created["status"] == "absent"
+        assert updated["id"] == str(attendance.id)
+        assert updated["status"] == "present"
+        assert other_empty
+
+    def test_full_queue_closes_the_stream(self, committed_db):
+        """Test a subscriber whose queue overflows is dropped and its stream ends"""
+        db, user, students, (lecture, _) = committed_db
+
+        async def scenario():
+            broadcaster = AttendanceBroadcaster(coalesce_ms=50, queue_size=1)
+            stream = broadcaster.stream(lecture.id, heartbeat_seconds=5)
+            try:
+                first = await stream.__anext__()
+                # one commit sends both notifications into the same flush, overflowing the queue of one
+                AttendanceCRUD.check_in_many(db, [
+                    {"lecture_id": lecture.id, "user_id": student.id, "status": "present", "created_by": student.id}
+                    for student in students
+                ])
+                rest = await asyncio.wait_for(_drain(stream), 5)
+                return first, rest, lecture.id in broadcaster._subscribers
+            finally:
+                await broadcaster.stop()
+
+        first, rest, still_subscribed = asyncio.run(scenario())
+
+        assert first == "retry: 3000\n\n"
+        assert rest == []
+        assert not still_subscribed
+
+
+async def _drain(stream):
+    return [chunk async for chunk in stream]
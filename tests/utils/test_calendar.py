@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.utils import calendar
+from app.utils.calendar import CalendarCache, etag_matches, to_ics
+
+
+def event(**values):
+    return {
+        "id": uuid4(), "title": "Lecture", "sequence": 1, "course_title": "Course", "session_title": "Session",
+        "lecture_date": datetime(2026, 3, 2, 9, 30, tzinfo=timezone.utc), **values,
+    }
+
+
+class TestCalendarCache:
+    """Test the per-user calendar cache"""
+
+    def test_put_get_and_invalidate_user(self):
+        """Test entries are returned with their ETag until that user is invalidated"""
+        cache = CalendarCache()
+        start, end = datetime(2026, 3, 1), datetime(2026, 4, 1)
+        alice, bob = uuid4(), uuid4()
+        etag = cache.put((alice, start, end), [event()])
+        cache.put((bob, start, end), [])
+
+        assert cache.get((alice, start, end))[0] == etag
+        cache.invalidate(alice)
+        assert cache.get((alice, start, end)) is None
+        assert cache.get((bob, start, end)) is not None
+
+        cache.invalidate()
+        assert cache.get((bob, start, end)) is None
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries older than ttl_seconds are misses"""
+        now = [1000.0]
+        monkeypatch.setattr(calendar.time, "monotonic", lambda: now[0])
+        cache = CalendarCache(ttl_seconds=60)
+        key = (uuid4(), datetime(2026, 3, 1), datetime(2026, 4, 1))
+        cache.put(key, [])
+
+        now[0] += 60
+        assert cache.get(key) is None
+
+    def test_etag_changes_with_content(self):
+        """Test different events give different ETags and If-None-Match parsing"""
+        first = calendar.calendar_etag([event(title="A")])
+        second = calendar.calendar_etag([event(title="B")])
+
+        assert first != second
+        assert etag_matches(f'"other", W/{first}', first)
+        assert not etag_matches(None, first)
+
+
+class TestToIcs:
+    """Test iCalendar rendering"""
+
+    def test_event_lines(self):
+        """Test each lecture becomes a VEVENT with UTC start and escaped text"""
+        lecture = event(title="Intro, part 1; basics")
+
+        body = to_ics([lecture])
+
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert f"UID:{lecture['id']}@stg-academy" in body
+        assert "DTSTART:20260302T093000Z" in body
+        assert "SUMMARY:Intro\\, part 1\\; basics" in body
+
+    def test_long_lines_are_folded(self):
+        """Test lines over 75 octets are folded with CRLF + space"""
+        body = to_ics([event(title="강의" * 40)])
+
+        assert all(len(line.encode()) <= 75 for line in body.split("\r\n"))
+
+
+class TestScheduleDates:
+    """Test recurrence date expansion"""
+
+    def test_weekdays_from_start(self):
+        """Test dates follow the weekdays from the start date at the given UTC time"""
+        from datetime import date, time
+
+        days = calendar.schedule_dates(date(2026, 3, 4), [0, 2], 3, time(9, 30))
+
+        assert days == [
+            datetime(2026, 3, 4, 9, 30, tzinfo=timezone.utc),
+            datetime(2026, 3, 9, 9, 30, tzinfo=timezone.utc),
+            datetime(2026, 3, 11, 9, 30, tzinfo=timezone.utc),
+        ]
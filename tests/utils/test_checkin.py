@@ -0,0 +1,106 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.config import settings
+from app.utils.checkin import CheckInBatcher, create_checkin_code, verify_checkin_code
+
+
+class TestCheckInCode:
+    """Test signed lecture check-in codes"""
+
+    def test_code_is_valid_for_its_lecture(self):
+        """Test a fresh code verifies for the lecture it was issued for"""
+        lecture_id = uuid4()
+        code, _ = create_checkin_code(lecture_id, at=1_000_000)
+
+        assert len(code) == 6 and code.isdigit()
+        assert verify_checkin_code(lecture_id, code, at=1_000_000)
+        assert not verify_checkin_code(uuid4(), code, at=1_000_000)
+
+    def test_code_survives_one_window(self):
+        """Test a code is still accepted in the following window but not after"""
+        lecture_id = uuid4()
+        ttl = settings.checkin_code_ttl_seconds
+        issued_at = 1_000_000 - 1_000_000 % ttl
+        code, expires_at = create_checkin_code(lecture_id, at=issued_at)
+
+        assert verify_checkin_code(lecture_id, code, at=issued_at + ttl)
+        assert not verify_checkin_code(lecture_id, code, at=issued_at + 2 * ttl)
+        assert expires_at.timestamp() == issued_at + 2 * ttl
+
+
+class TestCheckInBatcher:
+    """Test micro-batching of check-ins"""
+
+    def run_batches(self, flush, items, **kwargs):
+        async def scenario():
+            batcher = CheckInBatcher(flush, **kwargs)
+            batcher.start()
+            try:
+                return await asyncio.gather(*(batcher.submit(item) for item in items), return_exceptions=True)
+            finally:
+                await batcher.stop()
+
+        return asyncio.run(scenario())
+
+    def test_requests_share_one_flush(self):
+        """Test concurrent submissions are flushed together and get their own results"""
+        batches = []
+
+        def flush(items):
+            batches.append(list(items))
+            return [item * 10 for item in items]
+
+        results = self.run_batches(flush, [1, 2, 3], max_size=10, max_delay_ms=50)
+
+        assert results == [10, 20, 30]
+        assert batches == [[1, 2, 3]]
+
+    def test_batch_size_limit(self):
+        """Test a batch never exceeds max_size"""
+        batches = []
+
+        def flush(items):
+            batches.append(len(items))
+            return items
+
+        results = self.run_batches(flush, list(range(5)), max_size=2, max_delay_ms=50)
+
+        assert results == list(range(5))
+        assert max(batches) == 2
+        assert sum(batches) == 5
+
+    def test_flush_error_fails_the_batch(self):
+        """Test every request in a failed batch receives the error"""
+        def flush(items):
+            raise RuntimeError("database unavailable")
+
+        results = self.run_batches(flush, [1, 2], max_size=10, max_delay_ms=5)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_stop_waits_for_running_flush(self):
+        """Test stopping during a flush still delivers that batch's results"""
+        def flush(items):
+            time.sleep(0.1)
+            return [item * 10 for item in items]
+
+        async def scenario():
+            batcher = CheckInBatcher(flush, max_size=10, max_delay_ms=1)
+            batcher.start()
+            submitted = asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+            await asyncio.sleep(0.05)
+            await batcher.stop()
+            return await submitted
+
+        assert asyncio.run(scenario()) == [10, 20]
+
+    def test_submit_before_start(self):
+        """Test submitting to a stopped batcher raises"""
+        batcher = CheckInBatcher(lambda items: items)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(batcher.submit(1))
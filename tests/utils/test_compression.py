@@ -0,0 +1,68 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.utils.compression import CompressionMiddleware, parse_accept_encoding
+
+
+def make_app():
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware, minimum_size=100, gzip_level=6)
+
+    @test_app.get("/large")
+    async def large():
+        return PlainTextResponse("x" * 5000)
+
+    @test_app.get("/small")
+    async def small():
+        return PlainTextResponse("x" * 10)
+
+    @test_app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(10):
+                yield b"y" * 1000
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return test_app
+
+
+class TestCompressionMiddleware:
+    """Test negotiated response compression"""
+
+    def test_parse_accept_encoding(self):
+        """Test Accept-Encoding q-value parsing"""
+        assert parse_accept_encoding("gzip, br;q=0.5, identity;q=0") == {"gzip": 1.0, "br": 0.5, "identity": 0.0}
+
+    def test_large_response_is_gzipped(self):
+        """Test responses above the threshold are compressed"""
+        client = TestClient(make_app())
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "x" * 5000
+
+    def test_small_response_is_not_compressed(self):
+        """Test responses below the threshold are sent as-is"""
+        client = TestClient(make_app())
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_gzip_rejected_by_client(self):
+        """Test q=0 disables an encoding"""
+        client = TestClient(make_app())
+        response = client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_gzipped(self):
+        """Test streaming responses are compressed chunk by chunk"""
+        client = TestClient(make_app())
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw) == b"y" * 10000
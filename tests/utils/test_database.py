@@ -16,4 +16,78 @@ class TestDatabase:
     def test_get_db_generator(self):
         """Test that get_db is a generator function"""
         db_gen = get_db()
-        assert db_gen is not None
\ No newline at end of file
+        assert db_gen is not None
+
+    def test_pool_limits_default(self, monkeypatch):
+        """Test per-worker pool uses the configured size without a budget"""
+        from app.config import settings
+        from app.database import pool_limits
+
+        monkeypatch.setattr(settings, "db_connection_budget", 0)
+        assert pool_limits() == (settings.db_pool_size, settings.db_max_overflow)
+
+    def test_pool_limits_split_budget(self, monkeypatch):
+        """Test the connection budget is split across workers"""
+        from app.config import settings
+        from app.database import pool_limits
+
+        monkeypatch.setattr(settings, "db_connection_budget", 40)
+        monkeypatch.setattr(settings, "workers", 8)
+        monkeypatch.setattr(settings, "live_updates_enabled", False)
+        assert pool_limits() == (5, 0)
+
+    def test_pool_limits_reserve_listen_connection(self, monkeypatch):
+        """Test each worker's share leaves room for its LISTEN connection when live updates are on"""
+        from app.config import settings
+        from app.database import pool_limits
+
+        monkeypatch.setattr(settings, "db_connection_budget", 40)
+        monkeypatch.setattr(settings, "workers", 8)
+        monkeypatch.setattr(settings, "live_updates_enabled", True)
+        assert pool_limits() == (4, 0)
+
+    def test_readiness_saturated_pool_skips_checkout(self, monkeypatch):
+        """Test a saturated pool is reported without checking out a connection"""
+        from app.config import settings
+        from app.utils import warmup
+
+        def ping():
+            raise AssertionError("pool must not be touched")
+
+        monkeypatch.setattr(warmup, "_ping", ping)
+        monkeypatch.setattr(settings, "readiness_max_pool_usage", -1.0)
+
+        assert warmup.check_readiness()["reason"] == "connection pool saturated"
+
+    def test_readiness_slow_checkout_is_bounded(self, monkeypatch):
+        """Test a blocked checkout fails readiness within the latency budget"""
+        import time
+        from app.config import settings
+        from app.utils import warmup
+
+        monkeypatch.setattr(warmup, "_ping", lambda: time.sleep(0.5))
+        monkeypatch.setattr(settings, "readiness_timeout_ms", 50)
+
+        result = warmup.check_readiness()
+
+        assert result["reason"] == "database latency over budget"
+        assert result["db_latency_ms"] < 400
+
+    def test_retry_warm_up_does_not_wait(self, monkeypatch):
+        """Test a retried warm-up runs in the background and is reported once it succeeded"""
+        import threading
+        from app.utils import warmup
+
+        release = threading.Event()
+
+        def slow_warm_up(connections):
+            return release.wait(5)
+
+        monkeypatch.setattr(warmup, "warm_up", slow_warm_up)
+        monkeypatch.setattr(warmup, "_rewarming", None)
+
+        assert warmup.retry_warm_up(1) is False
+        assert warmup.retry_warm_up(1) is False
+        release.set()
+        warmup._rewarming.result(timeout=5)
+        assert warmup.retry_warm_up(1) is True
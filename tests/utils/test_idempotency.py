@@ -0,0 +1,109 @@
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.utils import idempotency
+from app.utils.idempotency import IdempotencyMiddleware, MemoryIdempotencyStore
+from app.utils.security import create_access_token
+
+
+def make_client():
+    calls = []
+
+    async def create(request):
+        calls.append(await request.json())
+        return JSONResponse({"n": len(calls)}, status_code=201)
+
+    app = Starlette(routes=[Route("/items/{item_id}", create, methods=["POST"])])
+    app.state.idempotency_store = MemoryIdempotencyStore()
+    app.add_middleware(IdempotencyMiddleware, paths=["/items/{item_id}"])
+    return TestClient(app), calls
+
+
+def auth(key, sub="user-1"):
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': sub})}", "Idempotency-Key": key}
+
+
+class TestMemoryIdempotencyStore:
+    """Test the in-process response store"""
+
+    def test_reserve_complete_replay(self):
+        """Test the first caller reserves the key and later callers get the stored response"""
+        store = MemoryIdempotencyStore()
+
+        assert store.reserve("k", "fp", 60) is None
+        assert store.reserve("k", "fp", 60).status_code is None
+        store.complete("k", 201, "application/json", b"{}", 60)
+
+        stored = store.reserve("k", "fp", 60)
+        assert (stored.status_code, stored.body) == (201, b"{}")
+
+    def test_expired_key_is_reserved_again(self, monkeypatch):
+        """Test a key past its TTL is treated as new"""
+        now = [1000.0]
+        monkeypatch.setattr(idempotency.time, "monotonic", lambda: now[0])
+        store = MemoryIdempotencyStore()
+        store.reserve("k", "fp", 30)
+        store.complete("k", 201, None, b"", 60)
+
+        now[0] += 31
+        assert store.reserve("k", "fp", 30).status_code == 201
+        now[0] += 30
+        assert store.reserve("k", "fp", 30) is None
+
+    def test_abandoned_reservation_is_taken_over(self, monkeypatch):
+        """Test a key whose request never completed is free again once its lease passes"""
+        now = [1000.0]
+        monkeypatch.setattr(idempotency.time, "monotonic", lambda: now[0])
+        store = MemoryIdempotencyStore()
+        store.reserve("k", "fp", 30)
+
+        assert store.reserve("k", "fp", 30).status_code is None
+        now[0] += 31
+        assert store.reserve("k", "fp", 30) is None
+
+
+class TestIdempotencyMiddleware:
+    """Test replaying stored responses"""
+
+    def test_retry_replays_without_calling_route(self):
+        """Test a retried POST gets the original response and the route runs once"""
+        client, calls = make_client()
+
+        first = client.post("/items/1", json={"a": 1}, headers=auth("retry-1"))
+        second = client.post("/items/1", json={"a": 1}, headers=auth("retry-1"))
+
+        assert first.status_code == second.status_code == 201
+        assert first.json() == second.json() == {"n": 1}
+        assert second.headers["idempotent-replayed"] == "true"
+        assert len(calls) == 1
+
+    def test_different_body_is_rejected(self):
+        """Test reusing a key with another body returns 422"""
+        client, calls = make_client()
+        client.post("/items/1", json={"a": 1}, headers=auth("reuse-1"))
+
+        response = client.post("/items/1", json={"a": 2}, headers=auth("reuse-1"))
+
+        assert response.status_code == 422
+        assert len(calls) == 1
+
+    def test_keys_are_scoped_per_user(self):
+        """Test the same key from another user is a new request"""
+        client, calls = make_client()
+        client.post("/items/1", json={"a": 1}, headers=auth("shared", sub="user-1"))
+
+        response = client.post("/items/1", json={"a": 1}, headers=auth("shared", sub="user-2"))
+
+        assert response.json() == {"n": 2}
+        assert len(calls) == 2
+
+    def test_without_header_passes_through(self):
+        """Test requests without Idempotency-Key are not stored"""
+        client, calls = make_client()
+
+        client.post("/items/1", json={"a": 1})
+        client.post("/items/1", json={"a": 1})
+
+        assert len(calls) == 2
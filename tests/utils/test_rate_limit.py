@@ -0,0 +1,79 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from sqlalchemy import update
+
+from app.models.user import RateLimitBucket
+from app.utils import rate_limit
+from app.utils.rate_limit import MemoryRateLimitStore, PostgresRateLimitStore
+
+
+class TestMemoryRateLimitStore:
+    """Test the in-process token bucket"""
+
+    def test_burst_then_reject(self, monkeypatch):
+        """Test a full bucket allows per_minute calls then reports the wait"""
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: 1000.0)
+        store = MemoryRateLimitStore()
+
+        assert all(store.take("login:ip:1", 6) == 0 for _ in range(6))
+        assert store.take("login:ip:1", 6) == 10.0
+
+    def test_refill(self, monkeypatch):
+        """Test tokens come back at per_minute / 60 per second"""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+        store = MemoryRateLimitStore()
+        for _ in range(6):
+            store.take("login:ip:1", 6)
+
+        now[0] += 10
+        assert store.take("login:ip:1", 6) == 0
+        assert store.take("login:ip:1", 6) > 0
+
+    def test_keys_are_independent(self, monkeypatch):
+        """Test one client's empty bucket does not affect another key"""
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: 1000.0)
+        store = MemoryRateLimitStore()
+        store.take("login:ip:1", 1)
+
+        assert store.take("login:ip:1", 1) > 0
+        assert store.take("login:ip:2", 1) == 0
+
+
+class TestPostgresRateLimitStore:
+    """Test the token bucket shared through rate_limit_buckets"""
+
+    def test_burst_then_reject(self, db_engine, monkeypatch):
+        """Test a full bucket allows per_minute calls, then rejects without spending tokens"""
+        monkeypatch.setattr(rate_limit, "engine", db_engine)
+        store = PostgresRateLimitStore()
+        key = f"login:ip:{uuid4()}"
+
+        assert [store.take(key, 3) for _ in range(3)] == [0.0, 0.0, 0.0]
+        waits = [store.take(key, 3) for _ in range(3)]
+
+        assert all(0 < wait <= 20 for wait in waits)
+        with db_engine.connect() as connection:
+            tokens = connection.execute(
+                RateLimitBucket.__table__.select().where(RateLimitBucket.key == key)
+            ).one().tokens
+        assert 0 <= tokens < 1
+
+    def test_refill(self, db_engine, monkeypatch):
+        """Test an emptied bucket allows a call again once enough time has passed"""
+        monkeypatch.setattr(rate_limit, "engine", db_engine)
+        store = PostgresRateLimitStore()
+        key = f"login:ip:{uuid4()}"
+        store.take(key, 1)
+        assert store.take(key, 1) > 0
+
+        with db_engine.begin() as connection:
+            connection.execute(
+                update(RateLimitBucket)
+                .where(RateLimitBucket.key == key)
+                .values(updated_at=RateLimitBucket.updated_at - timedelta(seconds=60))
+            )
+
+        assert store.take(key, 1) == 0
+        assert store.take(key, 1) > 0
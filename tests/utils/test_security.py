@@ -2,6 +2,7 @@ from app.utils.security import (
     get_password_hash,
     verify_password,
     create_access_token,
+    create_refresh_token,
     verify_token
 )
 
@@ -48,4 +49,19 @@ class TestSecurityUtils:
         invalid_token = "invalid_token_string"
         verified = verify_token(invalid_token)
 
-        assert verified is None
\ No newline at end of file
+        assert verified is None
+
+    def test_tokens_have_unique_jti(self):
+        """Test every token gets its own jti for revocation"""
+        first = verify_token(create_access_token({"sub": "user_id_789"}))
+        second = verify_token(create_access_token({"sub": "user_id_789"}))
+
+        assert first["jti"] != second["jti"]
+
+    def test_create_refresh_token(self):
+        """Test refresh tokens are typed and carry no role claim"""
+        verified = verify_token(create_refresh_token("user_id_789"))
+
+        assert verified["type"] == "refresh"
+        assert verified["sub"] == "user_id_789"
+        assert "role" not in verified